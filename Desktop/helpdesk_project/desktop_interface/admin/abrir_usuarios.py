@@ -1,6 +1,5 @@
 import customtkinter as ctk
 from tkinter import messagebox
-import threading
 import sys
 import os
 
@@ -13,8 +12,10 @@ if parent_dir not in sys.path:
 # --- IMPORT API CLIENT ---
 try:
     from desktop_interface import api_client
+    from desktop_interface import pool_tarefas
 except ImportError:
     import api_client
+    import pool_tarefas
 
 # Mapa de perfis
 MAP_PERFIL_ID_TO_STRING = {1: "admin", 2: "tecnico", 3: "colaborador"}
@@ -372,4 +373,4 @@ def abrir_usuarios(conteudo_frame, user):
                 command=lambda: preparar_inativacao(u),
             ).pack(side="left", padx=0)
 
-    threading.Thread(target=carregar_usuarios_thread, daemon=True).start()
\ No newline at end of file
+    pool_tarefas.enviar(carregar_usuarios_thread, dono=grid)
\ No newline at end of file
@@ -1,5 +1,4 @@
 import customtkinter as ctk
-import threading
 import sys
 import os
 from datetime import datetime, timedelta
@@ -15,8 +14,14 @@ if root_dir not in sys.path: sys.path.append(root_dir)
 
 try:
     from desktop_interface import api_client
+    from desktop_interface import painel_dados
+    from desktop_interface import carregamento_tardio
+    from desktop_interface import lista_virtual
 except ImportError:
     import api_client
+    import painel_dados
+    import carregamento_tardio
+    import lista_virtual
 
 from desktop_interface.criar_chamado import abrir_formulario_chamado
 from desktop_interface.ticket_detalhe import abrir_ticket_detalhe
@@ -129,91 +134,53 @@ def abrir_dashboard_admin(janela_principal, user):
         ).pack(pady=20)
 
         # ============================= CARREGAMENTO ASSÍNCRONO =============================
-        def carregar_stats_admin():
-            if not api_client.AUTH_TOKEN: return
-
-            sucesso, dados = api_client.listar_todos_chamados()
-
-            if sucesso and isinstance(dados, list):
-                
-                # CÁLCULO DE ESTATÍSTICAS TOTAIS
-                abertos_total = sum(1 for c in dados if c.get("status","").lower() == "aberto")
-                andamento_total = sum(1 for c in dados if c.get("status","").lower() == "em andamento")
-                resolvidos_total = sum(1 for c in dados if c.get("status","").lower() in ["resolvido","fechado"])
-                
-                # Recentes
-                agora = datetime.now()
-                limite = agora - timedelta(days=5)
-                recentes = []
-
-                for c in dados:
-                    try:
-                        # O api_client já normalizou para 'data_abertura'
-                        dt_str = str(c.get("data_abertura", "") or "")[:10]
-                        if dt_str and len(dt_str) == 10:
-                            dt = datetime.strptime(dt_str, "%Y-%m-%d")
-                            if dt >= limite:
-                                recentes.append(c)
-                    except: pass
-
-                recentes.sort(key=lambda x: int(x.get("id_chamado") or 0), reverse=True)
-                recentes = recentes[:10]
-
-                if frame.winfo_exists():
-                    frame.after(0, lambda: atualizar_ui(abertos_total, andamento_total, resolvidos_total, recentes))
-            else: 
-                if frame.winfo_exists():
-                    frame.after(0, lambda: atualizar_ui(0, 0, 0, [])) 
-
-        def criar_cartao_chamado_fallback(parent, chamado, usuario, root_frame):
-            status_raw = str(chamado.get("status", "Aberto")).lower()
+        def calcular_stats_admin(stats):
+            # CÁLCULO DE ESTATÍSTICAS TOTAIS (mantidas pela réplica, sem recontar)
+            abertos_total, andamento_total, resolvidos_total = stats.contagens()
             
-            cor_faixa = "#4A5568"
-            if status_raw == "aberto": cor_faixa = "#0284C7"
-            elif status_raw in ["resolvido", "fechado"]: cor_faixa = "#16A34A"
-            elif status_raw == "em andamento": cor_faixa = "#EAB308"
-            
-            # Card mais compacto
-            card = ctk.CTkFrame(parent, fg_color="white", corner_radius=8, border_width=1, border_color=cor_faixa)
-            card.pack(fill="x", pady=4, padx=5)
-            
-            id_ch = chamado.get("id_chamado") or "?"
-            titulo = chamado.get("titulo", "Sem título")
-            
-            content_frame = ctk.CTkFrame(card, fg_color="transparent")
-            content_frame.pack(side="left", fill="both", expand=True, padx=10, pady=5)
+            # Recentes
+            agora = datetime.now()
+            limite = agora - timedelta(days=5)
 
-            ctk.CTkLabel(content_frame, text=f"#{id_ch}", font=("Helvetica", 13, "bold"), text_color="#64748B", width=35).pack(side="left", padx=(0, 10))
-            ctk.CTkLabel(content_frame, text=titulo, font=("Helvetica", 14, "bold"), text_color="#1E293B", anchor="w").pack(side="left", fill="x", expand=True)
+            # A data já vem convertida em modelo_chamado.Chamado (comparação pelo dia, como antes)
+            recentes = stats.recentes(10, lambda c: c.data_abertura is not None and c.data_abertura.replace(hour=0, minute=0, second=0, microsecond=0) >= limite)
+            return abertos_total, andamento_total, resolvidos_total, recentes
 
-            right_frame = ctk.CTkFrame(card, fg_color="transparent")
-            right_frame.pack(side="right", padx=10)
-            
-            ctk.CTkLabel(right_frame, text=status_raw.capitalize(), font=("Helvetica", 11, "bold"), text_color=cor_faixa).pack(side="left", padx=10)
-            
-            ctk.CTkButton(
-                right_frame, text="Detalhes", width=70, height=28, fg_color="#5BA39C", hover_color="#4C8E87", 
-                font=("Helvetica", 11, "bold"),
-                command=lambda: abrir_ticket_detalhe(id_ch, usuario, root_frame, lambda: mostrar_dashboard(root_frame, usuario))
-            ).pack(side="right")
+        # Pool fixo de cards compactos: cada atualização só preenche os mesmos widgets
+        lista_recentes = lista_virtual.ListaVirtual(
+            lista_frame,
+            lambda parent: lista_virtual.CartaoCompacto(
+                parent, lambda c: abrir_ticket_detalhe(c.id, usuario, frame, lambda: mostrar_dashboard(frame, usuario))
+            ),
+            10, vazio="Nenhum chamado recente.", rolagem=False,
+        )
+
+        estado_lista = {"assinatura": None}
 
         def atualizar_ui(q_abertos, q_andam, q_resolv, lista):
             if not lbl_abertos.winfo_exists(): return
 
-            lbl_abertos.configure(text=str(q_abertos))
-            lbl_andam.configure(text=str(q_andam))
-            lbl_resolv.configure(text=str(q_resolv))
+            # Só mexe no que mudou desde a última pintura
+            painel_dados.definir_texto(lbl_abertos, str(q_abertos))
+            painel_dados.definir_texto(lbl_andam, str(q_andam))
+            painel_dados.definir_texto(lbl_resolv, str(q_resolv))
 
-            for w in lista_frame.winfo_children(): w.destroy()
+            assinatura = painel_dados.assinatura_recentes(lista)
+            if assinatura == estado_lista["assinatura"]: return
+            estado_lista["assinatura"] = assinatura
 
-            if not lista:
-                ctk.CTkLabel(lista_frame, text="Nenhum chamado recente.", text_color="gray").pack(pady=20)
-                return
+            if placeholder.winfo_exists(): placeholder.destroy()
+            lista_recentes.definir(lista)
 
-            for item in lista:
-                criar_cartao_chamado_fallback(lista_frame, item, usuario, frame)
+        # Pinta na hora com o último resumo conhecido e revalida em segundo plano
+        if api_client.AUTH_TOKEN:
+            painel_dados.carregar(
+                "admin", "todos", calcular_stats_admin, lista_frame,
+                ao_atualizar=atualizar_ui, ao_falhar=lambda _msg: atualizar_ui(0, 0, 0, []),
+            )
 
-        threading.Thread(target=carregar_stats_admin, daemon=True).start()
+        # Gráfico/PDF dos relatórios: carregados em segundo plano depois que o painel aparece
+        carregamento_tardio.pre_aquecer_depois(lista_frame, carregamento_tardio.MODULOS_RELATORIO)
 
     def criar_card_dashboard_colab(parent, titulo, cor, coluna):
         card = ctk.CTkFrame(parent, fg_color="white", corner_radius=12, border_width=1, border_color="#E2E8F0")
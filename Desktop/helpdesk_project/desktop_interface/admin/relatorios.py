@@ -1,29 +1,8 @@
 import customtkinter as ctk
 from tkinter import messagebox, filedialog
-import threading
 import sys
 import os
-from datetime import datetime
-
-# --- IMPORTAÇÃO MATPLOTLIB (GRÁFICOS) ---
-try:
-    import matplotlib.pyplot as plt
-    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-    HAS_MATPLOTLIB = True
-except ImportError:
-    HAS_MATPLOTLIB = False
-
-# --- TENTA IMPORTAR A BIBLIOTECA DE PDF ---
-try:
-    from reportlab.lib import colors
-    from reportlab.lib.pagesizes import A4
-    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-    from reportlab.lib.units import cm
-    from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Image as ImageRL
-    from reportlab.lib.enums import TA_CENTER
-    HAS_REPORTLAB = True
-except ImportError:
-    HAS_REPORTLAB = False
+from datetime import datetime, timedelta
 
 # --- CONFIGURAÇÃO DE PATH ---
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -32,8 +11,30 @@ if parent_dir not in sys.path: sys.path.append(parent_dir)
 
 try:
     from desktop_interface import api_client
+    from desktop_interface import pool_tarefas
+    from desktop_interface import analise_chamados
+    from desktop_interface import relatorio_periodo
+    from desktop_interface import carregamento_tardio
+    from desktop_interface import grafico_categorias
 except ImportError:
     import api_client
+    import pool_tarefas
+    import analise_chamados
+    import relatorio_periodo
+    import carregamento_tardio
+    import grafico_categorias
+
+# --- MATPLOTLIB (GRÁFICOS) E REPORTLAB (PDF): importados só no primeiro uso ---
+# (o gráfico em si fica em grafico_categorias)
+HAS_MATPLOTLIB = carregamento_tardio.disponivel("matplotlib")
+
+HAS_REPORTLAB = carregamento_tardio.disponivel("reportlab")
+rl_colors = carregamento_tardio.tardio("reportlab.lib.colors")
+rl_pagesizes = carregamento_tardio.tardio("reportlab.lib.pagesizes")
+rl_styles = carregamento_tardio.tardio("reportlab.lib.styles")
+rl_units = carregamento_tardio.tardio("reportlab.lib.units")
+rl_platypus = carregamento_tardio.tardio("reportlab.platypus")
+rl_enums = carregamento_tardio.tardio("reportlab.lib.enums")
 
 # --- CORES ---
 COR_PRIMARIA = "#009E7F"
@@ -87,9 +88,29 @@ def abrir_relatorios(frame, user):
     )
     btn_exportar.pack(side="right")
 
+    # --- FILTRO DE PERÍODO ---
+    filtro_frame = ctk.CTkFrame(main_container, fg_color="transparent")
+    filtro_frame.pack(fill="x", pady=(0, 15))
+
+    ctk.CTkLabel(filtro_frame, text="De", font=("Helvetica", 13), text_color="#64748B").pack(side="left", padx=(0, 5))
+    entry_inicio = ctk.CTkEntry(filtro_frame, width=110, placeholder_text="dd/mm/aaaa")
+    entry_inicio.pack(side="left")
+    ctk.CTkLabel(filtro_frame, text="Até", font=("Helvetica", 13), text_color="#64748B").pack(side="left", padx=(10, 5))
+    entry_fim = ctk.CTkEntry(filtro_frame, width=110, placeholder_text="dd/mm/aaaa")
+    entry_fim.pack(side="left")
+
+    btn_aplicar = ctk.CTkButton(filtro_frame, text="Aplicar", width=80, height=30, fg_color=COR_PRIMARIA, font=("Helvetica", 12, "bold"))
+    btn_aplicar.pack(side="left", padx=10)
+
+    atalhos_frame = ctk.CTkFrame(filtro_frame, fg_color="transparent")
+    atalhos_frame.pack(side="left")
+
     lbl_periodo = ctk.CTkLabel(main_container, text="Carregando dados...", font=("Helvetica", 14), text_color="#64748B")
     lbl_periodo.pack(anchor="w", pady=(0, 20))
 
+    # Só aparece quando o relatório vem da análise local (o agregado do servidor não traz)
+    lbl_resolucao = ctk.CTkLabel(main_container, text="", font=("Helvetica", 14), text_color="#64748B")
+
     # --- KPI CARDS (Indicadores) ---
     kpi_frame = ctk.CTkFrame(main_container, fg_color="transparent")
     kpi_frame.pack(fill="x", pady=(0, 30))
@@ -132,7 +153,8 @@ def abrir_relatorios(frame, user):
             cat_id = item.get("categoriaId") or item.get("CategoriaId") or item.get("id")
             qtd = item.get("quantidade") or item.get("Quantidade") or 0
             
-            nome_cat = mapa_cats.get(cat_id, f"Outros").lower()
+            # Relatório local já traz o nome; o do servidor traz só o id
+            nome_cat = (item.get("nome") or mapa_cats.get(cat_id, f"Outros")).lower()
             if "impressora" in nome_cat: nome_cat = "hardware"
 
             nome_formatado = nome_cat.capitalize()
@@ -143,38 +165,17 @@ def abrir_relatorios(frame, user):
         return sorted(lista_final, key=lambda x: x['quantidade'], reverse=False)
 
     def renderizar_grafico(dados_cats):
-        for widget in chart_area.winfo_children(): widget.destroy()
+        # Mantém o canvas do gráfico (reaproveitado); o resto da área é refeito
+        canvas_widget = grafico_categorias.GRAFICO.widget()
+        for widget in chart_area.winfo_children():
+            if widget is not canvas_widget: widget.destroy()
 
         if not dados_cats:
+            grafico_categorias.GRAFICO.soltar()
             ctk.CTkLabel(chart_area, text="Sem dados para exibir.").pack(pady=50)
             return
 
-        nomes = [d['nome'] for d in dados_cats]
-        qtds = [d['quantidade'] for d in dados_cats]
-        
-        fig, ax = plt.subplots(figsize=(6, 4), dpi=100)
-        fig.patch.set_facecolor('white')
-        ax.set_facecolor('white')
-
-        bars = ax.barh(nomes, qtds, color='#009E7F', height=0.6)
-
-        ax.spines['top'].set_visible(False)
-        ax.spines['right'].set_visible(False)
-        ax.spines['left'].set_visible(False)
-        ax.spines['bottom'].set_visible(False)
-        ax.tick_params(axis='x', which='both', bottom=False, labelbottom=False)
-        ax.tick_params(axis='y', length=0, labelsize=11)
-
-        for bar in bars:
-            width = bar.get_width()
-            ax.text(width + 0.5, bar.get_y() + bar.get_height()/2, 
-                    f'{int(width)}', ha='left', va='center', fontweight='bold', color='#333')
-
-        plt.tight_layout()
-
-        canvas = FigureCanvasTkAgg(fig, master=chart_area)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill="both", expand=True)
+        grafico_categorias.GRAFICO.desenhar(chart_area, dados_cats)
 
     def renderizar_tabela_lateral(dados_cats):
         for widget in table_container.winfo_children():
@@ -196,6 +197,12 @@ def abrir_relatorios(frame, user):
             messagebox.showerror("Erro", "Instale: pip install reportlab")
             return
 
+        # Nomes do reportlab resolvidos aqui: é o primeiro uso, e o import acontece agora
+        colors, A4, cm, TA_CENTER = rl_colors, rl_pagesizes.A4, rl_units.cm, rl_enums.TA_CENTER
+        getSampleStyleSheet, ParagraphStyle = rl_styles.getSampleStyleSheet, rl_styles.ParagraphStyle
+        SimpleDocTemplate, Table, TableStyle = rl_platypus.SimpleDocTemplate, rl_platypus.Table, rl_platypus.TableStyle
+        Paragraph, Spacer = rl_platypus.Paragraph, rl_platypus.Spacer
+
         filename = filedialog.asksaveasfilename(defaultextension=".pdf", filetypes=[("PDF", "*.pdf")], title="Salvar Relatório", initialfile=f"Relatorio_{datetime.now().strftime('%Y%m%d')}.pdf")
         if not filename: return
 
@@ -246,6 +253,37 @@ def abrir_relatorios(frame, user):
             ]))
             elementos.append(t_cat)
 
+            # Métricas extras da análise local
+            resolucao = dados.get("resolucaoHoras")
+            if resolucao and resolucao.get("amostras"):
+                elementos.append(Spacer(1, 1*cm))
+                elementos.append(Paragraph("Tempo de Resolução (horas)", styles['Heading2']))
+                t_res = Table([["Mediana", "P90", "P95", "Amostras"],
+                               [str(resolucao.get("p50")), str(resolucao.get("p90")), str(resolucao.get("p95")), str(resolucao["amostras"])]],
+                              colWidths=[3.5*cm]*4)
+                t_res.setStyle(TableStyle([
+                    ('BACKGROUND', (0,0), (-1,0), colors.lightgrey),
+                    ('ALIGN', (0,0), (-1,-1), 'CENTER'),
+                    ('FONTNAME', (0,0), (-1,0), 'Helvetica-Bold'),
+                    ('BOX', (0,0), (-1,-1), 1, colors.black),
+                    ('INNERGRID', (0,0), (-1,-1), 0.5, colors.grey),
+                ]))
+                elementos.append(t_res)
+
+            semanal = dados.get("volumeSemanal")
+            if semanal:
+                elementos.append(Spacer(1, 1*cm))
+                elementos.append(Paragraph("Volume Semanal", styles['Heading2']))
+                dados_sem = [["Semana", "Chamados"]] + [[formatar_data(s["semana"]), str(s["quantidade"])] for s in semanal]
+                t_sem = Table(dados_sem, colWidths=[10*cm, 4*cm])
+                t_sem.setStyle(TableStyle([
+                    ('BACKGROUND', (0,0), (-1,0), colors.HexColor(COR_PRIMARIA)),
+                    ('TEXTCOLOR', (0,0), (-1,0), colors.white),
+                    ('FONTNAME', (0,0), (-1,0), 'Helvetica-Bold'),
+                    ('ROWBACKGROUNDS', (0,1), (-1,-1), [colors.whitesmoke, colors.white]),
+                ]))
+                elementos.append(t_sem)
+
             doc.build(elementos)
             messagebox.showinfo("Sucesso", "Relatório PDF gerado com sucesso!")
             
@@ -270,6 +308,13 @@ def abrir_relatorios(frame, user):
         lbl_ativos.configure(text=str(val_abertos))
         lbl_resolvidos.configure(text=str(val_resolvidos))
 
+        resolucao = dados.get("resolucaoHoras")
+        if resolucao and resolucao.get("amostras"):
+            lbl_resolucao.configure(text=f"⏱ Tempo de resolução: mediana {resolucao['p50']} h · p90 {resolucao['p90']} h · p95 {resolucao['p95']} h")
+            lbl_resolucao.pack(anchor="w", pady=(0, 20), after=lbl_periodo)
+        else:
+            lbl_resolucao.pack_forget()
+
         lista_cats_processada = processar_categorias(cats_raw)
         
         renderizar_grafico(lista_cats_processada)
@@ -277,10 +322,45 @@ def abrir_relatorios(frame, user):
 
         btn_exportar.configure(state="normal", command=lambda: exportar_pdf_bonito(dados, lista_cats_processada))
 
-    def carregar_dados_thread():
-        if not hasattr(api_client, 'obter_relatorio_gerencial'): return
-        sucesso, dados = api_client.obter_relatorio_gerencial()
+    def carregar_dados_thread(inicio, fim, sincronizar):
+        # Calculado da réplica local; sem ela, baldes diários do servidor (só os dias que faltam)
+        sucesso, dados = analise_chamados.relatorio_local(inicio, fim, sincronizar=sincronizar)
+        if not sucesso:
+            sucesso, dados = relatorio_periodo.obter(inicio, fim)
         if scroll_relatorio.winfo_exists():
             scroll_relatorio.after(0, lambda: atualizar_interface(sucesso, dados))
 
-    threading.Thread(target=carregar_dados_thread, daemon=True).start()
\ No newline at end of file
+    def aplicar_periodo(inicio, fim, sincronizar=False):
+        for entry, data in ((entry_inicio, inicio), (entry_fim, fim)):
+            entry.delete(0, "end")
+            entry.insert(0, data.strftime("%d/%m/%Y"))
+        lbl_periodo.configure(text="Carregando dados...")
+        # Um novo período substitui o pedido anterior que ainda esteja na fila
+        pool_tarefas.enviar(carregar_dados_thread, inicio, fim, sincronizar, dono=main_container, chave="relatorios.periodo")
+
+    def aplicar_digitado():
+        try:
+            inicio = datetime.strptime(entry_inicio.get().strip(), "%d/%m/%Y")
+            fim = datetime.strptime(entry_fim.get().strip(), "%d/%m/%Y")
+        except ValueError:
+            messagebox.showerror("Período inválido", "Use datas no formato dd/mm/aaaa.")
+            return
+        if fim < inicio:
+            messagebox.showerror("Período inválido", "A data final é anterior à inicial.")
+            return
+        aplicar_periodo(inicio, fim)
+
+    def ultimos_dias(dias):
+        hoje = datetime.now()
+        aplicar_periodo(hoje - timedelta(days=dias - 1), hoje)
+
+    btn_aplicar.configure(command=aplicar_digitado)
+    for dias in (7, 30, 90):
+        ctk.CTkButton(
+            atalhos_frame, text=f"{dias} dias", width=70, height=30, fg_color="#E2E8F0", hover_color="#CBD5E1",
+            text_color=COR_TEXTO, font=("Helvetica", 12), command=lambda d=dias: ultimos_dias(d)
+        ).pack(side="left", padx=3)
+
+    # Abertura da tela: último mês, com sincronização da réplica
+    hoje = datetime.now()
+    aplicar_periodo(hoje - timedelta(days=analise_chamados.PERIODO_PADRAO_DIAS - 1), hoje, sincronizar=True)
\ No newline at end of file
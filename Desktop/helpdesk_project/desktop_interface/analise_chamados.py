@@ -0,0 +1,270 @@
+import bisect
+import math
+import random
+import threading
+import time
+import sys
+import os
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional
+
+# --- CONFIGURAÇÃO DE PATH ---
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path: sys.path.append(parent_dir)
+
+try:
+    from desktop_interface import replica_chamados
+    from desktop_interface import carregamento_tardio
+    from desktop_interface.modelo_chamado import Chamado, StatusChamado, Prioridade
+except ImportError:
+    import replica_chamados
+    import carregamento_tardio
+    from modelo_chamado import Chamado, StatusChamado, Prioridade
+
+# --- NUMPY (OPCIONAL, importado no primeiro uso) ---
+HAS_NUMPY = carregamento_tardio.disponivel("numpy")
+np = carregamento_tardio.tardio("numpy")
+
+# ----------------------------------------------------------------------
+# ANÁLISE LOCAL DOS CHAMADOS (RELATÓRIOS)
+# ----------------------------------------------------------------------
+# A tela de relatórios dependia do agregado do servidor. Aqui a réplica local vira
+# colunas paralelas (datas em segundos, códigos de categoria/prioridade) e qualquer
+# período é respondido com máscaras e bincount: totais, categorias, prioridades,
+# percentis do tempo de resolução, volume semanal, backlog diário e tendência por
+# categoria. Com NumPy as colunas são arrays; sem ele, listas e laços equivalentes.
+# As colunas são refeitas só quando a versão da réplica muda.
+
+DIA = 86400
+SEMANA = 7 * DIA
+PERIODO_PADRAO_DIAS = 30
+PERCENTIS = (50, 90, 95)
+
+_PRIORIDADES = list(Prioridade)
+
+
+def _ts(data: Optional[datetime]) -> float:
+    return data.timestamp() if data else math.nan
+
+
+class Colunas:
+    """Chamados em colunas paralelas. 'saida' é quando o chamado deixou o backlog (inf se aberto)."""
+    __slots__ = ("qtd", "abertura", "fechamento", "saida", "finalizado", "categoria", "prioridade",
+                 "categorias", "_abertura_ordenada", "_saida_ordenada")
+
+    def __init__(self, chamados: Iterable[Chamado]):
+        codigos_cat: Dict[str, int] = {}
+        codigos_pri = {p: i for i, p in enumerate(_PRIORIDADES)}
+        abertura, fechamento, saida, finalizado, categoria, prioridade = [], [], [], [], [], []
+        for c in chamados:
+            ab = _ts(c.data_abertura)
+            fim = c.status.finalizado
+            fe = _ts(c.data_fechamento) if fim else math.nan
+            abertura.append(ab)
+            fechamento.append(fe)
+            # Resolvido sem data de fechamento: sai do backlog no mesmo instante em que entrou
+            saida.append((ab if math.isnan(fe) else fe) if fim else math.inf)
+            finalizado.append(fim)
+            categoria.append(codigos_cat.setdefault(c.nome_categoria, len(codigos_cat)))
+            prioridade.append(codigos_pri[c.prioridade])
+
+        self.qtd = len(abertura)
+        self.categorias = list(codigos_cat)
+        if HAS_NUMPY:
+            self.abertura = np.array(abertura, dtype=np.float64)
+            self.fechamento = np.array(fechamento, dtype=np.float64)
+            self.saida = np.array(saida, dtype=np.float64)
+            self.finalizado = np.array(finalizado, dtype=bool)
+            self.categoria = np.array(categoria, dtype=np.int64)
+            self.prioridade = np.array(prioridade, dtype=np.int64)
+            # NaN vai para o fim na ordenação e não entra nas contagens "< x"
+            self._abertura_ordenada = np.sort(self.abertura)
+            self._saida_ordenada = np.sort(self.saida)
+        else:
+            self.abertura, self.fechamento, self.saida = abertura, fechamento, saida
+            self.finalizado, self.categoria, self.prioridade = finalizado, categoria, prioridade
+            self._abertura_ordenada = sorted(a for a in abertura if not math.isnan(a))
+            self._saida_ordenada = sorted(s for s in saida if not math.isnan(s))
+
+
+def _limites(inicio: datetime, fim: datetime) -> tuple:
+    """Período de dias inteiros: [inicio 00:00, dia seguinte a fim 00:00)."""
+    ini = datetime(inicio.year, inicio.month, inicio.day)
+    fim_excl = datetime(fim.year, fim.month, fim.day) + timedelta(days=1)
+    semana0 = ini - timedelta(days=ini.weekday())
+    return ini, fim_excl, semana0
+
+
+def _percentil(ordenados: List[float], p: float) -> float:
+    """Interpolação linear, igual ao padrão de numpy.percentile."""
+    k = (len(ordenados) - 1) * p / 100
+    f = int(k)
+    c = min(f + 1, len(ordenados) - 1)
+    return ordenados[f] + (ordenados[c] - ordenados[f]) * (k - f)
+
+
+def _analisar_numpy(col: Colunas, ini: float, fim_excl: float, semana0: float, n_semanas: int, fins_dia: List[float]) -> dict:
+    ab = col.abertura
+    m = (ab >= ini) & (ab < fim_excl)
+    fin = m & col.finalizado
+    n_cat = len(col.categorias)
+
+    horas = (col.fechamento[fin] - ab[fin]) / 3600
+    horas = horas[~np.isnan(horas) & (horas >= 0)]
+    semanas = ((ab[m] - semana0) // SEMANA).astype(np.int64)
+    cats = col.categoria[m]
+    fins = np.array(fins_dia, dtype=np.float64)
+
+    return {
+        "total": int(m.sum()), "resolvidos": int(fin.sum()),
+        "por_categoria": np.bincount(cats, minlength=n_cat).tolist(),
+        "por_prioridade": np.bincount(col.prioridade[m], minlength=len(_PRIORIDADES)).tolist(),
+        "percentis": np.percentile(horas, PERCENTIS).tolist() if horas.size else None,
+        "amostras": int(horas.size),
+        "semanal": np.bincount(semanas, minlength=n_semanas).tolist(),
+        "tendencia": np.bincount(cats * n_semanas + semanas, minlength=n_cat * n_semanas).reshape(n_cat, n_semanas).tolist(),
+        "backlog": (np.searchsorted(col._abertura_ordenada, fins) - np.searchsorted(col._saida_ordenada, fins)).tolist(),
+    }
+
+
+def _analisar_python(col: Colunas, ini: float, fim_excl: float, semana0: float, n_semanas: int, fins_dia: List[float]) -> dict:
+    n_cat = len(col.categorias)
+    total = resolvidos = 0
+    por_categoria = [0] * n_cat
+    por_prioridade = [0] * len(_PRIORIDADES)
+    semanal = [0] * n_semanas
+    tendencia = [[0] * n_semanas for _ in range(n_cat)]
+    horas = []
+    fechamento, finalizado, categoria, prioridade = col.fechamento, col.finalizado, col.categoria, col.prioridade
+
+    for i, ab in enumerate(col.abertura):
+        if not (ini <= ab < fim_excl): continue  # NaN também cai aqui
+        total += 1
+        cat = categoria[i]
+        semana = int((ab - semana0) // SEMANA)
+        por_categoria[cat] += 1
+        por_prioridade[prioridade[i]] += 1
+        semanal[semana] += 1
+        tendencia[cat][semana] += 1
+        if finalizado[i]:
+            resolvidos += 1
+            duracao = (fechamento[i] - ab) / 3600
+            if duracao >= 0: horas.append(duracao)  # NaN falha a comparação
+
+    horas.sort()
+    return {
+        "total": total, "resolvidos": resolvidos,
+        "por_categoria": por_categoria, "por_prioridade": por_prioridade,
+        "percentis": [_percentil(horas, p) for p in PERCENTIS] if horas else None,
+        "amostras": len(horas),
+        "semanal": semanal, "tendencia": tendencia,
+        "backlog": [bisect.bisect_left(col._abertura_ordenada, f) - bisect.bisect_left(col._saida_ordenada, f) for f in fins_dia],
+    }
+
+
+def analisar(col: Colunas, inicio: datetime, fim: datetime) -> Dict[str, Any]:
+    """
+    Relatório do período (dias inteiros, inclusive), no formato do agregado do servidor
+    (periodo / metricas / porCategoria) mais as métricas que só existem localmente.
+    """
+    ini, fim_excl, semana0 = _limites(inicio, fim)
+    n_dias = (fim_excl - ini).days
+    n_semanas = max(1, math.ceil((fim_excl - semana0).days / 7))
+    fins_dia = [(ini + timedelta(days=d + 1)).timestamp() for d in range(n_dias)]
+
+    calcular = _analisar_numpy if HAS_NUMPY else _analisar_python
+    r = calcular(col, ini.timestamp(), fim_excl.timestamp(), semana0.timestamp(), n_semanas, fins_dia)
+
+    percentis = r["percentis"]
+    return {
+        "periodo": {"inicio": ini.isoformat(), "fim": (fim_excl - timedelta(days=1)).isoformat()},
+        "metricas": {
+            "totalChamados": r["total"], "totalAbertos": r["total"] - r["resolvidos"], "totalResolvidos": r["resolvidos"],
+        },
+        "porCategoria": [{"nome": nome, "quantidade": q} for nome, q in zip(col.categorias, r["por_categoria"]) if q],
+        "porPrioridade": [{"nome": p.rotulo, "quantidade": q} for p, q in zip(_PRIORIDADES, r["por_prioridade"])],
+        "resolucaoHoras": {
+            **{f"p{p}": (round(v, 1) if percentis else None) for p, v in zip(PERCENTIS, percentis or [None] * len(PERCENTIS))},
+            "amostras": r["amostras"],
+        },
+        "volumeSemanal": [
+            {"semana": (semana0 + timedelta(weeks=s)).date().isoformat(), "quantidade": q} for s, q in enumerate(r["semanal"])
+        ],
+        "backlog": [{"dia": (ini + timedelta(days=d)).date().isoformat(), "quantidade": q} for d, q in enumerate(r["backlog"])],
+        "tendenciaCategorias": {nome: serie for nome, serie in zip(col.categorias, r["tendencia"]) if any(serie)},
+        "origem": "local",
+    }
+
+
+# --- COLUNAS DA RÉPLICA (CACHE POR VERSÃO) ---
+_CACHE: Dict[str, tuple] = {}
+_LOCK = threading.Lock()
+
+
+def colunas_da_replica(escopo: str = "todos", sincronizar: bool = True) -> Optional[Colunas]:
+    """Colunas do estado atual da réplica; None se não houver nenhum chamado local."""
+    replica = replica_chamados.obter_replica(escopo)
+    if not sincronizar or not replica.sincronizar()[0]: replica.hidratar()
+
+    versao = replica.versao
+    with _LOCK:
+        item = _CACHE.get(escopo)
+        if item is not None and item[0] == versao: return item[1]
+
+    modelos = replica.snapshot_modelos()
+    if not modelos: return None
+    col = Colunas(modelos)
+    with _LOCK: _CACHE[escopo] = (versao, col)
+    return col
+
+
+def relatorio_local(data_inicio: Optional[datetime] = None, data_fim: Optional[datetime] = None, escopo: str = "todos",
+                    sincronizar: bool = True) -> tuple[bool, Any]:
+    """
+    (True, relatório) calculado da réplica, ou (False, msg) se não houver dados locais.
+    sincronizar=False (ex.: só trocou o período) nem faz o GET condicional.
+    """
+    data_fim = data_fim or datetime.now()
+    data_inicio = data_inicio or data_fim - timedelta(days=PERIODO_PADRAO_DIAS - 1)
+    col = colunas_da_replica(escopo, sincronizar)
+    if col is None: return False, "Sem chamados locais."
+    return True, analisar(col, data_inicio, data_fim)
+
+
+# --- BENCHMARK ---
+def _gerar_chamados(qtd: int, dias: int = 365) -> List[Chamado]:
+    aleatorio = random.Random(42)
+    agora = datetime.now()
+    status = list(StatusChamado)
+    categorias = ("Hardware", "Software", "Rede", "Impressora", "Outros")
+    chamados = []
+    for i in range(1, qtd + 1):
+        abertura = agora - timedelta(seconds=aleatorio.randrange(dias * DIA))
+        st = status[i % len(status)]
+        fechamento = abertura + timedelta(hours=aleatorio.expovariate(1 / 24)) if st.finalizado else None
+        chamados.append(Chamado(i, f"Chamado {i}", "", st, _PRIORIDADES[i % 3], 1 + i % 5, categorias[i % 5],
+                                abertura, (), fechamento))
+    return chamados
+
+
+def benchmark(qtd: int = 100_000, dias_periodo: int = 90) -> Dict[str, Any]:
+    """Tempos (ms) para montar as colunas de qtd chamados e analisar um período de dias_periodo."""
+    chamados = _gerar_chamados(qtd)
+    t0 = time.perf_counter()
+    col = Colunas(chamados)
+    montagem = (time.perf_counter() - t0) * 1000
+
+    fim = datetime.now()
+    inicio = fim - timedelta(days=dias_periodo - 1)
+    melhor = float("inf")
+    for _ in range(5):
+        t0 = time.perf_counter()
+        analisar(col, inicio, fim)
+        melhor = min(melhor, time.perf_counter() - t0)
+    return {"qtd": qtd, "numpy": HAS_NUMPY, "montagem_ms": montagem, "analise_ms": melhor * 1000}
+
+
+if __name__ == "__main__":
+    for chave, valor in benchmark().items():
+        print(f"{chave:>12}: {valor:.2f}" if isinstance(valor, float) else f"{chave:>12}: {valor}")
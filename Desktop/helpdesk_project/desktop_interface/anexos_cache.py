@@ -0,0 +1,142 @@
+import base64
+import hashlib
+import threading
+import logging
+import os
+import sys
+from typing import Optional, Dict, Any
+
+# --- CONFIGURAÇÃO DE PATH ---
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path: sys.path.append(parent_dir)
+
+try:
+    from desktop_interface import armazenamento_local
+except ImportError:
+    import armazenamento_local
+
+# ----------------------------------------------------------------------
+# CACHE EM DISCO DO CONTEÚDO DOS ANEXOS
+# ----------------------------------------------------------------------
+# As listas de chamados só carregam referências aos anexos; o conteúdo é baixado
+# quando o usuário pede e fica aqui, um arquivo por anexo. Passando do limite,
+# os arquivos usados há mais tempo (mtime, renovado a cada leitura) saem primeiro.
+#
+# Enquanto a API não tiver uma rota só do anexo (api_client.ROTA_ANEXO), o base64 que
+# chega nas listas é a única fonte garantida do conteúdo (o detalhe pode vir sem anexos).
+# Esse conteúdo é "fixado" numa subpasta com limite próprio e maior: sai por último,
+# também pelo uso mais antigo, para não perder à toa o que não dá para baixar de novo.
+LIMITE_BYTES = 200 * 1024 * 1024
+LIMITE_FIXOS_BYTES = 500 * 1024 * 1024
+
+_LOCK = threading.Lock()
+_STATS = {"hits": 0, "misses": 0, "removidos": 0}
+
+
+def _pasta() -> str:
+    pasta = os.path.join(armazenamento_local.pasta_cache(), "anexos")
+    os.makedirs(pasta, exist_ok=True)
+    return pasta
+
+
+def chave(chamado_id: Any, anexo: Dict[str, Any]) -> str:
+    """Identifica o anexo pelo chamado + id do anexo (ou posição na lista) + nome."""
+    ident = anexo.get("id_anexo")
+    if ident is None: ident = anexo.get("indice")
+    bruto = f"{chamado_id}|{ident}|{anexo.get('nome') or ''}"
+    return hashlib.sha1(bruto.encode("utf-8")).hexdigest()
+
+
+def _pasta_fixos() -> str:
+    pasta = os.path.join(_pasta(), "fixos")
+    os.makedirs(pasta, exist_ok=True)
+    return pasta
+
+
+def obter(chave_anexo: str) -> Optional[bytes]:
+    caminho = os.path.join(_pasta(), chave_anexo)
+    try:
+        with open(caminho, "rb") as f: conteudo = f.read()
+        os.utime(caminho)
+        _STATS["hits"] += 1
+        return conteudo
+    except OSError:
+        pass
+    caminho = os.path.join(_pasta_fixos(), chave_anexo)
+    try:
+        with open(caminho, "rb") as f: conteudo = f.read()
+        os.utime(caminho)
+        _STATS["hits"] += 1
+        return conteudo
+    except OSError:
+        _STATS["misses"] += 1
+        return None
+
+
+def fixar(chave_anexo: str, conteudo_b64: str) -> bool:
+    """
+    Guarda (sob LIMITE_FIXOS_BYTES) o conteúdo base64 de um anexo que vai sair da lista.
+    Retorna False se não foi possível: aí quem chamou deve manter o base64 consigo.
+    """
+    try:
+        pasta = _pasta_fixos()
+        caminho = os.path.join(pasta, chave_anexo)
+        if os.path.exists(caminho): return True
+        conteudo = base64.b64decode(conteudo_b64)
+        temporario = caminho + ".tmp"
+        with _LOCK:
+            with open(temporario, "wb") as f: f.write(conteudo)
+            os.replace(temporario, caminho)
+            _podar(pasta, LIMITE_FIXOS_BYTES)
+        return True
+    except (OSError, ValueError, TypeError) as e:
+        logging.error(f"Falha ao fixar anexo em disco: {e}")
+        return False
+
+
+def gravar(chave_anexo: str, conteudo: bytes):
+    pasta = _pasta()
+    caminho = os.path.join(pasta, chave_anexo)
+    temporario = caminho + ".tmp"
+    with _LOCK:
+        try:
+            with open(temporario, "wb") as f: f.write(conteudo)
+            os.replace(temporario, caminho)
+        except OSError as e:
+            logging.error(f"Falha ao gravar anexo em cache: {e}")
+            return
+        _podar(pasta, LIMITE_BYTES)
+
+
+def _podar(pasta: str, limite: int):
+    """Remove os anexos menos usados até o total da pasta caber no limite."""
+    arquivos = []
+    total = 0
+    for entrada in os.scandir(pasta):
+        if not entrada.is_file() or entrada.name.endswith(".tmp"): continue
+        info = entrada.stat()
+        arquivos.append((info.st_mtime, info.st_size, entrada.path))
+        total += info.st_size
+    if total <= limite: return
+
+    for _, tamanho, caminho in sorted(arquivos):
+        try: os.remove(caminho)
+        except OSError: continue
+        total -= tamanho
+        _STATS["removidos"] += 1
+        if total <= limite: break
+
+
+def limpar():
+    with _LOCK:
+        for pasta in (_pasta_fixos(), _pasta()):
+            for entrada in os.scandir(pasta):
+                if not entrada.is_file(): continue
+                try: os.remove(entrada.path)
+                except OSError: pass
+
+
+def estatisticas() -> Dict[str, int]:
+    ocupado = sum(e.stat().st_size for pasta in (_pasta(), _pasta_fixos()) for e in os.scandir(pasta) if e.is_file())
+    return dict(_STATS, bytes=ocupado)
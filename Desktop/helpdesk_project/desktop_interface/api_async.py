@@ -0,0 +1,126 @@
+import asyncio
+import concurrent.futures
+import threading
+import logging
+import sys
+import os
+from typing import Any, Callable, Dict, List, Optional
+
+# --- CONFIGURAÇÃO DE PATH ---
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path: sys.path.append(parent_dir)
+
+try:
+    from desktop_interface import api_client
+    from desktop_interface import detalhe_chamado
+    from desktop_interface import pool_tarefas
+except ImportError:
+    import api_client
+    import detalhe_chamado
+    import pool_tarefas
+
+# ----------------------------------------------------------------------
+# VARIANTE ASSÍNCRONA DO API CLIENT
+# ----------------------------------------------------------------------
+# Um único event loop numa thread daemon. As corrotinas delegam às funções do
+# api_client (mesma sessão keep-alive, mesmo cache e mesmo retorno (bool, dados)),
+# mas requisições independentes saem juntas: abrir um chamado custa um round trip
+# em vez de três.
+#
+#   rodar(coro)                 -> fachada síncrona (bloqueia quem chamou)
+#   no_tk(widget, coro, func)   -> entrega o resultado na main loop do Tk via after()
+
+_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_LOCK = threading.Lock()
+
+
+def _obter_loop() -> asyncio.AbstractEventLoop:
+    global _LOOP
+    with _LOCK:
+        if _LOOP is None or _LOOP.is_closed():
+            loop = asyncio.new_event_loop()
+            # to_thread usa o executor padrão do loop: limitado como o pool de tarefas
+            loop.set_default_executor(concurrent.futures.ThreadPoolExecutor(
+                max_workers=pool_tarefas.MAX_TRABALHADORES, thread_name_prefix="api-async"))
+            threading.Thread(target=loop.run_forever, name="api-async", daemon=True).start()
+            _LOOP = loop
+        return _LOOP
+
+
+def executar(coro) -> concurrent.futures.Future:
+    """Agenda a corrotina no loop de fundo e devolve um Future thread-safe."""
+    return asyncio.run_coroutine_threadsafe(coro, _obter_loop())
+
+
+def rodar(coro, timeout: Optional[float] = None) -> Any:
+    """Fachada síncrona: executa a corrotina e espera o resultado."""
+    return executar(coro).result(timeout)
+
+
+def no_tk(widget, coro, ao_concluir: Callable[[Any], None], ao_falhar: Optional[Callable[[Exception], None]] = None) -> concurrent.futures.Future:
+    """
+    Executa a corrotina fora da thread da interface e chama ao_concluir(resultado)
+    na main loop do Tk. Se o widget já tiver sido destruído, o resultado é descartado.
+    """
+    futuro = executar(coro)
+
+    def entregar(f: concurrent.futures.Future):
+        if f.cancelled(): return
+        erro = f.exception()
+        if erro is not None:
+            logging.error(f"Erro em tarefa assíncrona: {erro}")
+            if ao_falhar is None: return
+            acao = lambda: ao_falhar(erro)
+        else:
+            resultado = f.result()
+            acao = lambda: ao_concluir(resultado)
+        try:
+            if widget.winfo_exists(): widget.after(0, acao)
+        except RuntimeError: pass  # main loop já encerrada
+
+    futuro.add_done_callback(entregar)
+    return futuro
+
+
+# --- CHAMADAS ---
+async def obter_chamado(chamado_id) -> Optional[Dict[str, Any]]:
+    return await asyncio.to_thread(detalhe_chamado.obter_chamado, chamado_id)
+
+
+async def listar_comentarios(chamado_id) -> tuple[bool, Any]:
+    return await asyncio.to_thread(api_client.listar_comentarios, chamado_id)
+
+
+async def listar_usuarios() -> tuple[bool, Any]:
+    return await asyncio.to_thread(api_client.listar_usuarios)
+
+
+async def enviar_comentario(chamado_id, texto) -> tuple[bool, Any]:
+    return await asyncio.to_thread(api_client.enviar_comentario, chamado_id, texto)
+
+
+async def obter_relatorio_gerencial(data_inicio=None, data_fim=None) -> tuple[bool, Any]:
+    return await asyncio.to_thread(api_client.obter_relatorio_gerencial, data_inicio, data_fim)
+
+
+async def carregar_relatorios_dias(dias: List[str]) -> List[tuple[bool, Any]]:
+    """Um relatório por dia (início = fim = dia), em paralelo. Falha de um dia vira (False, msg) só nele."""
+    resultados = await asyncio.gather(*(obter_relatorio_gerencial(d, d) for d in dias), return_exceptions=True)
+    return [(False, str(r)) if isinstance(r, Exception) else r for r in resultados]
+
+
+async def carregar_detalhe(chamado_id) -> Dict[str, Any]:
+    """Chamado, comentários e usuários em paralelo. Falha de uma parte vira (False, msg) só nela."""
+    chamado, comentarios, usuarios = await asyncio.gather(
+        obter_chamado(chamado_id), listar_comentarios(chamado_id), listar_usuarios(),
+        return_exceptions=True,
+    )
+    if isinstance(chamado, Exception): chamado = None
+    if isinstance(comentarios, Exception): comentarios = (False, str(comentarios))
+    if isinstance(usuarios, Exception): usuarios = (False, str(usuarios))
+    return {"chamado": chamado, "comentarios": comentarios, "usuarios": usuarios}
+
+
+def carregar_detalhe_sync(chamado_id) -> Dict[str, Any]:
+    return rodar(carregar_detalhe(chamado_id))
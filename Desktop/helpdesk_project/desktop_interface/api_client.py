@@ -3,10 +3,31 @@ import logging
 import base64
 import os
 import json 
+import threading
+import uuid
 from typing import Optional, Dict, Any, List
 import sys 
 from requests.exceptions import RequestException 
 
+try:
+    from desktop_interface import sessao_http
+    from desktop_interface import cache_http
+    from desktop_interface import armazenamento_local
+    from desktop_interface import normalizacao
+    from desktop_interface import leitor_json
+    from desktop_interface import anexos_cache
+    from desktop_interface import voo_unico
+    from desktop_interface import modelo_chamado
+except ImportError:
+    import sessao_http
+    import cache_http
+    import armazenamento_local
+    import normalizacao
+    import leitor_json
+    import anexos_cache
+    import voo_unico
+    import modelo_chamado
+
 # ----------------------------------------------------------------------
 # CONFIGURAÇÕES
 # ----------------------------------------------------------------------
@@ -28,68 +49,51 @@ def _get_headers(auth_required: bool = True) -> Dict[str, str]:
         headers["Authorization"] = f"Bearer {AUTH_TOKEN}"
     return headers
 
-def _normalizar_dados(dados: Any) -> Any:
-    if isinstance(dados, list):
-        return [_normalizar_dados(item) for item in dados]
-    
-    if isinstance(dados, dict):
-        dados_lower = {k.lower(): v for k, v in dados.items()}
-        
-        # Chamados
-        if "id_chamado" not in dados: dados["id_chamado"] = dados_lower.get("idchamado") or dados.get("id")
-        if "id_usuario" not in dados: dados["id_usuario"] = dados_lower.get("idusuario")
-        if "titulo" not in dados: dados["titulo"] = dados_lower.get("titulo")
-        if "descricao" not in dados: dados["descricao"] = dados_lower.get("descricao")
-        if "status" not in dados: dados["status"] = dados_lower.get("status")
-        if "prioridade" not in dados: dados["prioridade"] = dados_lower.get("prioridade")
-        if "data_abertura" not in dados: dados["data_abertura"] = dados_lower.get("dataabertura")
-        if "data_fechamento" not in dados: dados["data_fechamento"] = dados_lower.get("datafechamento")
-        if "id_categoria" not in dados: dados["id_categoria"] = dados_lower.get("idcategoria")
-        
-        # --- NORMALIZAÇÃO DE ANEXOS ---
-        lista_anexos_raw = (
-            dados.get("ChamadoAnexos") or dados.get("chamadoAnexos")
-            or dados.get("Anexos") or dados.get("anexos") 
-            or dados_lower.get("anexos") or []
-        )
-        
-        anexos_normalizados = []
-        if isinstance(lista_anexos_raw, list):
-            for anexo in lista_anexos_raw:
-                nome = (anexo.get("Nome") or anexo.get("nome") or anexo.get("NomeArquivo") or "anexo.dat")
-                url = (anexo.get("Url") or anexo.get("url") or anexo.get("UrlArquivo"))
-                dados_b64 = (anexo.get("Dados") or anexo.get("dados") or anexo.get("DadosBase64"))
-                
-                if url or dados_b64:
-                    anexos_normalizados.append({"nome": nome, "url": url, "dados": dados_b64})
-        
-        dados["anexos"] = anexos_normalizados
-
-        # Outros Campos
-        if "id_artigo" not in dados: dados["id_artigo"] = dados_lower.get("idartigo") or dados.get("IdArtigo") or dados.get("id")
-        if "conteudo" not in dados: dados["conteudo"] = dados_lower.get("conteudo")
-        if "palavraschave" not in dados: dados["palavraschave"] = dados_lower.get("palavraschave") or ""
-        if "datacriacao" not in dados: dados["datacriacao"] = dados_lower.get("datacriacao")
-        if "resolucaoia_sugerida" not in dados: dados["resolucaoia_sugerida"] = (dados.get("ResolucaoIA_Sugerida") or dados.get("resolucaoIA_Sugerida") or dados.get("resolucaoia_sugerida") or dados_lower.get("resolucaoia_sugerida") or "")
-        if "comentario" not in dados: dados["comentario"] = dados.get("Comentario") or dados_lower.get("comentario")
-        if "data_hora" not in dados: dados["data_hora"] = dados.get("DataHora") or dados_lower.get("datahora")
-        if "id_interacao" not in dados: dados["id_interacao"] = dados.get("IdInteracao") or dados_lower.get("idinteracao")
-        if "nomecompleto" not in dados: dados["nomecompleto"] = dados.get("NomeCompleto") or dados_lower.get("nomecompleto")
-        if "id_perfil" not in dados: dados["id_perfil"] = dados.get("IdPerfil") or dados_lower.get("idperfil")
-        if "ativo" not in dados: dados["ativo"] = dados.get("Ativo") if "Ativo" in dados else dados.get("ativo")
-        if "metricas" not in dados and "Metricas" in dados: dados["metricas"] = dados["Metricas"]
-        if "periodo" not in dados and "Periodo" in dados: dados["periodo"] = dados["Periodo"]
-        if "porCategoria" not in dados and "PorCategoria" in dados: dados["porCategoria"] = dados["PorCategoria"]
-
-        return dados
-    return dados
+def _http() -> requests.Session:
+    """Sessão compartilhada com pool keep-alive (evita um handshake TCP+TLS por clique)."""
+    return sessao_http.obter_sessao()
+
+def _get_condicional(caminho: str, params: Optional[Dict[str, Any]] = None, timeout: int = 20, tipo: str = "chamado") -> tuple[int, Any]:
+    """
+    GET de listas com ETag/If-Modified-Since. Um 304 devolve o corpo já normalizado
+    guardado em cache_http, sem baixar nem normalizar a lista de novo.
+    Retorna (status, dados); status 304 indica que a lista não mudou desde a última busca.
+    O tipo escolhe o esquema de normalizacao.ESQUEMAS aplicado ao corpo.
+    Chamadas idênticas simultâneas (ou dentro de voo_unico.TTL_SEGUNDOS) dividem uma só requisição.
+    """
+    url = f"{API_BASE_URL}{caminho}"
+    escopo = CURRENT_USER.get("id") if CURRENT_USER else None
+    chave = cache_http.chave(url, params, escopo)
+
+    status, dados = voo_unico.executar(chave, lambda: _get_condicional_rede(url, chave, params, timeout, tipo))
+    # Cópia rasa por chamador: as telas ordenam a lista in-place
+    return status, list(dados) if isinstance(dados, list) else dados
+
+def _get_condicional_rede(url: str, chave: str, params: Optional[Dict[str, Any]], timeout: int, tipo: str) -> tuple[int, Any]:
+    headers = _get_headers()
+    headers.update(cache_http.cabecalhos_condicionais(chave))
+    resp = _http().get(url, headers=headers, params=params, timeout=timeout)
+
+    if resp.status_code == 304:
+        dados = cache_http.obter(chave)
+        if dados is not None: return 304, dados
+        # Entrada saiu do cache entre o envio e a resposta: repete sem validadores
+        resp = _http().get(url, headers=_get_headers(), params=params, timeout=timeout)
+
+    if resp.status_code != 200: return resp.status_code, None
+
+    dados = normalizacao.normalizar(tipo, resp.json())
+    if tipo == "chamado" and isinstance(dados, list):
+        for chamado in dados: _sem_blobs(chamado)
+    cache_http.registrar(chave, resp.headers, dados)
+    return 200, dados
 
 # --- LOGIN ---
 def realizar_login(email: str, senha: str) -> tuple[bool, str, Optional[Dict]]:
     global AUTH_TOKEN, CURRENT_USER
     url_login = f"{API_BASE_URL}/api/auth/login"
     try:
-        response = requests.post(url_login, json={"email": email, "password": senha}, headers=_get_headers(False), timeout=20)
+        response = _http().post(url_login, json={"email": email, "password": senha}, headers=_get_headers(False), timeout=20)
         try: data = response.json()
         except: return False, f"Erro Fatal {response.status_code}: API não retornou JSON.", None
         if response.status_code != 200: return False, f"Falha no login: {data.get('detail')}", None
@@ -97,8 +101,18 @@ def realizar_login(email: str, senha: str) -> tuple[bool, str, Optional[Dict]]:
         user_obj = data.get("user", {})
         if not token: return False, "Token não recebido.", None
         AUTH_TOKEN = token
+        cache_http.limpar()
+        voo_unico.invalidar()
+        try:
+            from desktop_interface.replica_chamados import limpar_replicas
+            from desktop_interface import painel_dados, relatorio_periodo, busca_artigos
+            limpar_replicas()
+            painel_dados.limpar()
+            relatorio_periodo.limpar()
+            busca_artigos.limpar()
+        except ImportError: pass
         url_me = f"{API_BASE_URL}/api/auth/me"
-        response_me = requests.get(url_me, headers=_get_headers(True), timeout=20)
+        response_me = _http().get(url_me, headers=_get_headers(True), timeout=20)
         if response_me.status_code != 200:
             AUTH_TOKEN = None 
             return False, f"Erro ao buscar perfil: {response_me.status_code}", None
@@ -109,9 +123,114 @@ def realizar_login(email: str, senha: str) -> tuple[bool, str, Optional[Dict]]:
         full_profile["role"] = role_str
         full_profile["role_id"] = role_id
         CURRENT_USER = full_profile
+        armazenamento_local.abrir(full_profile.get("id") or full_profile.get("email"))
         return True, "Login realizado com sucesso!", CURRENT_USER
     except Exception as e: return False, f"Erro interno: {e}", None
 
+# --- FILA DE ENVIO (escritas que sobrevivem à queda da rede) ---
+# Toda escrita é gravada em disco ANTES do envio, com uma chave de idempotência.
+# Se o servidor responde, o item sai da fila; se a rede falha (ou o servidor está
+# fora), ele fica lá e fila_envio.py reenvia com a mesma chave quando a conexão voltar.
+# Enquanto houver itens pendentes, escritas novas entram atrás deles: a ordem é a do usuário.
+STATUS_REPETIVEIS = (502, 503, 504)
+STATUS_SESSAO = (401, 403)
+MSG_ENFILEIRADO = "Sem conexão com o servidor.\nA operação foi salva e será enviada automaticamente quando a conexão voltar."
+
+_EM_ENVIO: set = set()
+_LOCK_ENVIO = threading.Lock()
+_TOKEN_RECUSADO = None  # token que levou 401/403 no reenvio: a fila espera um novo login
+
+def _enviar_requisicao_fila(chave: str, req: Dict[str, Any]):
+    headers = _get_headers()
+    headers["Idempotency-Key"] = chave
+    try:
+        return _http().request(req["metodo"], f"{API_BASE_URL}{req['caminho']}", json=req.get("corpo"), headers=headers, timeout=req.get("timeout", 15))
+    finally:
+        voo_unico.invalidar()
+
+def _escrever(tipo: str, metodo: str, caminho: str, corpo: Any, timeout: int):
+    """
+    Envia uma escrita passando pela fila. Retorna a resposta, ou None se ela ficou na fila
+    (sem rede, ou atrás de escritas anteriores ainda não enviadas). Se o disco estiver
+    indisponível, envia direto como antes.
+    """
+    chave = str(uuid.uuid4())
+    req = {"metodo": metodo, "caminho": caminho, "corpo": corpo, "timeout": timeout}
+    ha_pendentes = armazenamento_local.contar_fila() > 0
+    enfileirado = armazenamento_local.enfileirar(chave, tipo, req)
+
+    if enfileirado and ha_pendentes:
+        # Não fura a fila: envia as anteriores primeiro e só então esta
+        _, resp = _drenar_fila(ate=chave)
+        return resp
+
+    with _LOCK_ENVIO: _EM_ENVIO.add(chave)
+    try:
+        resp = _enviar_requisicao_fila(chave, req)
+    except RequestException as e:
+        if not enfileirado: raise
+        logging.warning(f"{tipo} enfileirado para reenvio ({chave}): {e}")
+        return None
+    finally:
+        with _LOCK_ENVIO: _EM_ENVIO.discard(chave)
+
+    if enfileirado:
+        if resp.status_code in STATUS_REPETIVEIS: return None
+        armazenamento_local.remover_da_fila(chave)
+    return resp
+
+def _drenar_fila(ate: Optional[str] = None):
+    """
+    Envia as escritas pendentes em ordem. Com `ate`, para depois desse item e devolve a
+    resposta dele ao chamador (que mostra o erro, se houver). Retorna (enviadas, resposta).
+    """
+    global _TOKEN_RECUSADO
+    enviadas = 0
+    if not AUTH_TOKEN or AUTH_TOKEN == _TOKEN_RECUSADO: return enviadas, None
+    for item in armazenamento_local.listar_fila():
+        chave = item["chave"]
+        with _LOCK_ENVIO:
+            if chave in _EM_ENVIO: continue
+            _EM_ENVIO.add(chave)
+        try:
+            resp = _enviar_requisicao_fila(chave, item["requisicao"])
+        except RequestException as e:
+            armazenamento_local.registrar_falha_fila(chave, str(e))
+            break  # ainda sem rede: mantém a ordem e tenta depois
+        finally:
+            with _LOCK_ENVIO: _EM_ENVIO.discard(chave)
+
+        if resp.status_code in STATUS_REPETIVEIS:
+            armazenamento_local.registrar_falha_fila(chave, f"HTTP {resp.status_code}")
+            break
+        if resp.status_code in STATUS_SESSAO:
+            # Sessão expirada: nada na fila passa com este token; espera o próximo login
+            armazenamento_local.registrar_falha_fila(chave, f"HTTP {resp.status_code}")
+            _TOKEN_RECUSADO = AUTH_TOKEN
+            break
+        if chave == ate:
+            armazenamento_local.remover_da_fila(chave)
+            return enviadas + 1, resp
+        if resp.status_code >= 400:
+            logging.error(f"Escrita pendente '{item['tipo']}' recusada pela API ({resp.status_code}): {resp.text[:200]}")
+            armazenamento_local.marcar_recusada_fila(chave, f"HTTP {resp.status_code}: {resp.text[:200]}")
+        else:
+            armazenamento_local.remover_da_fila(chave)
+            enviadas += 1
+    return enviadas, None
+
+def reenviar_fila() -> tuple[int, int]:
+    """Reenvia as escritas pendentes na ordem em que foram feitas. Retorna (enviadas, restantes)."""
+    enviadas, _ = _drenar_fila()
+    return enviadas, armazenamento_local.contar_fila()
+
+def escritas_pendentes() -> int:
+    return armazenamento_local.contar_fila()
+
+def escritas_recusadas() -> List[Dict[str, Any]]:
+    """Escritas da fila que a API rejeitou (4xx) — para o usuário ver o que não foi salvo."""
+    return armazenamento_local.listar_recusadas_fila()
+
 # --- CHAMADOS ---
 def validar_pertinencia(titulo: str, descricao: str) -> tuple[bool, str]:
     try:
@@ -119,56 +238,306 @@ def validar_pertinencia(titulo: str, descricao: str) -> tuple[bool, str]:
         return validar(titulo, descricao)
     except: return True, "Filtro indisponível."
 
+ROTAS_CHAMADOS = {"todos": "/api/chamados/todos", "meus": "/api/chamados/meus"}
+
+def buscar_chamados_condicional(escopo: str = "todos", params: Optional[Dict[str, Any]] = None) -> tuple[int, Any]:
+    """Busca a lista de chamados do escopo ('todos' ou 'meus') informando 304 quando nada mudou."""
+    return _get_condicional(ROTAS_CHAMADOS[escopo], params=params, timeout=20)
+
+TAMANHO_PEDACO = 64 * 1024
+
+# Rota de download de um único anexo, se a API ganhar uma (ex.: "/api/chamados/{id_chamado}/anexos/{id_anexo}").
+# Sem ela, o conteúdo vem do detalhe do chamado.
+ROTA_ANEXO: Optional[str] = None
+
+def _sem_blobs(chamado: Dict[str, Any], chamado_id: Any = None) -> Dict[str, Any]:
+    """
+    Troca o base64 dos anexos de um chamado de lista por uma referência (dados_adiados + indice);
+    o conteúdo é buscado sob demanda em carregar_anexo. Sem ROTA_ANEXO o detalhe pode vir sem
+    anexos, então o base64 só sai da lista depois de fixado em disco (anexos_cache.fixar);
+    se não der para gravar, ele fica onde está.
+    """
+    if chamado_id is None: chamado_id = chamado.get("id_chamado")
+    for indice, anexo in enumerate(chamado.get("anexos") or []):
+        anexo["indice"] = indice
+        if not anexo.get("dados"): continue
+        if not ROTA_ANEXO or anexo.get("id_anexo") is None:
+            if chamado_id is None or not anexos_cache.fixar(anexos_cache.chave(chamado_id, anexo), anexo["dados"]):
+                continue
+        anexo["dados"] = None
+        anexo["dados_adiados"] = True
+    return chamado
+
+def _mesmo_anexo(a: Dict[str, Any], b: Dict[str, Any], indice: int) -> bool:
+    if a.get("id_anexo") is not None: return a.get("id_anexo") == b.get("id_anexo")
+    return a.get("indice", indice) == indice and (a.get("nome") or "") == (b.get("nome") or "")
+
+def carregar_anexo(chamado_id, anexo: Dict[str, Any]) -> tuple[bool, Any]:
+    """
+    Conteúdo (bytes) de um anexo com base64: da memória, do cache em disco ou da API, nessa ordem.
+    Retorna (True, bytes) ou (False, mensagem). Anexos só com URL são baixados pela tela.
+    """
+    chave = anexos_cache.chave(chamado_id, anexo)
+    if anexo.get("dados"):
+        try: return True, base64.b64decode(anexo["dados"])
+        except (ValueError, TypeError) as e: return False, f"Anexo corrompido: {e}"
+
+    conteudo = anexos_cache.obter(chave)
+    if conteudo is not None: return True, conteudo
+    if not AUTH_TOKEN: return False, "Não autenticado."
+
+    try:
+        if ROTA_ANEXO and anexo.get("id_anexo") is not None:
+            rota = ROTA_ANEXO.format(id_chamado=chamado_id, id_anexo=anexo["id_anexo"])
+            resp = _http().get(f"{API_BASE_URL}{rota}", headers=_get_headers(), timeout=60)
+            if resp.status_code != 200: return False, f"Erro {resp.status_code}"
+            conteudo = resp.content
+        else:
+            resp = _http().get(f"{API_BASE_URL}/api/chamados/{chamado_id}", headers=_get_headers(), timeout=60)
+            if resp.status_code != 200: return False, f"Erro {resp.status_code}"
+            completo = normalizacao.normalizar("chamado", resp.json())
+            for indice, candidato in enumerate(completo.get("anexos") or []):
+                if not candidato.get("dados"): continue
+                candidato["indice"] = indice
+                # Guarda todos os anexos do chamado: os próximos cliques não vão à rede
+                bytes_candidato = base64.b64decode(candidato["dados"])
+                anexos_cache.gravar(anexos_cache.chave(chamado_id, candidato), bytes_candidato)
+                if _mesmo_anexo(anexo, candidato, indice): conteudo = bytes_candidato
+            if conteudo is None: return False, "Anexo não encontrado no chamado."
+            return True, conteudo
+    except RequestException as e: return False, f"Erro de conexão: {e}"
+    except (ValueError, TypeError) as e: return False, f"Anexo corrompido: {e}"
+
+    anexos_cache.gravar(chave, conteudo)
+    return True, conteudo
+
+def listar_chamados_em_lotes(escopo: str = "todos", ao_receber_lote=None, lote: int = 25) -> tuple[bool, Any]:
+    """
+    Como listar_todos/meus_chamados, mas lê o corpo em streaming: cada chamado é normalizado
+    assim que chega e ao_receber_lote(lista_parcial) é chamado a cada `lote` chamados
+    (na thread de quem chamou). Os anexos vêm sem o base64 (ver _sem_blobs).
+    Retorna (True, lista completa) ou (False, mensagem).
+    Telas que pedem a mesma lista ao mesmo tempo dividem o download (voo_unico); só quem
+    iniciou o download recebe os lotes parciais, as demais recebem a lista completa.
+    """
+    if not AUTH_TOKEN: return False, "Não autenticado."
+    url = f"{API_BASE_URL}{ROTAS_CHAMADOS[escopo]}"
+    chave = cache_http.chave(url, None, CURRENT_USER.get("id") if CURRENT_USER else None)
+
+    def baixar() -> tuple[int, Any]:
+        headers = _get_headers()
+        headers.update(cache_http.cabecalhos_condicionais(chave))
+        with _http().get(url, headers=headers, timeout=20, stream=True) as resp:
+            if resp.status_code == 304:
+                dados = cache_http.obter(chave)
+                if dados is not None: return 304, dados
+            elif resp.status_code != 200: return resp.status_code, None
+            else:
+                recebidos = []
+                for bruto in leitor_json.iterar_array(resp.iter_content(TAMANHO_PEDACO), resp.encoding or "utf-8"):
+                    if not isinstance(bruto, dict): continue
+                    recebidos.append(_sem_blobs(normalizacao.normalizar_registro("chamado", bruto)))
+                    if ao_receber_lote and len(recebidos) % lote == 0: ao_receber_lote(list(recebidos))
+                cache_http.registrar(chave, resp.headers, recebidos)
+                return 200, recebidos
+        # 304 sem a entrada no cache: busca a lista inteira de novo (sem voo_unico, já estamos dentro dele)
+        return _get_condicional_rede(url, chave, None, 20, "chamado")
+
+    try:
+        status, dados = voo_unico.executar(chave, baixar)
+    except Exception as e: return False, str(e)
+    if status in (200, 304): return True, list(dados)
+    return False, f"Erro {status}"
+
 def listar_meus_chamados():
     if not AUTH_TOKEN: return False, "Não autenticado."
     try:
-        resp = requests.get(f"{API_BASE_URL}/api/chamados/meus", headers=_get_headers(), timeout=20)
-        if resp.status_code == 200: return True, _normalizar_dados(resp.json())
-        return False, f"Erro {resp.status_code}"
+        status, dados = buscar_chamados_condicional("meus")
+        if status in (200, 304): return True, dados
+        return False, f"Erro {status}"
     except Exception as e: return False, str(e)
 
 def listar_todos_chamados():
     if not AUTH_TOKEN: return False, "Não autenticado."
     try:
-        resp = requests.get(f"{API_BASE_URL}/api/chamados/todos", headers=_get_headers(), timeout=20)
-        if resp.status_code == 200: return True, _normalizar_dados(resp.json())
-        return False, f"Erro {resp.status_code}"
+        status, dados = buscar_chamados_condicional("todos")
+        if status in (200, 304): return True, dados
+        return False, f"Erro {status}"
     except Exception as e: return False, str(e)
 
-def obter_chamado_por_id(chamado_id):
-    if not AUTH_TOKEN: return None
-    
-    candidato_detalhe = None
+# ----------------------------------------------------------------------
+# PAGINAÇÃO, ORDEM E FILTROS NO SERVIDOR
+# ----------------------------------------------------------------------
+# As rotas de lista hoje devolvem tudo e as telas paginam localmente. Se a API passar
+# a paginar, basta acertar os nomes em PARAMETROS_PAGINACAO: a primeira resposta em
+# envelope ({itens, total}) liga o modo servidor para o escopo. Uma lista simples
+# (parâmetros ignorados) ou um 400 desliga, e as páginas passam a sair da lista
+# completa (GET condicional), filtrada e fatiada aqui. A descoberta fica gravada em
+# armazenamento_local para não perguntar de novo a cada abertura de tela.
+PARAMETROS_PAGINACAO = {
+    "pagina": "pagina", "tamanho": "tamanho", "ordenar": "ordenarPor", "direcao": "direcao",
+    "termo": "termo", "status": "status", "prioridade": "prioridade", "categoria": "idCategoria",
+}
+CAMPOS_ITENS_PAGINA = ("itens", "items", "data", "resultados")
+CAMPOS_TOTAL_PAGINA = ("total", "totalItens", "totalCount", "totalRegistros")
+
+_SUPORTE_PAGINACAO: Dict[str, Optional[bool]] = {}
+
+
+class Pagina:
+    """Uma página de chamados (dicts normalizados) e o total da consulta, do servidor ou da lista completa."""
+    __slots__ = ("itens", "numero", "tamanho", "total", "origem")
+
+    def __init__(self, itens: List[Dict[str, Any]], numero: int, tamanho: int, total: int, origem: str):
+        self.itens = itens
+        self.numero = numero
+        self.tamanho = tamanho
+        self.total = total
+        self.origem = origem  # "servidor" ou "local"
+
+    @property
+    def total_paginas(self) -> int:
+        return max(1, -(-self.total // self.tamanho))
+
+    @property
+    def tem_proxima(self) -> bool:
+        return self.numero < self.total_paginas
+
+    def __repr__(self) -> str:
+        return f"<Pagina {self.numero}/{self.total_paginas} ({len(self.itens)} de {self.total}, {self.origem})>"
+
+
+def paginacao_no_servidor(escopo: str = "todos") -> Optional[bool]:
+    """True/False se já se sabe se a rota do escopo pagina no servidor; None se ainda não foi testado."""
+    if escopo not in _SUPORTE_PAGINACAO:
+        gravado = armazenamento_local.ler_meta(f"paginacao_servidor:{escopo}")
+        _SUPORTE_PAGINACAO[escopo] = None if gravado is None else gravado == "1"
+    return _SUPORTE_PAGINACAO[escopo]
+
+def _registrar_paginacao(escopo: str, suportada: bool):
+    if _SUPORTE_PAGINACAO.get(escopo) is suportada: return
+    _SUPORTE_PAGINACAO[escopo] = suportada
+    armazenamento_local.gravar_meta(f"paginacao_servidor:{escopo}", "1" if suportada else "0")
+    logging.info(f"Paginação no servidor para '{escopo}': {'sim' if suportada else 'não (lista completa)'}")
+
+def _chave_ordem(valor: Any) -> tuple:
+    if valor is None or valor == "": return (2, "")
+    try: return (0, int(valor))
+    except (TypeError, ValueError): return (1, str(valor).lower())
+
+def _paginar_local(dados: List[Dict[str, Any]], numero: int, tamanho: int, ordenar: str, decrescente: bool,
+                   filtros: Dict[str, Any]) -> Pagina:
+    """O que o servidor faria: filtra, ordena e fatia a lista completa."""
+    StatusChamado, Prioridade = modelo_chamado.StatusChamado, modelo_chamado.Prioridade
+    termo = str(filtros.get("termo") or "").lower().strip()
+    status = StatusChamado.de_texto(filtros["status"]) if filtros.get("status") else None
+    prioridade = Prioridade.de_texto(filtros["prioridade"]) if filtros.get("prioridade") else None
+    categoria = filtros.get("categoria")
+
+    selecionados = []
+    for chamado in dados:
+        if termo and termo not in str(chamado.get("titulo") or "").lower() and termo not in str(chamado.get("id_chamado")): continue
+        if status is not None and StatusChamado.de_texto(chamado.get("status")) is not status: continue
+        if prioridade is not None and Prioridade.de_texto(chamado.get("prioridade")) is not prioridade: continue
+        if categoria is not None and chamado.get("id_categoria") != categoria: continue
+        selecionados.append(chamado)
+
+    selecionados.sort(key=lambda c: _chave_ordem(c.get(ordenar)), reverse=decrescente)
+    inicio = (numero - 1) * tamanho
+    return Pagina(selecionados[inicio:inicio + tamanho], numero, tamanho, len(selecionados), "local")
+
+def _pagina_do_servidor(escopo: str, numero: int, tamanho: int, ordenar: str, decrescente: bool,
+                        filtros: Dict[str, Any]) -> tuple[int, Any]:
+    """GET de uma página. Retorna (status, Pagina) em envelope, (status, lista) se a API ignorou os parâmetros."""
+    nomes = PARAMETROS_PAGINACAO
+    params = {nomes["pagina"]: numero, nomes["tamanho"]: tamanho, nomes["ordenar"]: ordenar,
+              nomes["direcao"]: "desc" if decrescente else "asc"}
+    for nome, valor in filtros.items():
+        if valor not in (None, "") and nome in nomes: params[nomes[nome]] = valor
 
+    url = f"{API_BASE_URL}{ROTAS_CHAMADOS[escopo]}"
+    usuario = CURRENT_USER.get("id") if CURRENT_USER else None
+    chave = cache_http.chave(url, params, usuario)
+    geracao = voo_unico.geracao()
+    resp = voo_unico.executar(chave, lambda: _http().get(url, headers=_get_headers(), params=params, timeout=20))
+    if resp.status_code != 200: return resp.status_code, None
+
+    corpo = resp.json()
+    if isinstance(corpo, list):
+        # A API ignorou os parâmetros: fica registrada como a lista sem parâmetros, para que a
+        # leitura completa logo em seguida (listar_chamados_em_lotes / _get_condicional) não baixe de novo
+        dados = [_sem_blobs(c) for c in normalizacao.normalizar("chamado", corpo)]
+        chave_lista = cache_http.chave(url, None, usuario)
+        cache_http.registrar(chave_lista, resp.headers, dados)
+        voo_unico.registrar(chave_lista, (200, dados), geracao_inicio=geracao)
+        return 200, list(dados)
+    if not isinstance(corpo, dict): return 200, None
+
+    itens = next((corpo[c] for c in CAMPOS_ITENS_PAGINA if isinstance(corpo.get(c), list)), None)
+    if itens is None: return 200, None
+    total = next((corpo[c] for c in CAMPOS_TOTAL_PAGINA if isinstance(corpo.get(c), int)), None)
+    itens = [_sem_blobs(c) for c in normalizacao.normalizar("chamado", itens)]
+    if total is None: total = (numero - 1) * tamanho + len(itens)
+    return 200, Pagina(itens, numero, tamanho, total, "servidor")
+
+def listar_chamados_pagina(escopo: str = "todos", numero: int = 1, tamanho: int = 25, ordenar: str = "id_chamado",
+                           decrescente: bool = True, filtros: Optional[Dict[str, Any]] = None) -> tuple[bool, Any]:
+    """
+    Uma página da lista do escopo, já filtrada (termo, status, prioridade, categoria = id) e
+    ordenada pelo campo `ordenar`. Usa a paginação do servidor quando a API oferece; senão
+    recorre à lista completa. Retorna (True, Pagina) ou (False, mensagem).
+    """
+    if not AUTH_TOKEN: return False, "Não autenticado."
+    filtros = filtros or {}
+    numero = max(1, numero)
     try:
-        print(f"--- DEBUG: Tentando buscar ID {chamado_id} direto na API ---")
-        resp = requests.get(f"{API_BASE_URL}/api/chamados/{chamado_id}", headers=_get_headers(), timeout=10)
-        if resp.status_code == 200:
-            candidato_detalhe = _normalizar_dados(resp.json())
-            if candidato_detalhe.get("anexos"):
-                print("--- DEBUG: Anexos encontrados na rota direta! ---")
-                return candidato_detalhe
-            else:
-                print("--- DEBUG: Rota direta veio SEM anexos. Tentando fallback... ---")
-    except Exception as e:
-        print(f"--- DEBUG: Erro na rota direta: {e}")
+        if paginacao_no_servidor(escopo) is not False:
+            status, resultado = _pagina_do_servidor(escopo, numero, tamanho, ordenar, decrescente, filtros)
+            if isinstance(resultado, Pagina):
+                _registrar_paginacao(escopo, True)
+                return True, resultado
+            if isinstance(resultado, list):
+                # A API devolveu a lista inteira: é a própria lista completa, só falta fatiar
+                _registrar_paginacao(escopo, False)
+                return True, _paginar_local(resultado, numero, tamanho, ordenar, decrescente, filtros)
+            # 400/422: a API não conhece os parâmetros; 200 sem envelope reconhecível: idem
+            if status not in (200, 400, 422): return False, f"Erro {status}"
+            _registrar_paginacao(escopo, False)
 
-    print("--- DEBUG: Ativando busca na lista (Fallback) ---")
-    user_role = CURRENT_USER.get("role") if CURRENT_USER else "colaborador"
-    
-    if user_role in ["admin", "tecnico"]: 
-        sucesso, lista = listar_todos_chamados()
-    else: 
-        sucesso, lista = listar_meus_chamados()
-
-    if sucesso and lista:
-        for c in lista:
-            if str(c.get("id_chamado")) == str(chamado_id):
-                if c.get("anexos") or not candidato_detalhe:
-                    print(f"--- DEBUG: Chamado encontrado na lista! Anexos: {len(c.get('anexos', []))} ---")
-                    return c
-    
-    return candidato_detalhe
+        status, dados = buscar_chamados_condicional(escopo)
+        if status not in (200, 304): return False, f"Erro {status}"
+        return True, _paginar_local(dados, numero, tamanho, ordenar, decrescente, filtros)
+    except Exception as e: return False, str(e)
+
+# Lista de anexos de um chamado, se a API ganhar a rota (ex.: "/api/chamados/{id_chamado}/anexos")
+ROTA_ANEXOS_CHAMADO: Optional[str] = None
+
+def buscar_chamado(chamado_id) -> tuple[int, Any]:
+    """Rota direta /api/chamados/{id}. Retorna (status, chamado normalizado); status 0 = sem conexão."""
+    if not AUTH_TOKEN: return 401, None
+    try:
+        resp = _http().get(f"{API_BASE_URL}/api/chamados/{chamado_id}", headers=_get_headers(), timeout=10)
+        if resp.status_code != 200: return resp.status_code, None
+        return 200, normalizacao.normalizar("chamado", resp.json())
+    except RequestException as e:
+        logging.error(f"Erro na rota direta do chamado {chamado_id}: {e}")
+        return 0, None
+
+def listar_anexos_chamado(chamado_id) -> tuple[bool, Any]:
+    """Referências dos anexos de um chamado pela rota dedicada (ROTA_ANEXOS_CHAMADO)."""
+    if not ROTA_ANEXOS_CHAMADO: return False, "Rota de anexos indisponível."
+    if not AUTH_TOKEN: return False, "Não autenticado."
+    try:
+        resp = _http().get(f"{API_BASE_URL}{ROTA_ANEXOS_CHAMADO.format(id_chamado=chamado_id)}", headers=_get_headers(), timeout=15)
+        if resp.status_code != 200: return False, f"Erro {resp.status_code}"
+        anexos = normalizacao.normalizar("anexo", resp.json())
+        return True, _sem_blobs({"anexos": anexos if isinstance(anexos, list) else []}, chamado_id)["anexos"]
+    except Exception as e: return False, f"Erro: {e}"
+
+def obter_chamado_por_id(chamado_id):
+    """Detalhe do chamado só pela rota direta. Réplica local e rota de anexos ficam em detalhe_chamado."""
+    status, chamado = buscar_chamado(chamado_id)
+    return chamado if status == 200 else None
 
 def criar_novo_chamado(titulo, descricao, categoria, urgencia, caminhos_anexos=None):
     if not AUTH_TOKEN: return False, "Não autenticado."
@@ -191,9 +560,10 @@ def criar_novo_chamado(titulo, descricao, categoria, urgencia, caminhos_anexos=N
     payload = {"titulo": titulo, "descricao": descricao, "id_categoria": cat_id, "urgencia": urgencia_api, "anexos": lista_anexos_payload}
 
     try:
-        response = requests.post(f"{API_BASE_URL}/api/chamados", json=payload, headers=_get_headers(), timeout=60)
+        response = _escrever("criar_chamado", "POST", "/api/chamados", payload, timeout=60)
+        if response is None: return True, MSG_ENFILEIRADO
         if response.status_code == 201:
-            dados = _normalizar_dados(response.json())
+            dados = normalizacao.normalizar("chamado", response.json())
             ia = dados.get("resolucaoia_sugerida")
             if not ia: ia = "Sugestão não retornada pela API."
             return True, f"Chamado Criado!\nID: {dados.get('id_chamado')}\n\nIA: {ia}"
@@ -203,7 +573,8 @@ def criar_novo_chamado(titulo, descricao, categoria, urgencia, caminhos_anexos=N
 def atualizar_status_chamado(chamado_id, novo_status):
     if not AUTH_TOKEN: return False, "Não autenticado."
     try:
-        resp = requests.put(f"{API_BASE_URL}/api/chamados/{chamado_id}", json={"status": novo_status}, headers=_get_headers(), timeout=10)
+        resp = _escrever("status", "PUT", f"/api/chamados/{chamado_id}", {"status": novo_status}, timeout=10)
+        if resp is None: return True, MSG_ENFILEIRADO
         if resp.status_code == 200: return True, "Status atualizado!"
         return False, f"Erro {resp.status_code}"
     except Exception as e: return False, f"Erro: {e}"
@@ -211,7 +582,8 @@ def atualizar_status_chamado(chamado_id, novo_status):
 def atribuir_chamado(chamado_id: int, tecnico_id: int) -> tuple[bool, str]:
     if not AUTH_TOKEN: return False, "Não autenticado."
     try:
-        resp = requests.put(f"{API_BASE_URL}/api/chamados/{chamado_id}/atribuir", json={"idTecnico": tecnico_id}, headers=_get_headers(), timeout=15)
+        resp = _http().put(f"{API_BASE_URL}/api/chamados/{chamado_id}/atribuir", json={"idTecnico": tecnico_id}, headers=_get_headers(), timeout=15)
+        voo_unico.invalidar()
         if resp.status_code == 200: return True, "Chamado atribuído."
         return False, f"Falha ({resp.status_code})"
     except Exception as e: return False, f"Erro: {e}"
@@ -219,33 +591,55 @@ def atribuir_chamado(chamado_id: int, tecnico_id: int) -> tuple[bool, str]:
 def listar_comentarios(chamado_id):
     if not AUTH_TOKEN: return False, "Não autenticado."
     try:
-        resp = requests.get(f"{API_BASE_URL}/api/chamados/{chamado_id}/comentarios", headers=_get_headers(), timeout=15)
-        if resp.status_code == 200: return True, _normalizar_dados(resp.json())
-        return False, f"Erro {resp.status_code}"
+        status, dados = _get_condicional(f"/api/chamados/{chamado_id}/comentarios", timeout=15, tipo="comentario")
+        if status == 200: armazenamento_local.salvar_comentarios(chamado_id, dados)
+        if status in (200, 304): return True, dados
+        return False, f"Erro {status}"
+    except RequestException as e:
+        locais = armazenamento_local.carregar_comentarios(chamado_id)
+        if locais: return True, locais
+        return False, f"Erro: {e}"
     except Exception as e: return False, f"Erro: {e}"
 
 def enviar_comentario(chamado_id, texto):
     if not AUTH_TOKEN: return False, "Não autenticado."
     try:
-        resp = requests.post(f"{API_BASE_URL}/api/chamados/{chamado_id}/comentarios", json={"comentario": texto}, headers=_get_headers(), timeout=15)
+        resp = _escrever("comentario", "POST", f"/api/chamados/{chamado_id}/comentarios", {"comentario": texto}, timeout=15)
+        if resp is None: return True, {"comentario": texto, "pendente": True}
         # CORRIGIDO: mudado de response.json() para resp.json()
-        if resp.status_code == 201: return True, _normalizar_dados(resp.json())
+        if resp.status_code == 201: return True, normalizacao.normalizar("comentario", resp.json())
         return False, f"Erro {resp.status_code}"
     except Exception as e: return False, f"Erro: {e}"
 
+def comentarios_pendentes(chamado_id) -> List[Dict]:
+    """Comentários deste chamado que ainda estão na fila de envio, no formato de um comentário normalizado."""
+    caminho = f"/api/chamados/{chamado_id}/comentarios"
+    meu_id = (CURRENT_USER or {}).get("id")
+    return [
+        {"comentario": (item["requisicao"].get("corpo") or {}).get("comentario"), "id_usuario": meu_id, "pendente": True}
+        for item in armazenamento_local.listar_fila()
+        if item["tipo"] == "comentario" and item["requisicao"].get("caminho") == caminho
+    ]
+
 def listar_usuarios() -> tuple[bool, str | List[Dict]]:
     if not AUTH_TOKEN: return False, "Não autenticado."
     try:
-        resp = requests.get(f"{API_BASE_URL}/api/usuarios", headers=_get_headers(), timeout=20)
-        if resp.status_code == 200: return True, _normalizar_dados(resp.json())
-        if resp.status_code == 403: return False, "Acesso negado."
-        return False, f"Erro {resp.status_code}"
+        status, dados = _get_condicional("/api/usuarios", timeout=20, tipo="usuario")
+        if status == 200: armazenamento_local.salvar_usuarios(dados)
+        if status in (200, 304): return True, dados
+        if status == 403: return False, "Acesso negado."
+        return False, f"Erro {status}"
+    except RequestException as e:
+        locais = armazenamento_local.carregar_usuarios()
+        if locais: return True, locais
+        return False, str(e)
     except Exception as e: return False, str(e)
 
 def atualizar_usuario(user_id: str, nome: str, id_perfil: int, ativo: bool) -> tuple[bool, str]:
     if not AUTH_TOKEN: return False, "Não autenticado."
     try:
-        resp = requests.put(f"{API_BASE_URL}/api/usuarios/{user_id}", json={"nome_completo": nome, "id_perfil": id_perfil, "ativo": ativo}, headers=_get_headers(), timeout=15)
+        resp = _http().put(f"{API_BASE_URL}/api/usuarios/{user_id}", json={"nome_completo": nome, "id_perfil": id_perfil, "ativo": ativo}, headers=_get_headers(), timeout=15)
+        voo_unico.invalidar()
         if resp.status_code == 200: return True, "Atualizado!"
         return False, f"Erro {resp.status_code}"
     except Exception as e: return False, f"Erro: {e}"
@@ -253,7 +647,8 @@ def atualizar_usuario(user_id: str, nome: str, id_perfil: int, ativo: bool) -> t
 def inativar_usuario(user_id: str) -> tuple[bool, str]:
     if not AUTH_TOKEN: return False, "Não autenticado."
     try:
-        resp = requests.delete(f"{API_BASE_URL}/api/usuarios/{user_id}", headers=_get_headers(), timeout=15)
+        resp = _http().delete(f"{API_BASE_URL}/api/usuarios/{user_id}", headers=_get_headers(), timeout=15)
+        voo_unico.invalidar()
         if resp.status_code == 200: return True, "Inativado!"
         return False, f"Erro {resp.status_code}"
     except Exception as e: return False, f"Erro: {e}"
@@ -261,27 +656,34 @@ def inativar_usuario(user_id: str) -> tuple[bool, str]:
 def obter_relatorio_gerencial(data_inicio=None, data_fim=None) -> tuple[bool, Dict]:
     if not AUTH_TOKEN: return False, "Não autenticado."
     try:
-        resp = requests.get(f"{API_BASE_URL}/api/relatorios/chamados", headers=_get_headers(), params={"dataInicio": data_inicio, "dataFim": data_fim}, timeout=20)
-        if resp.status_code == 200: return True, _normalizar_dados(resp.json())
+        resp = _http().get(f"{API_BASE_URL}/api/relatorios/chamados", headers=_get_headers(), params={"dataInicio": data_inicio, "dataFim": data_fim}, timeout=20)
+        if resp.status_code == 200: return True, normalizacao.normalizar("relatorio", resp.json())
         return False, f"Erro: {resp.status_code}"
     except Exception as e: return False, f"Erro: {e}"
 
 def listar_artigos(termo=None, categoria_id=None):
     if not AUTH_TOKEN: return False, "Não autenticado."
     try:
-        resp = requests.get(f"{API_BASE_URL}/api/artigos", headers=_get_headers(), params={"termo": termo, "categoria": categoria_id}, timeout=15)
-        if resp.status_code == 200: return True, _normalizar_dados(resp.json())
-        return False, f"Erro {resp.status_code}"
+        status, dados = _get_condicional("/api/artigos", params={"termo": termo, "categoria": categoria_id}, timeout=15, tipo="artigo")
+        if status == 200 and not termo: armazenamento_local.salvar_artigos(dados)
+        if status in (200, 304): return True, dados
+        return False, f"Erro {status}"
+    except RequestException as e:
+        # Offline: só a listagem completa pode ser respondida pelo disco
+        locais = armazenamento_local.carregar_artigos(categoria_id) if not termo else []
+        if locais: return True, locais
+        return False, f"Erro: {e}"
     except Exception as e: return False, f"Erro: {e}"
 
 def obter_artigo(artigo_id):
     if not AUTH_TOKEN: return None
     try:
-        resp = requests.get(f"{API_BASE_URL}/api/artigos/{artigo_id}", headers=_get_headers(), timeout=15)
-        if resp.status_code == 200: return _normalizar_dados(resp.json())
+        resp = _http().get(f"{API_BASE_URL}/api/artigos/{artigo_id}", headers=_get_headers(), timeout=15)
+        if resp.status_code == 200: return normalizacao.normalizar("artigo", resp.json())
         return None
+    except RequestException: return armazenamento_local.obter_artigo(artigo_id)
     except: return None
 
 def health_check():
-    try: return requests.get(f"{API_BASE_URL}/", timeout=5).status_code == 200
+    try: return _http().get(f"{API_BASE_URL}/", timeout=5).status_code == 200
     except: return False
\ No newline at end of file
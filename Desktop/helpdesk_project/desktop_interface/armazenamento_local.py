@@ -0,0 +1,298 @@
+import sqlite3
+import threading
+import logging
+import json
+import time
+import sys
+import os
+from typing import Optional, Dict, Any, List, Iterable
+
+# ----------------------------------------------------------------------
+# CACHE PERSISTENTE EM DISCO (SQLite em modo WAL)
+# ----------------------------------------------------------------------
+# Um arquivo por usuário, guardando os registros já normalizados.
+# Falhas de disco nunca derrubam a interface: as funções registram o erro e seguem.
+
+_CONN: Optional[sqlite3.Connection] = None
+_CAMINHO: Optional[str] = None
+_LOCK = threading.RLock()
+
+_ESQUEMA = """
+CREATE TABLE IF NOT EXISTS chamados (
+    escopo TEXT NOT NULL,
+    id TEXT NOT NULL,
+    status TEXT,
+    id_categoria INTEGER,
+    prioridade TEXT,
+    data_abertura TEXT,
+    json TEXT NOT NULL,
+    PRIMARY KEY (escopo, id)
+);
+CREATE INDEX IF NOT EXISTS idx_chamados_status ON chamados (escopo, status);
+CREATE INDEX IF NOT EXISTS idx_chamados_categoria ON chamados (escopo, id_categoria);
+CREATE INDEX IF NOT EXISTS idx_chamados_prioridade ON chamados (escopo, prioridade);
+CREATE INDEX IF NOT EXISTS idx_chamados_data ON chamados (escopo, data_abertura);
+
+CREATE TABLE IF NOT EXISTS comentarios (
+    id_chamado TEXT NOT NULL,
+    ordem INTEGER NOT NULL,
+    data_hora TEXT,
+    json TEXT NOT NULL,
+    PRIMARY KEY (id_chamado, ordem)
+);
+
+CREATE TABLE IF NOT EXISTS artigos (
+    id TEXT PRIMARY KEY,
+    id_categoria INTEGER,
+    titulo TEXT,
+    json TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_artigos_categoria ON artigos (id_categoria);
+
+CREATE TABLE IF NOT EXISTS usuarios (
+    id TEXT PRIMARY KEY,
+    id_perfil INTEGER,
+    ativo INTEGER,
+    json TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS meta (
+    chave TEXT PRIMARY KEY,
+    valor TEXT
+);
+
+CREATE TABLE IF NOT EXISTS fila_envio (
+    chave TEXT PRIMARY KEY,
+    tipo TEXT NOT NULL,
+    requisicao TEXT NOT NULL,
+    criado_em REAL NOT NULL,
+    tentativas INTEGER NOT NULL DEFAULT 0,
+    ultimo_erro TEXT,
+    recusada INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+
+def pasta_cache() -> str:
+    """Pasta de dados locais do app (LOCALAPPDATA no Windows, ~/.cache nos demais)."""
+    base = os.environ.get("HELPDESK_CACHE_DIR")
+    if not base:
+        if sys.platform.startswith("win"):
+            base = os.path.join(os.environ.get("LOCALAPPDATA") or os.path.expanduser("~"), "HelpDeskIA")
+        else:
+            base = os.path.join(os.path.expanduser("~"), ".cache", "helpdesk_ia")
+    os.makedirs(base, exist_ok=True)
+    return base
+
+
+def abrir(usuario_id: Any) -> bool:
+    """Abre (ou cria) o banco local do usuário logado."""
+    global _CONN, _CAMINHO
+    nome = "".join(ch for ch in str(usuario_id or "anonimo") if ch.isalnum() or ch in "-_") or "anonimo"
+    caminho = os.path.join(pasta_cache(), f"helpdesk_{nome}.db")
+
+    with _LOCK:
+        if _CONN is not None and _CAMINHO == caminho: return True
+        fechar()
+        try:
+            conn = sqlite3.connect(caminho, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_ESQUEMA)
+            colunas = {linha[1] for linha in conn.execute("PRAGMA table_info(fila_envio)")}
+            if "recusada" not in colunas:  # bancos criados antes da coluna existir
+                conn.execute("ALTER TABLE fila_envio ADD COLUMN recusada INTEGER NOT NULL DEFAULT 0")
+            conn.commit()
+            _CONN, _CAMINHO = conn, caminho
+            return True
+        except sqlite3.Error as e:
+            logging.error(f"Cache local indisponível ({caminho}): {e}")
+            return False
+
+
+def fechar():
+    global _CONN, _CAMINHO
+    with _LOCK:
+        if _CONN is not None:
+            try: _CONN.close()
+            except sqlite3.Error: pass
+        _CONN, _CAMINHO = None, None
+
+
+def aberto() -> bool:
+    return _CONN is not None
+
+
+def _executar(func, padrao=None):
+    """Roda func(conn) sob o lock, com commit; em erro devolve o padrão."""
+    with _LOCK:
+        if _CONN is None: return padrao
+        try:
+            resultado = func(_CONN)
+            _CONN.commit()
+            return resultado
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logging.error(f"Erro no cache local: {e}")
+            try: _CONN.rollback()
+            except sqlite3.Error: pass
+            return padrao
+
+
+def id_registro(registro: Dict[str, Any], *campos: str) -> Optional[str]:
+    """Primeiro id presente entre os campos, como texto; None se não houver. O id 0 é válido."""
+    for campo in campos:
+        valor = registro.get(campo)
+        if valor is not None and valor != "": return str(valor)
+    return None
+
+
+def _para_json(registro: Any) -> str:
+    return json.dumps(registro, ensure_ascii=False, default=str)
+
+
+# --- CHAMADOS ---
+def salvar_chamados(escopo: str, chamados: Iterable[Dict[str, Any]], removidos: Iterable[str] = (), substituir: bool = False):
+    """Grava (upsert) chamados do escopo. Com substituir=True apaga antes os que não vierem na lista."""
+    linhas = [
+        (escopo, ident, str(c.get("status") or "").lower(), c.get("id_categoria"),
+         str(c.get("prioridade") or "").lower(), str(c.get("data_abertura") or "")[:19], _para_json(c))
+        for c in chamados for ident in [id_registro(c, "id_chamado", "id")] if ident is not None
+    ]
+    removidos = [(escopo, str(r)) for r in removidos]
+
+    def op(conn):
+        if substituir: conn.execute("DELETE FROM chamados WHERE escopo = ?", (escopo,))
+        if removidos: conn.executemany("DELETE FROM chamados WHERE escopo = ? AND id = ?", removidos)
+        conn.executemany(
+            "INSERT OR REPLACE INTO chamados (escopo, id, status, id_categoria, prioridade, data_abertura, json) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            linhas,
+        )
+    _executar(op)
+
+
+def carregar_chamados(escopo: str, status: Optional[str] = None, id_categoria: Optional[int] = None) -> List[Dict[str, Any]]:
+    sql = "SELECT json FROM chamados WHERE escopo = ?"
+    args: List[Any] = [escopo]
+    if status:
+        sql += " AND status = ?"; args.append(status.lower())
+    if id_categoria is not None:
+        sql += " AND id_categoria = ?"; args.append(id_categoria)
+    sql += " ORDER BY data_abertura DESC"
+    return _executar(lambda conn: [json.loads(r[0]) for r in conn.execute(sql, args)], padrao=[])
+
+
+# --- COMENTÁRIOS ---
+def salvar_comentarios(id_chamado: Any, comentarios: List[Dict[str, Any]]):
+    cid = str(id_chamado)
+    linhas = [(cid, i, str(c.get("data_hora") or ""), _para_json(c)) for i, c in enumerate(comentarios)]
+
+    def op(conn):
+        conn.execute("DELETE FROM comentarios WHERE id_chamado = ?", (cid,))
+        conn.executemany("INSERT INTO comentarios (id_chamado, ordem, data_hora, json) VALUES (?, ?, ?, ?)", linhas)
+    _executar(op)
+
+
+def carregar_comentarios(id_chamado: Any) -> List[Dict[str, Any]]:
+    sql = "SELECT json FROM comentarios WHERE id_chamado = ? ORDER BY ordem"
+    return _executar(lambda conn: [json.loads(r[0]) for r in conn.execute(sql, (str(id_chamado),))], padrao=[])
+
+
+# --- ARTIGOS ---
+def salvar_artigos(artigos: List[Dict[str, Any]]):
+    linhas = [
+        (ident, a.get("id_categoria"), a.get("titulo"), _para_json(a))
+        for a in artigos for ident in [id_registro(a, "id_artigo", "id")] if ident is not None
+    ]
+    _executar(lambda conn: conn.executemany("INSERT OR REPLACE INTO artigos (id, id_categoria, titulo, json) VALUES (?, ?, ?, ?)", linhas))
+
+
+def carregar_artigos(id_categoria: Optional[int] = None) -> List[Dict[str, Any]]:
+    if id_categoria is None:
+        sql, args = "SELECT json FROM artigos ORDER BY titulo", ()
+    else:
+        sql, args = "SELECT json FROM artigos WHERE id_categoria = ? ORDER BY titulo", (id_categoria,)
+    return _executar(lambda conn: [json.loads(r[0]) for r in conn.execute(sql, args)], padrao=[])
+
+
+def obter_artigo(artigo_id: Any) -> Optional[Dict[str, Any]]:
+    def op(conn):
+        linha = conn.execute("SELECT json FROM artigos WHERE id = ?", (str(artigo_id),)).fetchone()
+        return json.loads(linha[0]) if linha else None
+    return _executar(op)
+
+
+# --- USUÁRIOS ---
+def salvar_usuarios(usuarios: List[Dict[str, Any]]):
+    linhas = [
+        (ident, u.get("id_perfil"), 1 if u.get("ativo", True) else 0, _para_json(u))
+        for u in usuarios for ident in [id_registro(u, "id", "id_usuario")] if ident is not None
+    ]
+
+    def op(conn):
+        conn.execute("DELETE FROM usuarios")
+        conn.executemany("INSERT INTO usuarios (id, id_perfil, ativo, json) VALUES (?, ?, ?, ?)", linhas)
+    _executar(op)
+
+
+def carregar_usuarios() -> List[Dict[str, Any]]:
+    return _executar(lambda conn: [json.loads(r[0]) for r in conn.execute("SELECT json FROM usuarios")], padrao=[])
+
+
+# --- METADADOS (marcas d'água, versões) ---
+def ler_meta(chave: str, padrao: Optional[str] = None) -> Optional[str]:
+    def op(conn):
+        linha = conn.execute("SELECT valor FROM meta WHERE chave = ?", (chave,)).fetchone()
+        return linha[0] if linha else padrao
+    return _executar(op, padrao=padrao)
+
+
+def gravar_meta(chave: str, valor: Any):
+    _executar(lambda conn: conn.execute("INSERT OR REPLACE INTO meta (chave, valor) VALUES (?, ?)", (chave, str(valor))))
+
+
+# --- FILA DE ENVIO (OUTBOX) ---
+def enfileirar(chave: str, tipo: str, requisicao: Dict[str, Any]) -> bool:
+    """Grava uma escrita pendente ANTES de enviá-la. Retorna False se o disco não estiver disponível."""
+    def op(conn):
+        conn.execute(
+            "INSERT OR REPLACE INTO fila_envio (chave, tipo, requisicao, criado_em) VALUES (?, ?, ?, ?)",
+            (chave, tipo, _para_json(requisicao), time.time()),
+        )
+        return True
+    return bool(_executar(op, padrao=False))
+
+
+def listar_fila() -> List[Dict[str, Any]]:
+    """Escritas ainda a enviar, na ordem em que foram feitas (as recusadas pela API ficam de fora)."""
+    def op(conn):
+        linhas = conn.execute("SELECT chave, tipo, requisicao, tentativas FROM fila_envio WHERE recusada = 0 ORDER BY criado_em")
+        return [{"chave": c, "tipo": t, "requisicao": json.loads(r), "tentativas": n} for c, t, r, n in linhas]
+    return _executar(op, padrao=[])
+
+
+def remover_da_fila(chave: str):
+    _executar(lambda conn: conn.execute("DELETE FROM fila_envio WHERE chave = ?", (chave,)))
+
+
+def registrar_falha_fila(chave: str, erro: str):
+    _executar(lambda conn: conn.execute("UPDATE fila_envio SET tentativas = tentativas + 1, ultimo_erro = ? WHERE chave = ?", (erro, chave)))
+
+
+def marcar_recusada_fila(chave: str, erro: str):
+    """A API rejeitou a escrita de vez (4xx): sai do reenvio, mas fica guardada para o usuário ver."""
+    _executar(lambda conn: conn.execute("UPDATE fila_envio SET recusada = 1, ultimo_erro = ? WHERE chave = ?", (erro, chave)))
+
+
+def listar_recusadas_fila() -> List[Dict[str, Any]]:
+    def op(conn):
+        linhas = conn.execute("SELECT chave, tipo, requisicao, ultimo_erro FROM fila_envio WHERE recusada = 1 ORDER BY criado_em")
+        return [{"chave": c, "tipo": t, "requisicao": json.loads(r), "erro": e} for c, t, r, e in linhas]
+    return _executar(op, padrao=[])
+
+
+def contar_fila() -> int:
+    return _executar(lambda conn: conn.execute("SELECT COUNT(*) FROM fila_envio WHERE recusada = 0").fetchone()[0], padrao=0)
+
+
+def contar_recusadas_fila() -> int:
+    return _executar(lambda conn: conn.execute("SELECT COUNT(*) FROM fila_envio WHERE recusada = 1").fetchone()[0], padrao=0)
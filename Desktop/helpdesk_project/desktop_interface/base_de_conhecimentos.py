@@ -1,6 +1,5 @@
 import customtkinter as ctk
 from tkinter import messagebox
-import threading
 import sys
 import os
 import math
@@ -12,8 +11,14 @@ if parent_dir not in sys.path: sys.path.append(parent_dir)
 
 try:
     from desktop_interface import api_client
+    from desktop_interface import pool_tarefas
+    from desktop_interface import filtro_assincrono
+    from desktop_interface import busca_artigos
 except ImportError:
     import api_client
+    import pool_tarefas
+    import filtro_assincrono
+    import busca_artigos
 
 from desktop_interface.exibir_artigo import exibir_artigo_func
 
@@ -39,6 +44,8 @@ def mostrar_base_conhecimento(conteudo_frame, user):
     # Variáveis de Estado
     state = {
         "artigos_originais": [], 
+        "motor": None,  # busca_artigos.MotorBusca (índice BM25 dos artigos)
+        "filtrados": [],
         "pagina_atual": 1,
         "total_paginas": 1,
         "categoria_atual": "Todos",
@@ -152,38 +159,35 @@ def mostrar_base_conhecimento(conteudo_frame, user):
     def carregar_dados_iniciais():
         if not api_client.AUTH_TOKEN: return
         sucesso, dados = api_client.listar_artigos()
+        # Índice montado (ou lido do disco, se os artigos não mudaram) aqui fora da thread da interface
+        motor = busca_artigos.motor_para(dados) if sucesso else None
         
         # [SEGURANÇA] Verifica se o frame ainda existe antes de chamar o callback
         if conteudo_frame.winfo_exists():
-            conteudo_frame.after(0, lambda: processar_carga(sucesso, dados))
+            conteudo_frame.after(0, lambda: processar_carga(sucesso, dados, motor))
 
-    def processar_carga(sucesso, dados):
+    def processar_carga(sucesso, dados, motor):
         if sucesso:
             state["artigos_originais"] = dados
-            filtrar_e_renderizar()
+            state["motor"] = motor
+            filtrar_e_renderizar(imediato=True)
         else:
             # [SEGURANÇA] Verifica janela antes de mostrar erro
             if conteudo_frame.winfo_exists():
                 messagebox.showerror("Erro", "Falha ao carregar artigos.")
 
-    def filtrar_e_renderizar():
-        # Filtra localmente
-        termo = state["termo_busca"].lower().strip()
-        cat_nome = state["categoria_atual"]
-        cat_id = MAPA_CATEGORIA_FILTRO.get(cat_nome)
-
-        filtrados = []
-        for art in state["artigos_originais"]:
-            if cat_id is not None and art.get("id_categoria") != cat_id:
-                continue
-            
-            t_art = str(art.get("titulo", "")).lower()
-            c_art = str(art.get("conteudo", "")).lower()
-            if termo and (termo not in t_art and termo not in c_art):
-                continue
-                
-            filtrados.append(art)
+    def filtrar_artigos(consulta, cancelada):
+        # Roda no pool; desiste se o usuário já digitou outra coisa. Com termo, do mais relevante ao menos
+        motor, termo, cat_id = consulta
+        if motor is None: return []
+        return motor.buscar(termo, cat_id, cancelada=cancelada)
 
+    def filtrar_e_renderizar(imediato=False):
+        # Só anota a consulta: o filtro roda fora da thread da interface quando a digitação pausa
+        cat_id = MAPA_CATEGORIA_FILTRO.get(state["categoria_atual"])
+        filtro.pedir((state["motor"], state["termo_busca"], cat_id), imediato=imediato)
+
+    def exibir_filtrados(filtrados):
         state["filtrados"] = filtrados
         state["pagina_atual"] = 1
         
@@ -244,7 +248,9 @@ def mostrar_base_conhecimento(conteudo_frame, user):
                     btn.configure(fg_color="#009E7F", text_color="white", border_width=0)
                 else:
                     btn.configure(fg_color="white", text_color="#333", border_width=1, border_color="#CBD5E1")
-        filtrar_e_renderizar()
+        filtrar_e_renderizar(imediato=True)
+
+    filtro = filtro_assincrono.FiltroAssincrono(grid_frame, filtrar_artigos, exibir_filtrados)
 
     for cat in categorias:
         btn = ctk.CTkButton(
@@ -258,4 +264,4 @@ def mostrar_base_conhecimento(conteudo_frame, user):
 
     termo_busca_var.trace_add("write", lambda *a: ao_buscar())
     selecionar_categoria("Todos") 
-    threading.Thread(target=carregar_dados_iniciais, daemon=True).start()
\ No newline at end of file
+    pool_tarefas.enviar(carregar_dados_iniciais, dono=grid_frame)
\ No newline at end of file
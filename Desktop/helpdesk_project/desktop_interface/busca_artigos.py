@@ -0,0 +1,399 @@
+import bisect
+import hashlib
+import json
+import math
+import re
+import threading
+import time
+import logging
+import sys
+import os
+from collections import Counter
+from typing import Any, Callable, Dict, List, Optional
+
+# --- CONFIGURAÇÃO DE PATH ---
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path: sys.path.append(parent_dir)
+
+try:
+    from desktop_interface import api_client
+    from desktop_interface import armazenamento_local
+except ImportError:
+    import api_client
+    import armazenamento_local
+
+# ----------------------------------------------------------------------
+# BUSCA LOCAL NA BASE DE CONHECIMENTO (BM25)
+# ----------------------------------------------------------------------
+# A tela da base filtrava por trecho (título/conteúdo) percorrendo todos os artigos, e
+# a criação de chamado pedia /api/artigos?termo= a cada pausa na digitação. Aqui os
+# artigos de listar_artigos() viram um índice invertido:
+#   - texto em minúsculas, sem acentos, sem palavras vazias ("de", "o", "para"...);
+#   - cada palavra reduzida ao radical ("impressoras", "impressora" -> "impressor");
+#   - título, palavras-chave e conteúdo com pesos diferentes (BM25F simplificado).
+# A nota BM25 de cada (radical, artigo) já é calculada na montagem: uma consulta só
+# soma as notas dos radicais digitados e ordena. A última palavra, ainda sendo
+# digitada, também casa com os radicais que começam por ela ("impre" -> "impressor").
+# Consulta sem nenhuma palavra indexável ("s", "se", "como", no começo da digitação) é
+# respondida como o filtro antigo: por trecho do texto, na ordem original.
+#
+# O índice é gravado nos metadados do usuário junto com uma assinatura dos artigos:
+# na próxima sessão, se os artigos não mudaram, ele é lido do disco em vez de refeito.
+
+PESOS_CAMPOS = {"titulo": 3.0, "palavraschave": 2.0, "conteudo": 1.0}
+K1 = 1.2
+B = 0.75
+# Radicais considerados para a palavra incompleta (os mais curtos primeiro) e o desconto
+# de quem só começa por ela, para não passar à frente de quem casa com a palavra inteira
+MAX_EXPANSOES = 20
+PESO_EXPANSAO = 0.5
+# Palavra incompleta mais curta que isso (ou vazia), sozinha na consulta: busca por trecho
+MIN_PREFIXO = 3
+VERSAO_INDICE = 1
+CHAVE_META = "indice_artigos"
+
+_PALAVRA = re.compile(r"\w+")
+_SEM_ACENTO = str.maketrans("áàâãäéèêëíìîïóòôõöúùûüçñ", "aaaaaeeeeiiiiooooouuuucn")
+
+PALAVRAS_VAZIAS = frozenset("""
+    a o e as os um uma uns umas de do da dos das no na nos nas em ao aos por pelo pela pelos
+    pelas para pra com sem que se ou mas mais como nao sim ja esta este esse essa isso isto
+    eu meu minha ele ela eles elas voce ser sao foi tem ter ha sua seu suas seus me te lhe
+""".split())
+
+# Regras de redução, aplicadas sobre o texto já sem acentos: (sufixo, troca, tamanho mínimo do radical)
+_REGRAS_PLURAL = (
+    ("oes", "ao", 2), ("aes", "ao", 2), ("ais", "al", 2), ("eis", "el", 2), ("ois", "ol", 2),
+    ("ns", "m", 2), ("res", "r", 3), ("ses", "s", 3), ("is", "il", 3), ("s", "", 3),
+)
+_REGRAS_SUFIXO = (
+    ("amentos", "", 3), ("imentos", "", 3), ("amento", "", 3), ("imento", "", 3),
+    ("mente", "", 4), ("acao", "", 3), ("icao", "", 3), ("ador", "", 3), ("edor", "", 3),
+    ("idor", "", 3), ("ando", "", 3), ("endo", "", 3), ("indo", "", 3), ("ado", "", 3),
+    ("ido", "", 3), ("cao", "c", 3), ("sao", "s", 3), ("ao", "", 3), ("vel", "", 4), ("or", "", 4),
+    ("ar", "", 3), ("er", "", 3), ("ir", "", 3),
+)
+
+
+def _aplicar_regra(palavra: str, regras) -> str:
+    for sufixo, troca, minimo in regras:
+        if palavra.endswith(sufixo) and len(palavra) - len(sufixo) >= minimo:
+            return palavra[:-len(sufixo)] + troca
+    return palavra
+
+
+_RADICAIS: Dict[str, str] = {}
+
+
+def radical(palavra: str) -> str:
+    """Radical de uma palavra já sem acentos e em minúsculas (plural, sufixo e vogal final)."""
+    r = _RADICAIS.get(palavra)
+    if r is not None: return r
+    r = palavra
+    if len(r) > 3 and not r.isdigit():
+        if not r.endswith("ss"): r = _aplicar_regra(r, _REGRAS_PLURAL)
+        r = _aplicar_regra(r, _REGRAS_SUFIXO)
+        if len(r) > 3 and r[-1] in "aeo": r = r[:-1]
+    if len(_RADICAIS) < 100_000: _RADICAIS[palavra] = r
+    return r
+
+
+def normalizar(texto: Any) -> str:
+    return str(texto or "").lower().translate(_SEM_ACENTO)
+
+
+def palavras(texto: Any) -> List[str]:
+    """Palavras sem acento e sem as vazias, ainda sem reduzir."""
+    return [p for p in _PALAVRA.findall(normalizar(texto)) if len(p) > 1 and p not in PALAVRAS_VAZIAS]
+
+
+def tokenizar(texto: Any) -> List[str]:
+    return [radical(p) for p in palavras(texto)]
+
+
+def _id_artigo(artigo: Dict[str, Any]) -> str:
+    return str(armazenamento_local.id_registro(artigo, "id_artigo", "id"))
+
+
+def assinatura(artigos: List[Dict[str, Any]]) -> str:
+    """Muda se qualquer texto indexado mudar (ou artigos entrarem/saírem)."""
+    h = hashlib.sha1(f"v{VERSAO_INDICE}".encode())
+    for a in artigos:
+        h.update(f"\x1e{_id_artigo(a)}".encode())
+        for campo in PESOS_CAMPOS: h.update(f"\x1f{a.get(campo) or ''}".encode())
+    return h.hexdigest()
+
+
+class MotorBusca:
+    def __init__(self, artigos: List[Dict[str, Any]], notas: Optional[Dict[str, Dict[int, float]]] = None,
+                 assinatura_artigos: Optional[str] = None):
+        self.artigos = list(artigos)
+        self.assinatura = assinatura_artigos or assinatura(self.artigos)
+        # radical -> {posição do artigo: nota BM25}
+        self._notas: Dict[str, Dict[int, float]] = notas if notas is not None else self._montar()
+        self._vocabulario: List[str] = sorted(self._notas)
+        self._textos: Optional[List[str]] = None  # texto normalizado, só para a busca por trecho
+
+    def __len__(self):
+        return len(self.artigos)
+
+    def _montar(self) -> Dict[str, Dict[int, float]]:
+        frequencias: Dict[str, Dict[int, float]] = {}
+        tamanhos: List[float] = []
+        for pos, art in enumerate(self.artigos):
+            tamanho = 0.0
+            for campo, peso in PESOS_CAMPOS.items():
+                # Conta as palavras antes de reduzir: cada palavra distinta passa uma vez pelo radical
+                for p, qtd in Counter(_PALAVRA.findall(normalizar(art.get(campo)))).items():
+                    if len(p) < 2 or p in PALAVRAS_VAZIAS: continue
+                    tamanho += peso * qtd
+                    doc = frequencias.setdefault(radical(p), {})
+                    doc[pos] = doc.get(pos, 0.0) + peso * qtd
+            tamanhos.append(tamanho)
+
+        n = len(self.artigos)
+        media = (sum(tamanhos) / n) if n else 1.0
+        normas = [K1 * (1 - B + B * t / (media or 1.0)) for t in tamanhos]
+        notas: Dict[str, Dict[int, float]] = {}
+        for termo, docs in frequencias.items():
+            idf = math.log(1 + (n - len(docs) + 0.5) / (len(docs) + 0.5))
+            notas[termo] = {pos: idf * tf * (K1 + 1) / (tf + normas[pos]) for pos, tf in docs.items()}
+        return notas
+
+    def _expandir(self, prefixo: str) -> List[str]:
+        i = bisect.bisect_left(self._vocabulario, prefixo)
+        achados = []
+        while i < len(self._vocabulario) and self._vocabulario[i].startswith(prefixo):
+            achados.append(self._vocabulario[i])
+            i += 1
+        achados.sort(key=len)
+        return achados[:MAX_EXPANSOES]
+
+    @staticmethod
+    def _separar(termo: str) -> tuple:
+        """
+        (palavras completas indexáveis, última palavra ainda sendo digitada). A última sai do
+        texto cru, antes do filtro de vazias/curtas: "se" pode ser o começo de "senha".
+        """
+        brutas = _PALAVRA.findall(normalizar(termo))
+        # A última palavra pode estar pela metade, a não ser que o texto termine em espaço
+        incompleta = brutas.pop() if brutas and not termo[-1:].isspace() else None
+        return [p for p in brutas if len(p) > 1 and p not in PALAVRAS_VAZIAS], incompleta
+
+    def _por_trecho(self, trecho: str, cancelada: Optional[Callable[[], bool]] = None) -> Optional[List[int]]:
+        if self._textos is None:
+            self._textos = ["\n".join(normalizar(a.get(campo)) for campo in PESOS_CAMPOS) for a in self.artigos]
+        posicoes = []
+        for pos, texto in enumerate(self._textos):
+            if pos % 500 == 0 and cancelada and cancelada(): return None
+            if trecho in texto: posicoes.append(pos)
+        return posicoes
+
+    def pontuar(self, termo: str, cancelada: Optional[Callable[[], bool]] = None) -> Optional[Dict[int, float]]:
+        """{posição: nota} dos artigos que casam com alguma palavra (None se cancelada)."""
+        lista, incompleta = self._separar(termo)
+
+        notas: Dict[int, float] = {}
+        for r in set(map(radical, lista)):
+            for pos, nota in self._notas.get(r, {}).items(): notas[pos] = notas.get(pos, 0.0) + nota
+        if cancelada and cancelada(): return None
+
+        if incompleta:
+            # A melhor entre o radical exato e os que começam pelo que já foi digitado (sem somar os dois)
+            exato = radical(incompleta) if len(incompleta) > 1 and incompleta not in PALAVRAS_VAZIAS else None
+            melhores: Dict[int, float] = dict(self._notas.get(exato, {})) if exato else {}
+            for r in self._expandir(incompleta):
+                if r == exato: continue
+                for pos, nota in self._notas.get(r, {}).items():
+                    nota *= PESO_EXPANSAO
+                    if nota > melhores.get(pos, 0.0): melhores[pos] = nota
+            for pos, nota in melhores.items(): notas[pos] = notas.get(pos, 0.0) + nota
+        return notas
+
+    def buscar(self, termo: str, id_categoria: Optional[int] = None, limite: Optional[int] = None,
+               cancelada: Optional[Callable[[], bool]] = None) -> Optional[List[Dict[str, Any]]]:
+        """Artigos do mais relevante ao menos; termo vazio = todos na ordem original. None se cancelada."""
+        artigos = self.artigos
+        if not (termo or "").strip():
+            encontrados = [a for a in artigos if id_categoria is None or a.get("id_categoria") == id_categoria]
+            return encontrados[:limite] if limite else encontrados
+
+        completas, incompleta = self._separar(termo)
+        if not completas and (incompleta is None or len(incompleta) < MIN_PREFIXO or incompleta in PALAVRAS_VAZIAS):
+            posicoes = self._por_trecho(normalizar(termo).strip(), cancelada)
+            if posicoes is None: return None
+            encontrados = [artigos[pos] for pos in posicoes
+                           if id_categoria is None or artigos[pos].get("id_categoria") == id_categoria]
+            return encontrados[:limite] if limite else encontrados
+
+        notas = self.pontuar(termo, cancelada)
+        if notas is None: return None
+        if id_categoria is not None:
+            notas = {pos: n for pos, n in notas.items() if artigos[pos].get("id_categoria") == id_categoria}
+        # Empate: ordem original (estável)
+        ordem = sorted(notas, key=lambda pos: (-notas[pos], pos))
+        if limite: ordem = ordem[:limite]
+        return [artigos[pos] for pos in ordem]
+
+    # --- PERSISTÊNCIA ---
+    def serializar(self) -> str:
+        return json.dumps({
+            "versao": VERSAO_INDICE,
+            "assinatura": self.assinatura,
+            "ids": [_id_artigo(a) for a in self.artigos],
+            "notas": {t: [[p, round(n, 4)] for p, n in docs.items()] for t, docs in self._notas.items()},
+        }, separators=(",", ":"))
+
+    @classmethod
+    def desserializar(cls, texto: str, artigos: List[Dict[str, Any]]) -> Optional["MotorBusca"]:
+        """Remonta com os artigos dados; None se o índice gravado não corresponde a eles."""
+        try:
+            dados = json.loads(texto)
+            if dados.get("versao") != VERSAO_INDICE: return None
+            por_id = {_id_artigo(a): a for a in artigos}
+            ordenados = [por_id[i] for i in dados["ids"]]
+            if len(ordenados) != len(por_id) or assinatura(ordenados) != dados["assinatura"]: return None
+            notas = {t: dict(map(tuple, docs)) for t, docs in dados["notas"].items()}
+            return cls(ordenados, notas, dados["assinatura"])
+        except (ValueError, KeyError, TypeError) as e:
+            logging.info(f"Índice de artigos gravado descartado: {e}")
+            return None
+
+
+# ----------------------------------------------------------------------
+# MOTOR DA SESSÃO
+# ----------------------------------------------------------------------
+_MOTOR: Optional[MotorBusca] = None
+_ATUALIZADO = False  # já conferido com uma listagem desta sessão
+_LOCK = threading.Lock()
+_STATS = {"montagens": 0, "do_disco": 0, "reaproveitados": 0, "ms_ultima_montagem": 0.0}
+
+
+def _do_disco(artigos: List[Dict[str, Any]]) -> Optional[MotorBusca]:
+    texto = armazenamento_local.ler_meta(CHAVE_META)
+    return MotorBusca.desserializar(texto, artigos) if texto else None
+
+
+def motor_para(artigos: List[Dict[str, Any]]) -> MotorBusca:
+    """
+    Motor para a lista de artigos vinda de listar_artigos(). Reaproveita o da memória ou o
+    gravado em disco quando os artigos são os mesmos; senão monta e grava. Chamar fora da
+    thread da interface.
+    """
+    global _MOTOR, _ATUALIZADO
+    chave = assinatura(artigos)
+    with _LOCK:
+        if _MOTOR is not None and _MOTOR.assinatura == chave:
+            _STATS["reaproveitados"] += 1
+            _ATUALIZADO = True
+            return _MOTOR
+
+        motor = _do_disco(artigos)
+        if motor is not None and motor.assinatura == chave:
+            _STATS["do_disco"] += 1
+        else:
+            inicio = time.perf_counter()
+            motor = MotorBusca(artigos, assinatura_artigos=chave)
+            ms = (time.perf_counter() - inicio) * 1000
+            _STATS["montagens"] += 1
+            _STATS["ms_ultima_montagem"] = ms
+            logging.info(f"Índice da base de conhecimento: {len(motor)} artigos em {ms:.0f} ms")
+            armazenamento_local.gravar_meta(CHAVE_META, motor.serializar())
+        _MOTOR, _ATUALIZADO = motor, True
+        return motor
+
+
+def sugerir(termo: str, limite: int = 3) -> tuple[bool, Any]:
+    """
+    Artigos mais relevantes para o texto (ex.: título de um chamado novo), sem ir ao servidor
+    a cada consulta: a lista de artigos é conferida uma vez por sessão (GET condicional).
+    """
+    global _MOTOR
+    if not _ATUALIZADO:
+        sucesso, artigos = api_client.listar_artigos()
+        if sucesso: motor_para(artigos)
+        elif _MOTOR is None:
+            # Sem rede e sem índice: o que estiver no disco
+            locais = armazenamento_local.carregar_artigos()
+            if locais:
+                with _LOCK: _MOTOR = _do_disco(locais) or MotorBusca(locais)
+    motor = _MOTOR
+    if motor is None: return False, "Base de conhecimento indisponível."
+    return True, motor.buscar(termo, limite=limite)
+
+
+def limpar():
+    """Esquece o motor em memória (troca de usuário). O índice em disco é por usuário."""
+    global _MOTOR, _ATUALIZADO
+    with _LOCK:
+        _MOTOR, _ATUALIZADO = None, False
+
+
+def estatisticas() -> Dict[str, Any]:
+    with _LOCK:
+        return dict(_STATS)
+
+
+# ----------------------------------------------------------------------
+# MEDIÇÃO (python busca_artigos.py [quantidade])
+# ----------------------------------------------------------------------
+_TITULOS_EXEMPLO = [
+    "Como configurar a impressora de rede", "Impressoras não imprimem em cores", "Redefinir senha do e-mail",
+    "Configuração da VPN no notebook", "Wi-Fi conectado sem acesso à internet", "Instalação do pacote Office",
+    "Computador lento ao iniciar", "Monitor sem sinal de vídeo", "Backup automático dos documentos",
+    "Acesso negado à pasta compartilhada", "Atualização do sistema operacional", "Teclado sem fio não responde",
+]
+_TRECHOS_EXEMPLO = [
+    "Verifique se o cabo está conectado e reinicie o equipamento.", "Abra o painel de controle e selecione dispositivos.",
+    "Solicite ao suporte a liberação do acesso.", "Atualize os drivers pelo gerenciador de dispositivos.",
+    "Confira as credenciais e tente novamente após alguns minutos.", "A configuração pode levar até dez minutos para propagar.",
+]
+
+
+def _artigos_exemplo(qtd: int) -> List[Dict[str, Any]]:
+    import random
+    rnd = random.Random(42)
+    artigos = []
+    for i in range(qtd):
+        titulo = f"{rnd.choice(_TITULOS_EXEMPLO)} ({i})"
+        conteudo = " ".join(rnd.choice(_TRECHOS_EXEMPLO) for _ in range(rnd.randint(8, 30)))
+        artigos.append({"id_artigo": i + 1, "id_categoria": rnd.choice([1, 2, 3, 5]), "titulo": titulo,
+                        "conteudo": conteudo, "palavraschave": rnd.choice(["rede", "senha", "impressora", "hardware", ""])})
+    return artigos
+
+
+def benchmark(qtd: int = 2000):
+    artigos = _artigos_exemplo(qtd)
+    consultas = ["impressora", "configurar vpn", "senha e-mail", "conectado internet", "drivers", "impre"]
+
+    inicio = time.perf_counter()
+    preparados = [(a, str(a["titulo"]).lower(), str(a["conteudo"]).lower()) for a in artigos]
+    for termo in consultas:
+        [a for a, t, c in preparados if termo in t or termo in c]
+    ms_linear = (time.perf_counter() - inicio) * 1000 / len(consultas)
+
+    _RADICAIS.clear()
+    inicio = time.perf_counter()
+    motor = MotorBusca(artigos)
+    ms_montagem = (time.perf_counter() - inicio) * 1000
+
+    inicio = time.perf_counter()
+    for termo in consultas: motor.buscar(termo)
+    ms_busca = (time.perf_counter() - inicio) * 1000 / len(consultas)
+
+    texto = motor.serializar()
+    inicio = time.perf_counter()
+    MotorBusca.desserializar(texto, artigos)
+    ms_disco = (time.perf_counter() - inicio) * 1000
+
+    print(f"{qtd} artigos, {len(motor._vocabulario)} radicais, índice gravado: {len(texto) / 1024:.0f} KiB")
+    print(f"  trecho (filtro antigo, sem ordenar): {ms_linear:7.2f} ms/consulta")
+    print(f"  BM25 (ordenado por relevância):       {ms_busca:7.2f} ms/consulta")
+    print(f"  montagem do índice: {ms_montagem:.0f} ms | leitura do índice gravado: {ms_disco:.0f} ms")
+    for termo in ("impressoras de rede", "configuracao vpn"):
+        print(f"  '{termo}' ->", [a["titulo"] for a in motor.buscar(termo, limite=3)])
+
+
+if __name__ == "__main__":
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
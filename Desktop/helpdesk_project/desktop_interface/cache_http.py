@@ -0,0 +1,77 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Dict, Any
+
+# ----------------------------------------------------------------------
+# CACHE DE RESPOSTAS COM VALIDADORES (ETag / Last-Modified)
+# ----------------------------------------------------------------------
+# Guarda o corpo JÁ NORMALIZADO de cada GET junto com os validadores do servidor.
+# Na próxima visita a requisição vai condicional; um 304 reaproveita o corpo local.
+MAX_ENTRADAS = 64
+
+_ENTRADAS: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_LOCK = threading.Lock()
+_STATS = {"condicionais": 0, "hits_304": 0, "misses": 0}
+
+
+def chave(url: str, params: Optional[Dict[str, Any]] = None, escopo: Any = None) -> str:
+    """Identifica a resposta: URL + parâmetros não nulos + escopo (usuário logado)."""
+    itens = sorted((k, str(v)) for k, v in (params or {}).items() if v is not None)
+    query = "&".join(f"{k}={v}" for k, v in itens)
+    return f"{escopo}|{url}?{query}"
+
+
+def cabecalhos_condicionais(chave_cache: str) -> Dict[str, str]:
+    with _LOCK:
+        entrada = _ENTRADAS.get(chave_cache)
+        if not entrada: return {}
+        headers = {}
+        if entrada.get("etag"): headers["If-None-Match"] = entrada["etag"]
+        if entrada.get("last_modified"): headers["If-Modified-Since"] = entrada["last_modified"]
+        if headers: _STATS["condicionais"] += 1
+        return headers
+
+
+def obter(chave_cache: str) -> Optional[Any]:
+    """Corpo guardado para a chave (usado quando o servidor responde 304)."""
+    with _LOCK:
+        entrada = _ENTRADAS.get(chave_cache)
+        if entrada is None:
+            _STATS["misses"] += 1
+            return None
+        _ENTRADAS.move_to_end(chave_cache)
+        _STATS["hits_304"] += 1
+        return entrada["dados"]
+
+
+def registrar(chave_cache: str, headers: Dict[str, str], dados: Any) -> bool:
+    """Guarda o corpo se o servidor mandou algum validador. Sem validador não há o que reaproveitar."""
+    etag = headers.get("ETag") or headers.get("etag")
+    last_modified = headers.get("Last-Modified") or headers.get("last-modified")
+    if not etag and not last_modified:
+        descartar(chave_cache)
+        return False
+
+    with _LOCK:
+        _ENTRADAS[chave_cache] = {"etag": etag, "last_modified": last_modified, "dados": dados, "gravado_em": time.time()}
+        _ENTRADAS.move_to_end(chave_cache)
+        while len(_ENTRADAS) > MAX_ENTRADAS:
+            _ENTRADAS.popitem(last=False)
+    return True
+
+
+def descartar(chave_cache: str):
+    with _LOCK:
+        _ENTRADAS.pop(chave_cache, None)
+
+
+def limpar():
+    """Esvazia o cache (ex.: troca de usuário no login)."""
+    with _LOCK:
+        _ENTRADAS.clear()
+
+
+def estatisticas() -> Dict[str, int]:
+    with _LOCK:
+        return dict(_STATS, entradas=len(_ENTRADAS))
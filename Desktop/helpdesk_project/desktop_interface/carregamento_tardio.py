@@ -0,0 +1,112 @@
+import importlib
+import importlib.util
+import threading
+import time
+import logging
+import sys
+import os
+from typing import Any, Dict, List, Tuple
+
+# --- CONFIGURAÇÃO DE PATH ---
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path: sys.path.append(parent_dir)
+
+# ----------------------------------------------------------------------
+# IMPORTAÇÃO TARDIA DE BIBLIOTECAS PESADAS
+# ----------------------------------------------------------------------
+# matplotlib e reportlab custam centenas de ms para importar e só a tela de relatórios
+# usa. tardio("nome") devolve um substituto que importa o módulo no primeiro acesso a
+# um atributo; disponivel("nome") responde os HAS_* sem importar nada. Depois que o
+# dashboard aparece, pre_aquecer_depois() pode carregá-los numa tarefa de fundo.
+# Cada importação real é cronometrada (ver relatorio()).
+
+_TEMPOS: Dict[str, Tuple[float, str]] = {}
+_LOCK = threading.Lock()
+
+
+def disponivel(nome: str) -> bool:
+    """True se o pacote está instalado (procura o spec, não executa o módulo)."""
+    try: return importlib.util.find_spec(nome) is not None
+    except (ImportError, ValueError): return False
+
+
+def importar(nome: str) -> Any:
+    """importlib.import_module, registrando quanto custou a primeira vez e em qual thread."""
+    ja_carregado = nome in sys.modules
+    inicio = time.perf_counter()
+    modulo = importlib.import_module(nome)
+    if not ja_carregado:
+        ms = (time.perf_counter() - inicio) * 1000
+        with _LOCK: _TEMPOS.setdefault(nome, (ms, threading.current_thread().name))
+        logging.info(f"Importação tardia: {nome} em {ms:.0f} ms")
+    return modulo
+
+
+class ModuloTardio:
+    """Substituto de módulo: o import acontece no primeiro getattr."""
+    __slots__ = ("_nome", "_modulo")
+
+    def __init__(self, nome: str):
+        self._nome = nome
+        self._modulo = None
+
+    def _carregar(self) -> Any:
+        if self._modulo is None: self._modulo = importar(self._nome)
+        return self._modulo
+
+    @property
+    def carregado(self) -> bool:
+        return self._modulo is not None or self._nome in sys.modules
+
+    def __getattr__(self, atributo: str) -> Any:
+        return getattr(self._carregar(), atributo)
+
+    def __repr__(self) -> str:
+        return f"<ModuloTardio {self._nome} ({'carregado' if self.carregado else 'pendente'})>"
+
+
+def tardio(nome: str) -> ModuloTardio:
+    return ModuloTardio(nome)
+
+
+def pre_aquecer(*nomes: str):
+    """Importa os módulos agora (chamar fora da thread da interface). Falhas só vão para o log."""
+    for nome in nomes:
+        try: importar(nome)
+        except Exception as e: logging.warning(f"Pré-carregamento de {nome} falhou: {e}")
+
+
+def pre_aquecer_depois(widget, nomes: List[str], atraso_ms: int = 1500):
+    """Agenda pre_aquecer() como tarefa de fundo atraso_ms depois (dá tempo da tela pintar)."""
+    try:
+        from desktop_interface import pool_tarefas
+    except ImportError:
+        import pool_tarefas
+
+    pendentes = [n for n in nomes if n not in sys.modules and disponivel(n.split(".")[0])]
+    if not pendentes: return
+    widget.after(atraso_ms, lambda: pool_tarefas.enviar(pre_aquecer, *pendentes, prioridade=pool_tarefas.PRIORIDADE_FUNDO))
+
+
+def relatorio() -> List[Tuple[str, float, str]]:
+    """[(módulo, ms, thread)] das importações tardias, da mais cara para a mais barata."""
+    with _LOCK:
+        itens = [(nome, ms, thread) for nome, (ms, thread) in _TEMPOS.items()]
+    return sorted(itens, key=lambda item: item[1], reverse=True)
+
+
+# Módulos pesados usados pelos relatórios (análise, gráfico e PDF)
+MODULOS_RELATORIO = [
+    "numpy",
+    "matplotlib.figure",
+    "matplotlib.backends.backend_tkagg",
+    "reportlab.platypus",
+    "reportlab.lib.styles",
+]
+
+
+if __name__ == "__main__":
+    pre_aquecer(*[n for n in MODULOS_RELATORIO if disponivel(n.split(".")[0])])
+    for nome, ms, thread in relatorio():
+        print(f"{nome:<40} {ms:8.1f} ms  ({thread})")
@@ -1,5 +1,4 @@
 import customtkinter as ctk
-import threading
 import sys
 import os
 from datetime import datetime, timedelta
@@ -14,8 +13,14 @@ if root_dir not in sys.path: sys.path.append(root_dir)
 
 try:
     from desktop_interface import api_client
+    from desktop_interface import modelo_chamado
+    from desktop_interface import painel_dados
+    from desktop_interface import lista_virtual
 except ImportError:
     import api_client
+    import modelo_chamado
+    import painel_dados
+    import lista_virtual
 
 # Importações das telas
 from desktop_interface.criar_chamado import abrir_formulario_chamado
@@ -31,6 +36,11 @@ def is_today(data_abertura_str):
         return data_chamado == datetime.now().date()
     except: return False
 
+def resumir_chamados_colaborador(stats):
+    """Contagens e os 10 chamados mais recentes (recebe estatisticas_chamados.EstatisticasChamados)."""
+    c_abertos, c_andam, c_resolv = stats.contagens()
+    return c_abertos, c_andam, c_resolv, stats.recentes(10)
+
 def mostrar_base_conhecimento(frame, user):
     try:
         from desktop_interface.base_de_conhecimentos import mostrar_base_conhecimento as abrir_base_conhecimento
@@ -126,40 +136,6 @@ def abrir_dashboard_colaborador(janela_principal, user):
             command=lambda: abrir_meus_chamados(frame, usuario_logado)
         ).pack(anchor="n", pady=25) 
 
-        # --- THREAD PARA CARREGAR DADOS REAIS ---
-        def carregar_dados_thread():
-            if not api_client.AUTH_TOKEN: return
-
-            # [SEGURANÇA] Se a janela fechou antes de começar, para aqui
-            if not frame.winfo_exists(): return
-
-            sucesso, dados = api_client.listar_meus_chamados()
-            
-            # [SEGURANÇA] Verifica de novo se a janela existe antes de agendar atualização
-            if not frame.winfo_exists(): return
-            
-            if sucesso and isinstance(dados, list):
-                
-                # Estatísticas
-                c_abertos = sum(1 for c in dados if str(c.get("status", "")).lower() == "aberto")
-                c_andam = sum(1 for c in dados if str(c.get("status", "")).lower() == "em andamento")
-                c_resolv = sum(1 for c in dados if str(c.get("status", "")).lower() in ["resolvido", "fechado"])
-                
-                # Ordenação: Recentes primeiro
-                lista_ordenada = sorted(
-                    dados, 
-                    key=lambda x: int(x.get("id_chamado") or x.get("id") or 0), 
-                    reverse=True
-                )
-                
-                lista_exibicao = lista_ordenada[:10]
-
-                # Agenda atualização na thread principal
-                frame.after(0, lambda: atualizar_ui(c_abertos, c_andam, c_resolv, lista_exibicao))
-            else:
-                print(f"Erro ao carregar: {dados}")
-                frame.after(0, lambda: mostrar_erro_ui("Erro ao carregar dados."))
-
         def mostrar_erro_ui(msg):
             # [SEGURANÇA] Verifica se os labels ainda existem
             if not lbl_abertos.winfo_exists(): return
@@ -167,78 +143,52 @@ def abrir_dashboard_colaborador(janela_principal, user):
             lbl_abertos.configure(text="-")
             lbl_andam.configure(text="-")
             lbl_resolv.configure(text="-")
-            for w in recentes_container.winfo_children(): w.destroy()
-            ctk.CTkLabel(recentes_container, text=msg, text_color="red").pack(pady=20)
+            for w in recentes_container.winfo_children():
+                if w is not lista_recentes.frame: w.destroy()
+            lista_recentes.definir([])
+            lista_recentes.lbl_vazio.configure(text=msg, text_color="red")
+            estado_lista["assinatura"] = None
+
+        estado_lista = {"assinatura": None}
+
+        def texto_status(c):
+            if c.status is modelo_chamado.StatusChamado.EM_ANDAMENTO: return "Em Andamento"
+            return c.status_texto
+
+        # 🟢 CARDS COMPACTOS (Linha Única): pool fixo, cada atualização só preenche os mesmos widgets
+        lista_recentes = lista_virtual.ListaVirtual(
+            recentes_container,
+            lambda parent: lista_virtual.CartaoCompacto(
+                parent,
+                lambda c: abrir_ticket_detalhe(c.id, usuario_logado, frame, lambda: mostrar_dashboard(frame, usuario_logado)),
+                texto_status,
+            ),
+            10, vazio="Nenhum chamado encontrado.", rolagem=False,
+        )
 
         def atualizar_ui(abertos, andam, resolv, lista_rec):
             # [SEGURANÇA CRÍTICA] Se o label não existe mais (tela mudou), para tudo
             if not lbl_abertos.winfo_exists(): return
 
-            lbl_abertos.configure(text=str(abertos))
-            lbl_andam.configure(text=str(andam))
-            lbl_resolv.configure(text=str(resolv))
+            # Só mexe no que mudou desde a última pintura
+            painel_dados.definir_texto(lbl_abertos, str(abertos))
+            painel_dados.definir_texto(lbl_andam, str(andam))
+            painel_dados.definir_texto(lbl_resolv, str(resolv))
 
-            if lbl_loading.winfo_exists(): lbl_loading.destroy()
+            assinatura = painel_dados.assinatura_recentes(lista_rec)
+            if assinatura == estado_lista["assinatura"]: return
+            estado_lista["assinatura"] = assinatura
 
-            for w in recentes_container.winfo_children(): w.destroy()
-
-            if not lista_rec:
-                ctk.CTkLabel(recentes_container, text="Nenhum chamado encontrado.", text_color="gray").pack(pady=20)
-                return
-
-            for c in lista_rec:
-                criar_card_chamado_compacto(recentes_container, c)
-
-        # 🟢 FUNÇÃO DE CARD COMPACTO (Linha Única)
-        def criar_card_chamado_compacto(parent, c):
-            try:
-                # [SEGURANÇA] Verifica se o pai ainda existe
-                if not parent.winfo_exists(): return
-
-                c_id = c.get("id_chamado") or c.get("id")
-                titulo = c.get("titulo", "Sem Título")
-                status = str(c.get("status", "Aberto")).lower()
-                
-                if status == "em análise": status_safe = "Em Andamento"
-                else: status_safe = status.capitalize()
-                
-                # Cores
-                cor_faixa = "#94A3B8"
-                if "aberto" in status: cor_faixa = "#0284C7"
-                elif "andamento" in status: cor_faixa = "#EAB308"
-                elif "resolvido" in status or "fechado" in status: cor_faixa = "#16A34A"
-                
-                # --- LAYOUT COMPACTO ---
-                card = ctk.CTkFrame(parent, fg_color="white", corner_radius=8, border_width=1, border_color=cor_faixa)
-                card.pack(fill="x", padx=5, pady=4) 
-                
-                # Lado Esquerdo: ID + Título
-                content_frame = ctk.CTkFrame(card, fg_color="transparent")
-                content_frame.pack(side="left", padx=10, pady=5, fill="x", expand=True)
-                
-                # ID
-                ctk.CTkLabel(content_frame, text=f"#{c_id}", font=("Helvetica", 13, "bold"), text_color="#64748B", width=35).pack(side="left", padx=(0, 10))
-                # Título
-                ctk.CTkLabel(content_frame, text=titulo, font=("Helvetica", 14, "bold"), text_color="#1E293B", anchor="w").pack(side="left", fill="x", expand=True)
-                
-                # Lado Direito: Status + Botão
-                right_frame = ctk.CTkFrame(card, fg_color="transparent")
-                right_frame.pack(side="right", padx=10)
-
-                # Status Label
-                ctk.CTkLabel(right_frame, text=status_safe, font=("Helvetica", 11, "bold"), text_color=cor_faixa).pack(side="left", padx=10)
-
-                # Botão Pequeno
-                ctk.CTkButton(
-                    right_frame, text="Detalhes", width=70, height=28, fg_color="#5BA39C", hover_color="#4C8E87",
-                    font=("Helvetica", 11, "bold"),
-                    command=lambda: abrir_ticket_detalhe(c_id, usuario_logado, frame, lambda: mostrar_dashboard(frame, usuario_logado))
-                ).pack(side="right")
-                
-            except Exception as e: 
-                print(f"Erro ao criar card: {e}")
-
-        threading.Thread(target=carregar_dados_thread, daemon=True).start()
+            if lbl_loading.winfo_exists(): lbl_loading.destroy()
+            lista_recentes.lbl_vazio.configure(text="Nenhum chamado encontrado.", text_color="gray")
+            lista_recentes.definir(lista_rec)
+
+        # --- CARREGAMENTO: último resumo conhecido na hora, revalidação em segundo plano ---
+        if api_client.AUTH_TOKEN:
+            painel_dados.carregar(
+                "colaborador", "meus", resumir_chamados_colaborador, recentes_container,
+                ao_atualizar=atualizar_ui, ao_falhar=lambda _msg: mostrar_erro_ui("Erro ao carregar dados."),
+            )
 
     # Passando 'user' corretamente
     criar_menu_lateral(
@@ -1,7 +1,6 @@
 import customtkinter as ctk
 from tkinter import messagebox, filedialog
 from PIL import Image
-import threading
 import sys
 import os
 import time
@@ -14,8 +13,12 @@ if parent_dir not in sys.path:
 
 try:
     from desktop_interface import api_client
+    from desktop_interface import pool_tarefas
+    from desktop_interface import busca_artigos
 except ImportError:
     import api_client
+    import pool_tarefas
+    import busca_artigos
 
 try:
     from desktop_interface.filtro_chamado import validar_pertinencia
@@ -402,12 +405,14 @@ def abrir_formulario_chamado(
         ).pack(pady=20)
 
     def buscar_sugestoes(termo):
-        threading.Thread(target=thread_busca_kb, args=(termo,)).start()
+        # Só a busca mais recente interessa: a anterior, se ainda na fila, é cancelada
+        pool_tarefas.enviar(thread_busca_kb, termo, dono=container_dinamico, chave="criar_chamado.sugestoes")
 
     def thread_busca_kb(termo):
         if not api_client.AUTH_TOKEN:
             return
-        sucesso, artigos = api_client.listar_artigos(termo=termo)
+        # Índice local (BM25): a lista de artigos só é conferida com o servidor uma vez por sessão
+        sucesso, artigos = busca_artigos.sugerir(termo, limite=3)
 
         if container_dinamico.winfo_exists():
             container_dinamico.after(0, lambda: exibir_sugestoes(sucesso, artigos))
@@ -491,9 +496,7 @@ def abrir_formulario_chamado(
         ).pack(pady=50)
 
         btn_enviar.configure(state="disabled", text="Enviando...", fg_color="#64748B")
-        threading.Thread(
-            target=thread_enviar, args=(t, d, c, p, list(arquivos_selecionados))
-        ).start()
+        pool_tarefas.enviar(thread_enviar, t, d, c, p, list(arquivos_selecionados), prioridade=pool_tarefas.PRIORIDADE_NORMAL, obrigatoria=True)
 
     def thread_enviar(t, d, c, p, files):
         pertinente, motivo = api_client.validar_pertinencia(t, d)
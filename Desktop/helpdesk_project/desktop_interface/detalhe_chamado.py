@@ -0,0 +1,90 @@
+import threading
+import logging
+import sys
+import os
+from typing import Optional, Dict, Any
+
+# --- CONFIGURAÇÃO DE PATH ---
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path: sys.path.append(parent_dir)
+
+try:
+    from desktop_interface import api_client
+    from desktop_interface import replica_chamados
+except ImportError:
+    import api_client
+    import replica_chamados
+
+# ----------------------------------------------------------------------
+# DETALHE DE UM CHAMADO
+# ----------------------------------------------------------------------
+# Abrir um chamado nunca baixa a lista inteira. A ordem é:
+#   1. rota direta /api/chamados/{id};
+#   2. se ela vier sem anexos: rota de anexos (quando existir) ou a réplica local;
+#   3. sem rede: o registro da réplica local (memória ou disco), por id.
+# Cada desvio da rota direta é contado em _STATS para medir quanto ainda acontece.
+
+_STATS = {"rota_direta": 0, "anexos_rota": 0, "anexos_replica": 0, "replica": 0, "nao_encontrado": 0}
+_LOCK = threading.Lock()
+
+
+def _contar(evento: str):
+    with _LOCK:
+        _STATS[evento] += 1
+
+
+def _escopos() -> tuple:
+    papel = (api_client.CURRENT_USER or {}).get("role", "colaborador")
+    return ("todos", "meus") if papel in ("admin", "tecnico") else ("meus",)
+
+
+def _da_replica(chamado_id) -> Optional[Dict[str, Any]]:
+    """Busca por id no índice das réplicas (hidratando do disco se preciso), sem ir à rede."""
+    for escopo in _escopos():
+        replica = replica_chamados.obter_replica(escopo)
+        replica.hidratar()
+        chamado = replica.obter(chamado_id)
+        if chamado is not None: return chamado
+    return None
+
+
+def obter_chamado(chamado_id) -> Optional[Dict[str, Any]]:
+    """Chamado normalizado para a tela de detalhe, ou None se não existir / não houver cópia local."""
+    status, chamado = api_client.buscar_chamado(chamado_id)
+
+    if status == 200 and chamado is not None:
+        _contar("rota_direta")
+        if chamado.get("anexos"): return chamado
+
+        # Rota direta sem anexos: completa com a rota dedicada ou com as referências da réplica
+        sucesso, anexos = api_client.listar_anexos_chamado(chamado_id)
+        if sucesso:
+            _contar("anexos_rota")
+            chamado["anexos"] = anexos
+            return chamado
+
+        local = _da_replica(chamado_id)
+        if local and local.get("anexos"):
+            _contar("anexos_replica")
+            logging.info(f"Chamado {chamado_id}: anexos vindos da réplica local")
+            chamado["anexos"] = [dict(a) for a in local["anexos"]]
+        return chamado
+
+    if status == 404:
+        _contar("nao_encontrado")
+        return None
+
+    # Sem conexão ou erro do servidor: última cópia conhecida
+    local = _da_replica(chamado_id)
+    if local is not None:
+        _contar("replica")
+        logging.info(f"Chamado {chamado_id}: rota direta falhou ({status}), usando réplica local")
+        return dict(local)
+    _contar("nao_encontrado")
+    return None
+
+
+def estatisticas() -> Dict[str, int]:
+    with _LOCK:
+        return dict(_STATS)
@@ -0,0 +1,189 @@
+import bisect
+import heapq
+import threading
+import time
+import sys
+import os
+from collections import Counter
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+# --- CONFIGURAÇÃO DE PATH ---
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path: sys.path.append(parent_dir)
+
+try:
+    from desktop_interface.modelo_chamado import Chamado, StatusChamado, Prioridade
+except ImportError:
+    from modelo_chamado import Chamado, StatusChamado, Prioridade
+
+# ----------------------------------------------------------------------
+# MOTOR DE ESTATÍSTICAS DOS CHAMADOS
+# ----------------------------------------------------------------------
+# Contagens por status, categoria e prioridade mantidas a cada chamado que entra,
+# muda ou sai (a réplica chama adicionar/remover no diff), em vez de recontar a
+# lista inteira em cada dashboard. As listas de "recentes" saem de um heap limitado
+# a N itens: uma passada O(n log N), sem ordenar tudo. O motor ainda guarda os ids
+# em ordem, então os recentes dele param assim que acham N itens que passam no filtro.
+
+
+class EstatisticasChamados:
+    def __init__(self, chamados: Iterable[Chamado] = ()):
+        self._chamados: Dict[int, Chamado] = {}
+        self._ids: List[int] = []  # ordenados, para os recentes
+        self._por_status: Counter = Counter()
+        self._por_categoria: Counter = Counter()
+        self._por_prioridade: Counter = Counter()
+        self._lock = threading.RLock()
+        self._montar(chamados)
+
+    def _montar(self, chamados: Iterable[Chamado]):
+        """Carga inicial numa única passada (sem o custo por item de adicionar)."""
+        status, categorias, prioridades = {}, {}, {}
+        por_id = self._chamados
+        for c in chamados:
+            anterior = por_id.get(c.id)
+            if anterior is not None:
+                status[anterior.status] -= 1
+                categorias[anterior.nome_categoria] -= 1
+                prioridades[anterior.prioridade] -= 1
+            por_id[c.id] = c
+            status[c.status] = status.get(c.status, 0) + 1
+            categorias[c.nome_categoria] = categorias.get(c.nome_categoria, 0) + 1
+            prioridades[c.prioridade] = prioridades.get(c.prioridade, 0) + 1
+        self._ids = sorted(por_id)
+        self._por_status.update(status)
+        self._por_categoria.update(categorias)
+        self._por_prioridade.update(prioridades)
+
+    def __len__(self) -> int:
+        return len(self._chamados)
+
+    def _contar(self, c: Chamado, delta: int):
+        self._por_status[c.status] += delta
+        self._por_categoria[c.nome_categoria] += delta
+        self._por_prioridade[c.prioridade] += delta
+
+    def adicionar(self, c: Chamado):
+        """Inclui o chamado; se o id já existia, substitui (conta como alteração)."""
+        with self._lock:
+            anterior = self._chamados.get(c.id)
+            if anterior is not None: self._contar(anterior, -1)
+            else: bisect.insort(self._ids, c.id)
+            self._chamados[c.id] = c
+            self._contar(c, 1)
+
+    def remover(self, chamado_id: int):
+        with self._lock:
+            anterior = self._chamados.pop(chamado_id, None)
+            if anterior is None: return
+            self._contar(anterior, -1)
+            del self._ids[bisect.bisect_left(self._ids, chamado_id)]
+
+    def limpar(self):
+        with self._lock:
+            self._chamados.clear()
+            self._ids.clear()
+            self._por_status.clear()
+            self._por_categoria.clear()
+            self._por_prioridade.clear()
+
+    # --- CONSULTAS ---
+    def contagens(self) -> tuple:
+        """(abertos, em andamento, resolvidos/fechados), como modelo_chamado.contar_por_status."""
+        with self._lock:
+            s = self._por_status
+            return (s[StatusChamado.ABERTO], s[StatusChamado.EM_ANDAMENTO],
+                    s[StatusChamado.RESOLVIDO] + s[StatusChamado.FECHADO])
+
+    def por_status(self) -> Dict[StatusChamado, int]:
+        with self._lock:
+            return {k: v for k, v in self._por_status.items() if v}
+
+    def por_categoria(self) -> Dict[str, int]:
+        with self._lock:
+            return {k: v for k, v in self._por_categoria.items() if v}
+
+    def por_prioridade(self) -> Dict[Prioridade, int]:
+        with self._lock:
+            return {k: v for k, v in self._por_prioridade.items() if v}
+
+    def recentes(self, n: int = 10, filtro: Optional[Callable[[Chamado], bool]] = None) -> List[Chamado]:
+        """Os n chamados de maior id (mais novos) que passam no filtro, do mais novo ao mais antigo."""
+        resultado = []
+        if n <= 0: return resultado
+        with self._lock:
+            por_id = self._chamados
+            for cid in reversed(self._ids):
+                c = por_id[cid]
+                if filtro is None or filtro(c):
+                    resultado.append(c)
+                    if len(resultado) == n: break
+        return resultado
+
+
+def top_recentes(chamados: Iterable[Chamado], n: int = 10, filtro: Optional[Callable[[Chamado], bool]] = None) -> List[Chamado]:
+    """Top-N por id de uma lista avulsa (sem motor), via heap limitado."""
+    if filtro is not None: chamados = (c for c in chamados if filtro(c))
+    return heapq.nlargest(n, chamados, key=lambda c: c.id)
+
+
+# --- BENCHMARK ---
+def benchmark(qtd: int = 100_000, alteracoes: int = 100) -> Dict[str, Any]:
+    """
+    Tempos (ms) para qtd chamados: o cálculo antigo dos dashboards (três somas + sort),
+    a montagem do motor numa passada, o top-N por heap numa lista avulsa, a consulta
+    contagens+recentes no motor e a manutenção incremental de 'alteracoes' chamados.
+    """
+    try:
+        from desktop_interface import normalizacao, modelo_chamado
+    except ImportError:
+        import normalizacao, modelo_chamado
+
+    chamados = modelo_chamado.converter_lista(normalizacao.normalizar("chamado", normalizacao._gerar_chamados_exemplo(qtd)))
+
+    def medir(func, repeticoes: int = 5) -> float:
+        melhor = float("inf")
+        for _ in range(repeticoes):
+            t0 = time.perf_counter()
+            func()
+            melhor = min(melhor, time.perf_counter() - t0)
+        return melhor * 1000
+
+    def antigo():
+        abertos = sum(1 for c in chamados if c.status is StatusChamado.ABERTO)
+        andamento = sum(1 for c in chamados if c.status is StatusChamado.EM_ANDAMENTO)
+        resolvidos = sum(1 for c in chamados if c.status.finalizado)
+        ativos = sorted((c for c in chamados if not c.status.finalizado), key=lambda c: c.id, reverse=True)[:10]
+        return abertos, andamento, resolvidos, ativos
+
+    motor = EstatisticasChamados(chamados)
+
+    def consulta():
+        return motor.contagens(), motor.recentes(10, lambda c: not c.status.finalizado)
+
+    def heap_avulso():
+        return top_recentes(chamados, 10, lambda c: not c.status.finalizado)
+
+    esperado = antigo()
+    assert consulta() == (esperado[:3], esperado[3]) and heap_avulso() == esperado[3]
+
+    modificados = [Chamado(c.id, c.titulo, c.descricao, StatusChamado.FECHADO, c.prioridade, c.id_categoria,
+                           c.nome_categoria, c.data_abertura, c.anexos) for c in chamados[:alteracoes]]
+
+    def incremental():
+        for c in modificados: motor.adicionar(c)
+
+    return {
+        "qtd": qtd,
+        "antigo_ms": medir(antigo),
+        "montagem_ms": medir(lambda: EstatisticasChamados(chamados), repeticoes=3),
+        "heap_avulso_ms": medir(heap_avulso),
+        "consulta_ms": medir(consulta),
+        "incremental_ms": medir(incremental),
+    }
+
+
+if __name__ == "__main__":
+    for chave, valor in benchmark().items():
+        print(f"{chave:>16}: {valor:.2f}" if isinstance(valor, float) else f"{chave:>16}: {valor}")
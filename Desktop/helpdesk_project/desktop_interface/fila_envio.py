@@ -0,0 +1,77 @@
+import threading
+import logging
+import sys
+import os
+
+# --- CONFIGURAÇÃO DE PATH ---
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path: sys.path.append(parent_dir)
+
+try:
+    from desktop_interface import api_client
+except ImportError:
+    import api_client
+
+# ----------------------------------------------------------------------
+# REENVIO EM SEGUNDO PLANO DA FILA DE ESCRITAS (OUTBOX)
+# ----------------------------------------------------------------------
+INTERVALO_SEGUNDOS = 15
+
+_THREAD = None
+_PARAR = threading.Event()
+_ACORDAR = threading.Event()
+
+
+def _loop():
+    while not _PARAR.is_set():
+        try:
+            if api_client.escritas_pendentes() and api_client.health_check():
+                enviadas, restantes = api_client.reenviar_fila()
+                if enviadas:
+                    logging.info(f"Fila de envio: {enviadas} enviada(s), {restantes} pendente(s)")
+        except Exception as e:
+            logging.error(f"Erro no reenvio da fila: {e}")
+        _ACORDAR.wait(INTERVALO_SEGUNDOS)
+        _ACORDAR.clear()
+
+
+def iniciar():
+    """Liga o reenvio automático (uma única thread daemon por processo)."""
+    global _THREAD
+    _PARAR.clear()
+    if _THREAD is not None and _THREAD.is_alive(): return
+    _THREAD = threading.Thread(target=_loop, name="fila-envio", daemon=True)
+    _THREAD.start()
+
+
+def reenviar_agora():
+    """Antecipa a próxima tentativa (ex.: botão 'Sincronizar' ou rede de volta)."""
+    _ACORDAR.set()
+
+
+def parar():
+    _PARAR.set()
+    _ACORDAR.set()
+
+
+def profundidade() -> int:
+    return api_client.escritas_pendentes()
+
+
+def recusadas() -> list:
+    """Escritas que a API rejeitou (4xx) e que não serão reenviadas."""
+    return api_client.escritas_recusadas()
+
+
+def monitorar_profundidade(label, intervalo_ms: int = 3000):
+    """Mantém um CTkLabel com as escritas pendentes e as recusadas (vazio quando não há nenhuma)."""
+    def atualizar():
+        if not label.winfo_exists(): return
+        qtd = profundidade()
+        linhas = [f"⏳ {qtd} envio(s) pendente(s)"] if qtd else []
+        for item in recusadas():
+            linhas.append(f"⚠ {item['tipo']} recusado: {item['erro'] or 'erro'}"[:60])
+        label.configure(text="\n".join(linhas))
+        label.after(intervalo_ms, atualizar)
+    atualizar()
@@ -0,0 +1,115 @@
+import itertools
+import threading
+import time
+import logging
+import sys
+import os
+from typing import Any, Callable, Dict
+
+# --- CONFIGURAÇÃO DE PATH ---
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path: sys.path.append(parent_dir)
+
+try:
+    from desktop_interface import pool_tarefas
+except ImportError:
+    import pool_tarefas
+
+# ----------------------------------------------------------------------
+# FILTRO DAS TELAS DE LISTAGEM FORA DA THREAD DA INTERFACE
+# ----------------------------------------------------------------------
+# Cada tecla na busca (e cada troca de filtro) recalculava a lista na thread do Tk.
+# Agora o evento só anota a consulta e reinicia um timer (debounce); quando o usuário
+# para de digitar, o filtro roda numa tarefa do pool. Cada consulta ganha um número
+# de geração: uma nova consulta descarta a tarefa anterior que ainda estava na fila,
+# avisa a que já está rodando (cancelada() passa a dar True) e impede que um
+# resultado velho chegue à tela. Só o resultado da última consulta é entregue.
+
+ATRASO_PADRAO_MS = 150
+_SEQ = itertools.count()
+
+
+class FiltroAssincrono:
+    """
+    filtrar(consulta, cancelada) roda no pool e devolve o resultado (ou None se desistiu);
+    ao_resultado(resultado) roda na thread da interface, só para a consulta mais recente.
+    widget: dono das tarefas e dos timers (destruí-lo encerra tudo).
+    """
+
+    def __init__(self, widget, filtrar: Callable[[Any, Callable[[], bool]], Any],
+                 ao_resultado: Callable[[Any], None], atraso_ms: int = ATRASO_PADRAO_MS):
+        self.widget = widget
+        self.filtrar = filtrar
+        self.ao_resultado = ao_resultado
+        self.atraso_ms = atraso_ms
+        self._chave = f"filtro_assincrono:{next(_SEQ)}"
+        self._geracao = 0
+        self._timer = None
+        self._lock = threading.Lock()
+        self._stats = {"pedidos": 0, "executados": 0, "descartados": 0, "entregues": 0, "ms_ultimo": 0.0}
+
+    def pedir(self, consulta: Any, imediato: bool = False):
+        """
+        Registra uma nova consulta (chamar na thread da interface). Por padrão espera atraso_ms
+        sem novas consultas antes de filtrar; imediato=True (clique, carga de dados) filtra já.
+        """
+        with self._lock:
+            self._geracao += 1
+            geracao = self._geracao
+            self._stats["pedidos"] += 1
+        if self._timer is not None:
+            try: self.widget.after_cancel(self._timer)
+            except Exception: pass
+            self._timer = None
+        if imediato or self.atraso_ms <= 0:
+            self._enviar(geracao, consulta)
+        else:
+            self._timer = self.widget.after(self.atraso_ms, lambda: self._enviar(geracao, consulta))
+
+    def cancelar(self):
+        """Descarta a consulta pendente ou em andamento sem pedir outra."""
+        with self._lock:
+            self._geracao += 1
+        if self._timer is not None:
+            try: self.widget.after_cancel(self._timer)
+            except Exception: pass
+            self._timer = None
+
+    def _atual(self, geracao: int) -> bool:
+        return geracao == self._geracao
+
+    def _enviar(self, geracao: int, consulta: Any):
+        self._timer = None
+        if not self._atual(geracao): return
+        # Mesma chave: a tarefa anterior que ainda não começou é descartada pelo pool
+        pool_tarefas.enviar(self._rodar, geracao, consulta, dono=self.widget, chave=self._chave)
+
+    def _rodar(self, geracao: int, consulta: Any):
+        if not self._atual(geracao):
+            with self._lock: self._stats["descartados"] += 1
+            return
+        inicio = time.perf_counter()
+        resultado = self.filtrar(consulta, lambda: not self._atual(geracao))
+        ms = (time.perf_counter() - inicio) * 1000
+        with self._lock:
+            self._stats["executados"] += 1
+            self._stats["ms_ultimo"] = ms
+        if resultado is None or not self._atual(geracao):
+            with self._lock: self._stats["descartados"] += 1
+            return
+        try:
+            if self.widget.winfo_exists(): self.widget.after(0, lambda: self._entregar(geracao, resultado))
+        except Exception as e:
+            logging.debug(f"Filtro sem tela para entregar o resultado: {e}")
+
+    def _entregar(self, geracao: int, resultado: Any):
+        # Uma consulta nova pode ter chegado enquanto o resultado esperava a vez na fila do Tk
+        if not self._atual(geracao) or not self.widget.winfo_exists(): return
+        with self._lock: self._stats["entregues"] += 1
+        self.ao_resultado(resultado)
+
+    def estatisticas(self) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self._stats)
+
@@ -0,0 +1,152 @@
+import time
+import logging
+import sys
+import os
+from typing import Any, Dict, List, Optional
+
+# --- CONFIGURAÇÃO DE PATH ---
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path: sys.path.append(parent_dir)
+
+try:
+    from desktop_interface import carregamento_tardio
+except ImportError:
+    import carregamento_tardio
+
+mpl_figure = carregamento_tardio.tardio("matplotlib.figure")
+backend_tkagg = carregamento_tardio.tardio("matplotlib.backends.backend_tkagg")
+
+# ----------------------------------------------------------------------
+# GRÁFICO "VOLUME POR CATEGORIA" REAPROVEITADO
+# ----------------------------------------------------------------------
+# Antes cada visita criava uma figura nova pelo pyplot (que nunca era fechada e ficava
+# no registro dele). Agora há uma única Figure, criada sem pyplot; só o canvas Tk é
+# refeito quando a área do gráfico muda (e destruído junto com ela). Os dados são
+# comparados por hash: iguais -> nada é redesenhado; mesmas categorias -> as barras e
+# os rótulos existentes são ajustados no lugar; categorias diferentes -> eixo refeito.
+
+COR_BARRA = "#009E7F"
+
+
+class GraficoCategorias:
+    def __init__(self):
+        self.figura = None
+        self.ax = None
+        self.canvas = None
+        self.master = None
+        self._barras: list = []
+        self._rotulos: list = []
+        self._nomes: tuple = ()
+        self._hash: Optional[int] = None
+        self._stats = {"iguais": 0, "no_lugar": 0, "completos": 0, "ms_total": 0.0, "ms_ultimo": 0.0}
+
+    # --- FIGURA E CANVAS ---
+    def _garantir_figura(self):
+        if self.figura is not None: return
+        self.figura = mpl_figure.Figure(figsize=(6, 4), dpi=100)
+        self.figura.patch.set_facecolor('white')
+        self.ax = self.figura.add_subplot(111)
+
+    def _garantir_canvas(self, master):
+        if self.canvas is not None and self.master is master: return
+        self.soltar()
+        self.canvas = backend_tkagg.FigureCanvasTkAgg(self.figura, master=master)
+        self.canvas.get_tk_widget().pack(fill="both", expand=True)
+        self.master = master
+        # A área some junto com a tela: o canvas vai junto, a figura fica para a próxima visita
+        canvas = self.canvas
+        canvas.get_tk_widget().bind("<Destroy>", lambda _e: self._canvas_destruido(canvas), add="+")
+
+    def _canvas_destruido(self, canvas):
+        if self.canvas is not canvas: return
+        self.canvas = None
+        self.master = None
+        self._hash = None
+
+    def widget(self):
+        return self.canvas.get_tk_widget() if self.canvas is not None else None
+
+    def soltar(self):
+        """Desliga o canvas atual (a Figure continua em memória para ser reaproveitada)."""
+        if self.canvas is not None:
+            try: self.canvas.get_tk_widget().destroy()
+            except Exception: pass
+        self.canvas = None
+        self.master = None
+        self._hash = None  # um canvas novo sempre precisa desenhar
+
+    def fechar(self):
+        """Descarta também a Figure (ex.: logout)."""
+        self.soltar()
+        if self.figura is not None: self.figura.clear()
+        self.figura = self.ax = None
+        self._barras, self._rotulos, self._nomes = [], [], ()
+
+    # --- DESENHO ---
+    def _estilizar(self, maximo: float):
+        ax = self.ax
+        ax.set_facecolor('white')
+        for lado in ('top', 'right', 'left', 'bottom'): ax.spines[lado].set_visible(False)
+        ax.tick_params(axis='x', which='both', bottom=False, labelbottom=False)
+        ax.tick_params(axis='y', length=0, labelsize=11)
+        # Limite fixo: no ajuste no lugar não há autoscale, e o rótulo precisa caber à direita
+        ax.set_xlim(0, maximo * 1.15 if maximo > 0 else 1)
+
+    def _montar(self, nomes: tuple, qtds: tuple):
+        self.ax.clear()
+        barras = self.ax.barh(nomes, qtds, color=COR_BARRA, height=0.6)
+        self._barras = list(barras)
+        self._rotulos = [
+            self.ax.text(b.get_width() + 0.5, b.get_y() + b.get_height() / 2, f'{int(b.get_width())}',
+                         ha='left', va='center', fontweight='bold', color='#333')
+            for b in barras
+        ]
+        self._nomes = nomes
+        self._estilizar(max(qtds))
+        self.figura.tight_layout()
+
+    def _ajustar(self, qtds: tuple):
+        for barra, rotulo, qtd in zip(self._barras, self._rotulos, qtds):
+            barra.set_width(qtd)
+            rotulo.set_x(qtd + 0.5)
+            rotulo.set_text(f'{int(qtd)}')
+        self._estilizar(max(qtds))
+
+    def desenhar(self, master, dados_cats: List[Dict[str, Any]]) -> float:
+        """Desenha [{'nome', 'quantidade'}] em master. Retorna o tempo gasto (ms)."""
+        inicio = time.perf_counter()
+        nomes = tuple(d['nome'] for d in dados_cats)
+        qtds = tuple(d['quantidade'] for d in dados_cats)
+        chave = hash((nomes, qtds))
+
+        self._garantir_figura()
+        self._garantir_canvas(master)
+        if chave == self._hash:
+            self._stats["iguais"] += 1
+            return 0.0
+
+        if nomes == self._nomes and self._barras:
+            self._ajustar(qtds)
+            self._stats["no_lugar"] += 1
+        else:
+            self._montar(nomes, qtds)
+            self._stats["completos"] += 1
+        self.canvas.draw()
+        self._hash = chave
+
+        ms = (time.perf_counter() - inicio) * 1000
+        self._stats["ms_total"] += ms
+        self._stats["ms_ultimo"] = ms
+        logging.info(f"Gráfico por categoria desenhado em {ms:.0f} ms")
+        return ms
+
+    def estatisticas(self) -> Dict[str, Any]:
+        dados = dict(self._stats)
+        desenhos = dados["no_lugar"] + dados["completos"]
+        dados["ms_medio"] = dados.pop("ms_total") / desenhos if desenhos else 0.0
+        return dados
+
+
+# Um gráfico só para a tela de relatórios
+GRAFICO = GraficoCategorias()
@@ -0,0 +1,341 @@
+import re
+import threading
+import time
+import sys
+import os
+from itertools import compress
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+# --- CONFIGURAÇÃO DE PATH ---
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path: sys.path.append(parent_dir)
+
+try:
+    from desktop_interface.modelo_chamado import Chamado, StatusChamado, Prioridade
+except ImportError:
+    from modelo_chamado import Chamado, StatusChamado, Prioridade
+
+# ----------------------------------------------------------------------
+# ÍNDICE DE BUSCA DOS CHAMADOS
+# ----------------------------------------------------------------------
+# O filtro das telas de listagem percorria a lista inteira a cada tecla. Aqui cada
+# chamado ganha uma posição fixa (em ordem de id) e o índice guarda:
+#   - token -> conjunto de posições (palavras do título e o id);
+#   - status / prioridade / categoria -> bitset (int do Python, bit = posição).
+# Uma consulta combina os filtros com AND nos bitsets e cruza o resultado com as
+# posições da palavra digitada; só os candidatos restantes viram Chamado. A semântica
+# é a do filtro antigo (trecho do título ou do id, categoria por trecho do nome): uma
+# palavra casa com todo token que a contém, e buscas com mais de uma palavra ainda
+# conferem o texto completo nos candidatos. Uma palavra que casa com boa parte da
+# lista ("a", "1") não compensa o índice: aí a lista é percorrida, como antes.
+#
+# A réplica (replica_chamados) mantém um índice por escopo, atualizado no diff: só os
+# chamados que entram, mudam ou saem são reindexados.
+
+_PALAVRA = re.compile(r"\w+")
+
+_ZERO_UM = bytes.maketrans(b"01", b"\x00\x01")
+
+MAX_CACHE_VOCABULARIO = 256
+# Palavra que casa com mais de 1/FRACAO_VARREDURA dos chamados: a busca percorre a lista
+FRACAO_VARREDURA = 4
+
+
+def _tokens(c: Chamado) -> Set[str]:
+    return set(_PALAVRA.findall(c.texto_busca))
+
+
+def _para_bitset(posicoes: List[int]) -> int:
+    if not posicoes: return 0
+    buffer = bytearray((max(posicoes) >> 3) + 1)
+    for p in posicoes: buffer[p >> 3] |= 1 << (p & 7)
+    return int.from_bytes(buffer, "little")
+
+
+def _marcadores(bits: int) -> bytes:
+    """Um byte 0/1 por posição (índice = posição): serve para compress() e para testar candidatos."""
+    return format(bits, "b").encode()[::-1].translate(_ZERO_UM)
+
+
+class IndiceChamados:
+    def __init__(self, chamados: Iterable[Chamado] = ()):
+        self._lock = threading.RLock()
+        self._zerar()
+        self._montar(chamados)
+
+    def _zerar(self):
+        self._posicoes: List[Optional[Chamado]] = []  # posição -> chamado (None = removido)
+        self._posicao_de: Dict[int, int] = {}           # id -> posição
+        self._por_token: Dict[str, Set[int]] = {}
+        self._por_status: Dict[StatusChamado, int] = {}
+        self._por_prioridade: Dict[Prioridade, int] = {}
+        self._por_categoria: Dict[str, int] = {}        # categoria_busca -> bitset
+        self._vocabulario: Dict[str, List[str]] = {}    # palavra digitada -> tokens que a contêm
+        self._maior_id: Optional[int] = None
+        self._fora_de_ordem = False
+
+    def _montar(self, chamados: Iterable[Chamado]):
+        """Carga inicial numa única passada; as posições seguem a ordem crescente de id."""
+        por_id = {c.id: c for c in chamados}
+        status: Dict[StatusChamado, List[int]] = {}
+        prioridades: Dict[Prioridade, List[int]] = {}
+        categorias: Dict[str, List[int]] = {}
+        por_token = self._por_token
+        for posicao, cid in enumerate(sorted(por_id)):
+            c = por_id[cid]
+            self._posicoes.append(c)
+            self._posicao_de[cid] = posicao
+            for token in _tokens(c):
+                conjunto = por_token.get(token)
+                if conjunto is None: por_token[token] = {posicao}
+                else: conjunto.add(posicao)
+            status.setdefault(c.status, []).append(posicao)
+            prioridades.setdefault(c.prioridade, []).append(posicao)
+            categorias.setdefault(c.categoria_busca, []).append(posicao)
+        self._por_status = {k: _para_bitset(v) for k, v in status.items()}
+        self._por_prioridade = {k: _para_bitset(v) for k, v in prioridades.items()}
+        self._por_categoria = {k: _para_bitset(v) for k, v in categorias.items()}
+        if por_id: self._maior_id = max(por_id)
+
+    def __len__(self) -> int:
+        return len(self._posicao_de)
+
+    # --- MANUTENÇÃO INCREMENTAL ---
+    def _indexar(self, posicao: int, c: Chamado):
+        bit = 1 << posicao
+        for token in _tokens(c):
+            conjunto = self._por_token.get(token)
+            if conjunto is None:
+                self._por_token[token] = {posicao}
+                self._vocabulario.clear()  # token novo: as listas em cache ficaram incompletas
+            else:
+                conjunto.add(posicao)
+        self._por_status[c.status] = self._por_status.get(c.status, 0) | bit
+        self._por_prioridade[c.prioridade] = self._por_prioridade.get(c.prioridade, 0) | bit
+        self._por_categoria[c.categoria_busca] = self._por_categoria.get(c.categoria_busca, 0) | bit
+
+    def _desindexar(self, posicao: int, c: Chamado):
+        bit = 1 << posicao
+        for token in _tokens(c):
+            conjunto = self._por_token.get(token)
+            if conjunto is None: continue
+            conjunto.discard(posicao)
+            if not conjunto: del self._por_token[token]
+        self._por_status[c.status] &= ~bit
+        self._por_prioridade[c.prioridade] &= ~bit
+        self._por_categoria[c.categoria_busca] &= ~bit
+
+    def adicionar(self, c: Chamado):
+        """Inclui o chamado; se o id já existia, reindexa na mesma posição."""
+        with self._lock:
+            posicao = self._posicao_de.get(c.id)
+            if posicao is not None:
+                self._desindexar(posicao, self._posicoes[posicao])
+            else:
+                posicao = self._posicao_de[c.id] = len(self._posicoes)
+                self._posicoes.append(None)
+                # Id menor que um já indexado: a ordem das posições deixa de ser a dos ids
+                if self._maior_id is not None and c.id < self._maior_id: self._fora_de_ordem = True
+                else: self._maior_id = c.id
+            self._posicoes[posicao] = c
+            self._indexar(posicao, c)
+
+    def remover(self, chamado_id: int):
+        with self._lock:
+            posicao = self._posicao_de.pop(chamado_id, None)
+            if posicao is None: return
+            self._desindexar(posicao, self._posicoes[posicao])
+            self._posicoes[posicao] = None
+
+    def limpar(self):
+        with self._lock:
+            self._zerar()
+
+    def organizar(self):
+        """Deixa o índice pronto para consultas (chamar na thread de quem alterou, não na da interface)."""
+        with self._lock:
+            self._reorganizar_se_preciso()
+
+    def _reorganizar_se_preciso(self):
+        """Refaz as posições se a ordem se perdeu ou se sobraram muitos buracos de remoções."""
+        buracos = len(self._posicoes) - len(self._posicao_de)
+        if not self._fora_de_ordem and (buracos < 1000 or buracos * 2 < len(self._posicoes)): return
+        chamados = [c for c in self._posicoes if c is not None]
+        self._zerar()
+        self._montar(chamados)
+
+    # --- CONSULTA ---
+    def _tokens_com(self, palavra: str) -> List[str]:
+        """Tokens que contêm a palavra. Digitando, a palavra anterior (sem a última letra) já filtrou o vocabulário."""
+        tokens = self._vocabulario.get(palavra)
+        if tokens is None:
+            anterior = self._vocabulario.get(palavra[:-1]) if len(palavra) > 1 else None
+            fonte = anterior if anterior is not None else self._por_token
+            tokens = [t for t in fonte if palavra in t]
+            if len(self._vocabulario) >= MAX_CACHE_VOCABULARIO: self._vocabulario.clear()
+            self._vocabulario[palavra] = tokens
+        return tokens
+
+    def _candidatos(self, palavra: str) -> Optional[Set[int]]:
+        """
+        Posições cujos tokens contêm a palavra, ou None quando ela casa com uma fatia tão grande
+        da lista que percorrer os chamados (comparação de texto em C) sai mais barato que unir conjuntos.
+        """
+        tokens = self._tokens_com(palavra)
+        limite = len(self._posicao_de) // FRACAO_VARREDURA
+        if len(tokens) > limite: return None
+        conjuntos = [self._por_token[t] for t in tokens if t in self._por_token]
+        if sum(len(c) for c in conjuntos) > limite: return None
+        return set().union(*conjuntos)
+
+    def _mascara(self, status, prioridade, categoria: str) -> Optional[int]:
+        mascara = None
+        if status is not None:
+            mascara = self._por_status.get(status, 0)
+        if prioridade is not None:
+            bits = self._por_prioridade.get(prioridade, 0)
+            mascara = bits if mascara is None else mascara & bits
+        if categoria:
+            bits = 0
+            for nome, bits_nome in self._por_categoria.items():
+                if categoria in nome: bits |= bits_nome
+            mascara = bits if mascara is None else mascara & bits
+        return mascara
+
+    def buscar(self, termo: str = "", status: Optional[StatusChamado] = None,
+               prioridade: Optional[Prioridade] = None, categoria: str = "") -> List[Chamado]:
+        """
+        Chamados que contêm `termo` (título ou id), com o status/prioridade dados e cuja
+        categoria contém `categoria`, do mais novo ao mais antigo. Mesmo resultado do filtro linear.
+        """
+        termo = termo.lower().strip()
+        categoria = categoria.lower()
+        with self._lock:
+            self._reorganizar_se_preciso()
+            posicoes = self._posicoes
+            mascara = self._mascara(status, prioridade, categoria)
+            marcados = _marcadores(mascara) if mascara is not None else None
+            palavras = _PALAVRA.findall(termo)
+
+            candidatos = None
+            if palavras:
+                # A palavra mais longa costuma ser a mais seletiva; as outras são conferidas no texto
+                candidatos = self._candidatos(max(palavras, key=len))
+
+            if candidatos is not None:
+                if marcados is not None:
+                    limite = len(marcados)
+                    candidatos = [p for p in candidatos if p < limite and marcados[p]]
+                resultado = [posicoes[p] for p in sorted(candidatos, reverse=True)]
+                # Uma palavra só: casar com algum token já é casar com o texto
+                if len(palavras) == 1 and palavras[0] == termo: return resultado
+            elif marcados is not None:
+                resultado = list(compress(posicoes, marcados))
+                resultado.reverse()
+            else:
+                resultado = list(filter(None, reversed(posicoes)))
+
+        if termo: resultado = [c for c in resultado if termo in c.texto_busca]
+        return resultado
+
+
+def filtrar_linear(chamados: Iterable[Chamado], termo: str = "", status: Optional[StatusChamado] = None,
+                   prioridade: Optional[Prioridade] = None, categoria: str = "") -> List[Chamado]:
+    """O filtro antigo das telas (uma passada pela lista), usado como referência no benchmark."""
+    termo = termo.lower().strip()
+    categoria = categoria.lower()
+    filtrados = []
+    for c in chamados:
+        if termo and termo not in c.texto_busca: continue
+        if status is not None and c.status is not status: continue
+        if prioridade is not None and c.prioridade is not prioridade: continue
+        if categoria and categoria not in c.categoria_busca: continue
+        filtrados.append(c)
+    return filtrados
+
+
+# --- BENCHMARK ---
+TITULOS_EXEMPLO = (
+    "Impressora {i} sem toner", "Erro ao acessar o sistema financeiro", "Notebook não liga",
+    "VPN desconectando ({i})", "Solicitação de acesso à pasta {i}", "Monitor piscando", "Outlook travado",
+)
+
+
+def benchmark(qtd: int = 100_000, alteracoes: int = 100) -> Dict[str, Any]:
+    """
+    Tempos (ms) para qtd chamados: montagem do índice, a sequência de consultas de quem
+    digita "impressora 12" (com e sem filtros) no filtro linear x no índice, e a manutenção
+    incremental de 'alteracoes' chamados. Confere que os dois filtros dão o mesmo resultado.
+    """
+    try:
+        from desktop_interface import normalizacao, modelo_chamado
+    except ImportError:
+        import normalizacao, modelo_chamado
+
+    brutos = normalizacao._gerar_chamados_exemplo(qtd)
+    for i, bruto in enumerate(brutos):
+        bruto["Titulo"] = TITULOS_EXEMPLO[i % len(TITULOS_EXEMPLO)].format(i=i)
+    chamados = modelo_chamado.converter_lista(normalizacao.normalizar("chamado", brutos))
+    chamados.sort(key=lambda c: c.id, reverse=True)
+
+    digitado = "impressora 12"
+    consultas = [dict(termo=digitado[:n]) for n in range(1, len(digitado) + 1)]
+    consultas += [
+        dict(termo="vpn", status=StatusChamado.ABERTO),
+        dict(status=StatusChamado.EM_ANDAMENTO, prioridade=Prioridade.ALTA),
+        dict(categoria="rede"),
+        dict(termo="#"),
+        dict(),
+    ]
+
+    def medir(func, repeticoes: int = 3) -> float:
+        melhor = float("inf")
+        for _ in range(repeticoes):
+            t0 = time.perf_counter()
+            func()
+            melhor = min(melhor, time.perf_counter() - t0)
+        return melhor * 1000
+
+    indice = IndiceChamados(chamados)
+    for consulta in consultas:
+        assert indice.buscar(**consulta) == filtrar_linear(chamados, **consulta), consulta
+
+    def linear():
+        for consulta in consultas: filtrar_linear(chamados, **consulta)
+
+    def com_indice():
+        for consulta in consultas: indice.buscar(**consulta)
+
+    def por_tecla():
+        # Só as consultas de texto, com o vocabulário da tecla anterior em cache (como na tela)
+        indice._vocabulario.clear()
+        for consulta in consultas[:len(digitado)]: indice.buscar(**consulta)
+
+    modificados = [Chamado(c.id, c.titulo + " urgente", c.descricao, StatusChamado.FECHADO, c.prioridade, c.id_categoria,
+                           c.nome_categoria, c.data_abertura, c.anexos) for c in chamados[:alteracoes]]
+
+    def incremental():
+        for c in modificados: indice.adicionar(c)
+
+    resultado = {
+        "qtd": qtd,
+        "consultas": len(consultas),
+        "montagem_ms": medir(lambda: IndiceChamados(chamados), repeticoes=1),
+        "linear_ms": medir(linear),
+        "indice_ms": medir(com_indice),
+        "digitando_ms_por_tecla": medir(por_tecla) / len(digitado),
+        "linear_ms_por_tecla": medir(lambda: [filtrar_linear(chamados, **c) for c in consultas[:len(digitado)]]) / len(digitado),
+        "incremental_ms": medir(incremental),
+    }
+    atualizados = {c.id: c for c in modificados}
+    referencia = [atualizados.get(c.id, c) for c in chamados]
+    assert indice.buscar("urgente") == filtrar_linear(referencia, "urgente")
+    return resultado
+
+
+if __name__ == "__main__":
+    for qtd in (10_000, 100_000):
+        for chave, valor in benchmark(qtd).items():
+            print(f"{chave:>24}: {valor:.2f}" if isinstance(valor, float) else f"{chave:>24}: {valor}")
+        print()
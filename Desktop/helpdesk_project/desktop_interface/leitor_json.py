@@ -0,0 +1,114 @@
+import codecs
+import json
+import re
+import time
+from typing import Iterable, Iterator, Any, Dict
+
+# ----------------------------------------------------------------------
+# LEITURA INCREMENTAL DE LISTAS JSON
+# ----------------------------------------------------------------------
+# Lê um array JSON de objetos a partir dos pedaços da resposta HTTP e devolve cada
+# objeto assim que ele termina de chegar. Só o objeto em andamento fica no buffer,
+# então o pico de memória é o do maior chamado, não o da lista inteira.
+
+_DELIMITADORES = re.compile(r'[{}\[\]"]')
+
+
+def iterar_array(pedacos: Iterable[bytes], encoding: str = "utf-8") -> Iterator[Any]:
+    """
+    Gera os objetos (ou arrays) de primeiro nível de um array JSON recebido em pedaços.
+    Escalares soltos no array são ignorados. Levanta ValueError se o corpo não for um array.
+    """
+    decodificador = codecs.getincrementaldecoder(encoding)()
+    buf = ""
+    pos = 0                # até onde o buffer já foi varrido
+    profundidade = 0
+    em_string = False
+    inicio_item = None     # posição do '{' / '[' que abriu o item atual
+    iniciado = False
+
+    for pedaco in pedacos:
+        if not pedaco: continue
+        buf += decodificador.decode(pedaco)
+
+        while True:
+            if not iniciado:
+                resto = buf[pos:].lstrip()
+                if not resto: pos = len(buf); break
+                if resto[0] != "[": raise ValueError("Resposta não é uma lista JSON.")
+                pos = buf.index("[", pos) + 1
+                profundidade, iniciado = 1, True
+                continue
+
+            if em_string:
+                fim = buf.find('"', pos)
+                if fim < 0: pos = len(buf); break
+                # Aspas escapadas têm um número ímpar de barras antes
+                barras = 0
+                while buf[fim - 1 - barras] == "\\": barras += 1
+                pos = fim + 1
+                if barras % 2 == 0: em_string = False
+                continue
+
+            achado = _DELIMITADORES.search(buf, pos)
+            if achado is None: pos = len(buf); break
+            ch, idx = achado.group(), achado.start()
+            pos = idx + 1
+
+            if ch == '"':
+                em_string = True
+            elif ch in "{[":
+                if profundidade == 1: inicio_item = idx
+                profundidade += 1
+            else:
+                profundidade -= 1
+                if profundidade == 1 and inicio_item is not None:
+                    yield json.loads(buf[inicio_item:pos])
+                    inicio_item = None
+                elif profundidade == 0:
+                    return
+
+        # Descarta o que já foi consumido, preservando o item em andamento
+        corte = inicio_item if inicio_item is not None else pos
+        if corte:
+            buf = buf[corte:]
+            pos -= corte
+            if inicio_item is not None: inicio_item = 0
+
+    if iniciado: raise ValueError("Lista JSON incompleta.")
+
+
+def _pedacos(texto: str, tamanho: int) -> Iterator[bytes]:
+    dados = texto.encode("utf-8")
+    for i in range(0, len(dados), tamanho):
+        yield dados[i:i + tamanho]
+
+
+def benchmark(qtd: int = 2000, tamanho_anexo: int = 32 * 1024, tamanho_pedaco: int = 64 * 1024) -> Dict[str, float]:
+    """Tempo até o primeiro item e tempo total: json.loads do corpo inteiro x leitura incremental."""
+    corpo = json.dumps([
+        {"IdChamado": i, "Titulo": f"Chamado {i} \"urgente\"", "Status": "Aberto",
+         "ChamadoAnexos": [{"NomeArquivo": "print.png", "DadosBase64": "A" * tamanho_anexo}] if i % 3 == 0 else []}
+        for i in range(qtd)
+    ])
+
+    inicio = time.perf_counter()
+    lista = json.loads(b"".join(_pedacos(corpo, tamanho_pedaco)))
+    total_inteiro = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    primeiro = None
+    contagem = 0
+    for _ in iterar_array(_pedacos(corpo, tamanho_pedaco)):
+        if primeiro is None: primeiro = time.perf_counter() - inicio
+        contagem += 1
+    total_incremental = time.perf_counter() - inicio
+
+    assert contagem == len(lista)
+    return {"mb": len(corpo) / 1e6, "inteiro_s": total_inteiro, "primeiro_s": primeiro, "incremental_s": total_incremental}
+
+
+if __name__ == "__main__":
+    r = benchmark()
+    print(f"Corpo de {r['mb']:.1f} MB | json.loads: {r['inteiro_s'] * 1000:.0f} ms até o 1º item | "
+          f"incremental: 1º item em {r['primeiro_s'] * 1000:.2f} ms, total {r['incremental_s'] * 1000:.0f} ms")
@@ -0,0 +1,273 @@
+import customtkinter as ctk
+from tkinter import messagebox
+import sys
+import os
+import math
+
+# --- CONFIGURAÇÃO DE PATH ---
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+
+# --- IMPORT DO API CLIENT ---
+try:
+    from desktop_interface import api_client
+    from desktop_interface import modelo_chamado
+    from desktop_interface import pool_tarefas
+    from desktop_interface import lista_virtual
+    from desktop_interface import indice_busca
+    from desktop_interface import replica_chamados
+    from desktop_interface import filtro_assincrono
+    from desktop_interface import paginador_chamados
+except ImportError:
+    import api_client
+    import modelo_chamado
+    import pool_tarefas
+    import lista_virtual
+    import indice_busca
+    import replica_chamados
+    import filtro_assincrono
+    import paginador_chamados
+
+from desktop_interface.ticket_detalhe import abrir_ticket_detalhe
+
+# ----------------------------------------------------------------------
+# TELA DE LISTAGEM DE CHAMADOS (COMPARTILHADA)
+# ----------------------------------------------------------------------
+# "Gerenciar Chamados" (todos_chamados) e "Meus Chamados" (meus_chamados) são a mesma
+# tela sobre escopos diferentes da API. Aqui fica tudo o que elas têm em comum: filtros
+# com debounce (filtro_assincrono), índice local (replica_chamados/indice_busca) ou
+# paginação no servidor (paginador_chamados), e a ListaVirtual com os cards.
+
+# Configurações de Paginação (também é o tamanho do pool de cards da lista)
+ITENS_POR_PAGINA = 5
+
+
+def abrir_lista_chamados(conteudo_frame, user, escopo, titulo, reabrir, vazio="Nenhum registro encontrado."):
+    """
+    Monta a tela de listagem do escopo ('todos' ou 'meus') em conteudo_frame.
+    reabrir(conteudo_frame, user): volta para esta tela (ex.: "← Voltar" do detalhe).
+    """
+    for widget in conteudo_frame.winfo_children():
+        widget.destroy()
+
+    state = {
+        "indice": indice_busca.IndiceChamados(),
+        "dados_filtrados": [],
+        "carregando": False,
+        # Modo servidor (API paginada): só a página visível vem pela rede, a seguinte já pré-carregada
+        "paginador": None,
+        "pagina": None
+    }
+
+    # === HEADER ===
+    header = ctk.CTkFrame(conteudo_frame, fg_color="transparent")
+    header.pack(fill="x", padx=30, pady=(30, 10))
+
+    ctk.CTkLabel(header, text=titulo, font=("Helvetica", 24, "bold"), text_color="#1E293B").pack(side="left")
+    lbl_contador = ctk.CTkLabel(header, text="...", font=("Helvetica", 14), text_color="#64748B")
+    lbl_contador.pack(side="right", pady=5)
+
+    # === ÁREA DE FILTROS ===
+    filtros_frame = ctk.CTkFrame(conteudo_frame, fg_color="white", corner_radius=10)
+    filtros_frame.pack(fill="x", padx=30, pady=(0, 20))
+    
+    filtros_frame.grid_columnconfigure(0, weight=2)
+    filtros_frame.grid_columnconfigure((1,2,3,4), weight=1)
+
+    busca_var = ctk.StringVar()
+    entry_busca = ctk.CTkEntry(filtros_frame, placeholder_text="🔍 Buscar por ID, Título...", 
+                               textvariable=busca_var, height=35, border_width=1, border_color="#CBD5E1")
+    entry_busca.grid(row=0, column=0, padx=10, pady=10, sticky="ew")
+
+    status_var = ctk.StringVar(value="Todos Status")
+    cat_var = ctk.StringVar(value="Todas Categorias")
+    prio_var = ctk.StringVar(value="Todas Prioridades")
+    
+    ctk.CTkOptionMenu(filtros_frame, variable=status_var, values=["Todos Status", "Aberto", "Em Andamento", "Resolvido", "Fechado"], 
+                      height=35, fg_color="#F1F5F9", text_color="#334155", button_color="#CBD5E1", button_hover_color="#94A3B8").grid(row=0, column=1, padx=5)
+
+    ctk.CTkOptionMenu(filtros_frame, variable=cat_var, values=["Todas Categorias", "Hardware", "Software", "Rede", "Outros"], 
+                      height=35, fg_color="#F1F5F9", text_color="#334155", button_color="#CBD5E1", button_hover_color="#94A3B8").grid(row=0, column=2, padx=5)
+
+    ctk.CTkOptionMenu(filtros_frame, variable=prio_var, values=["Todas Prioridades", "Baixa", "Média", "Alta"], 
+                      height=35, fg_color="#F1F5F9", text_color="#334155", button_color="#CBD5E1", button_hover_color="#94A3B8").grid(row=0, column=3, padx=5)
+
+    # === CONTAINER DA LISTA ===
+    lista_container = ctk.CTkFrame(conteudo_frame, fg_color="transparent") 
+    lista_container.pack(fill="both", expand=True, padx=20)
+
+    # === RODAPÉ DE PAGINAÇÃO ===
+    paginacao_frame = ctk.CTkFrame(conteudo_frame, fg_color="transparent", height=50)
+    paginacao_frame.pack(fill="x", padx=30, pady=10, side="bottom")
+
+    btn_anterior = ctk.CTkButton(paginacao_frame, text="< Anterior", width=100, fg_color="#334155", state="disabled", command=lambda: mudar_pagina(-1))
+    btn_anterior.pack(side="left")
+
+    lbl_paginacao = ctk.CTkLabel(paginacao_frame, text="Página 1 de 1", font=("Helvetica", 14, "bold"))
+    lbl_paginacao.pack(side="left", expand=True)
+
+    btn_proximo = ctk.CTkButton(paginacao_frame, text="Próximo >", width=100, fg_color="#334155", state="disabled", command=lambda: mudar_pagina(1))
+    btn_proximo.pack(side="right")
+
+    # ==========================================
+    # LÓGICA
+    # ==========================================
+
+    def mudar_pagina(direcao):
+        pagina = state["pagina"]
+        if state["paginador"] is not None and pagina is not None:
+            numero = pagina.numero + direcao
+            if 1 <= numero <= pagina.total_paginas: filtro.pedir(consulta_atual(numero), imediato=True)
+            return
+        lista.ir_para_pagina(lista.pagina_atual() + direcao)
+
+    def carregar_dados_thread():
+        if not api_client.AUTH_TOKEN: return
+
+        # Se a API pagina no servidor, nem baixa a lista inteira (a descoberta fica gravada)
+        if api_client.paginacao_no_servidor(escopo) is not False:
+            paginador = paginador_chamados.PaginadorChamados(escopo, ITENS_POR_PAGINA, dono=lista_container)
+            sucesso, pagina = paginador.obter(1)
+            if sucesso and pagina.origem == "servidor":
+                modelos = modelo_chamado.converter_lista(pagina.itens)
+                if conteudo_frame.winfo_exists():
+                    conteudo_frame.after(0, lambda: ativar_modo_servidor(paginador, pagina, modelos))
+                return
+            # Sem paginação no servidor: a lista completa que veio na tentativa foi registrada como a
+            # lista sem parâmetros (voo_unico), e a leitura abaixo a reaproveita em vez de baixar de novo
+
+        primeiro_lote = [True]
+
+        def ao_receber_lote(parcial):
+            # Mostra a primeira página enquanto o resto da lista ainda está chegando
+            if not primeiro_lote[0] or not conteudo_frame.winfo_exists(): return
+            primeiro_lote[0] = False
+            indice = indice_busca.IndiceChamados(modelo_chamado.converter_lista(parcial))
+            conteudo_frame.after(0, lambda: processar_dados_iniciais(True, indice, parcial=True))
+
+        sucesso, dados = api_client.listar_chamados_em_lotes(escopo, ao_receber_lote, lote=ITENS_POR_PAGINA)
+        if sucesso:
+            # A réplica guarda o índice entre as visitas: só os chamados que mudaram são reindexados
+            replica = replica_chamados.obter_replica(escopo)
+            replica.aplicar(dados)
+            dados = replica.indice
+        if conteudo_frame.winfo_exists():
+            conteudo_frame.after(0, lambda: processar_dados_iniciais(sucesso, dados))
+
+    def processar_dados_iniciais(sucesso, dados, parcial=False):
+        if not lbl_contador.winfo_exists(): return
+        if not sucesso:
+            lbl_contador.configure(text="Erro de conexão")
+            return
+
+        state["indice"] = dados
+        state["carregando"] = parcial
+        aplicar_filtro(imediato=True)
+
+    def ativar_modo_servidor(paginador, pagina, modelos):
+        if not lbl_contador.winfo_exists(): return
+        state["paginador"] = paginador
+        exibir_filtrados(("pagina", pagina, modelos))
+        # Algum filtro mexido enquanto a primeira página carregava: refaz já no servidor
+        if any(consulta_atual()[1].values()): aplicar_filtro(imediato=True)
+
+    def consulta_atual(numero=1):
+        termo = busca_var.get()
+        f_status = status_var.get().lower().replace("todos status", "")
+        f_cat = cat_var.get().lower().replace("todas categorias", "")
+        f_prio = prio_var.get().lower().replace("todas prioridades", "")
+
+        status_alvo = modelo_chamado.StatusChamado.de_texto(f_status) if f_status else None
+        prio_alvo = modelo_chamado.Prioridade.de_texto(f_prio) if f_prio else None
+
+        if state["paginador"] is not None:
+            filtros = {
+                "termo": termo.strip(),
+                "status": status_alvo.value if status_alvo else None,
+                "prioridade": prio_alvo.value if prio_alvo else None,
+                "categoria": api_client.MAP_CATEGORIA_PARA_ID.get(f_cat),
+            }
+            return "servidor", filtros, numero
+        return "local", (state["indice"], termo, status_alvo, prio_alvo, f_cat)
+
+    def filtrar(consulta, cancelada):
+        # Roda no pool
+        if consulta[0] == "servidor":
+            _, filtros, numero = consulta
+            paginador = state["paginador"]
+            if paginador.filtros != {k: v for k, v in filtros.items() if v not in (None, "")}:
+                paginador = paginador_chamados.PaginadorChamados(escopo, ITENS_POR_PAGINA, filtros=filtros, dono=lista_container)
+                state["paginador"] = paginador
+            sucesso, pagina = paginador.obter(numero)
+            if not sucesso: return "erro", pagina
+            return "pagina", pagina, modelo_chamado.converter_lista(pagina.itens)
+
+        # Índice invertido: texto e filtros respondidos por interseção, já do mais novo ao mais antigo
+        indice, termo, status_alvo, prio_alvo, f_cat = consulta[1]
+        return "lista", indice.buscar(termo, status_alvo, prio_alvo, f_cat)
+
+    def exibir_filtrados(resultado):
+        if resultado[0] == "erro":
+            lbl_contador.configure(text="Erro de conexão")
+            return
+        if resultado[0] == "pagina":
+            _, pagina, modelos = resultado
+            state["pagina"] = pagina
+            state["dados_filtrados"] = modelos
+            lbl_contador.configure(text=f"{pagina.total} chamados encontrados")
+            lista.definir(modelos)
+            return
+
+        filtrados = resultado[1]
+        state["dados_filtrados"] = filtrados
+
+        if state["carregando"]: lbl_contador.configure(text=f"Carregando... {len(state['indice'])} chamados até agora")
+        else: lbl_contador.configure(text=f"{len(filtrados)} chamados encontrados")
+        lista.definir(filtrados)
+
+    def aplicar_filtro(imediato=False):
+        # Só anota a consulta: o filtro roda fora da thread da interface quando a digitação pausa
+        filtro.pedir(consulta_atual(), imediato=imediato)
+
+    def atualizar_paginacao(inicio, total_itens):
+        pagina = state["pagina"]
+        if state["paginador"] is not None and pagina is not None:
+            lbl_paginacao.configure(text=f"Página {pagina.numero} de {pagina.total_paginas}" if pagina.total else "0 de 0")
+            btn_anterior.configure(state="normal" if pagina.numero > 1 else "disabled")
+            btn_proximo.configure(state="normal" if pagina.tem_proxima else "disabled")
+            return
+
+        # A lista rola linha a linha (roda do mouse/barra); a página é a do primeiro item visível,
+        # a mesma conta que os botões usam (ListaVirtual.pagina_atual)
+        if total_itens == 0:
+            lbl_paginacao.configure(text="0 de 0")
+            btn_anterior.configure(state="disabled")
+            btn_proximo.configure(state="disabled")
+            return
+
+        total_paginas = math.ceil(total_itens / ITENS_POR_PAGINA)
+        pag_atual = inicio // ITENS_POR_PAGINA + 1
+
+        lbl_paginacao.configure(text=f"Página {pag_atual} de {total_paginas}")
+        btn_anterior.configure(state="normal" if inicio > 0 else "disabled")
+        btn_proximo.configure(state="normal" if pag_atual < total_paginas else "disabled")
+
+    def abrir_detalhe(c):
+        abrir_ticket_detalhe(c.id, user, conteudo_frame, lambda: reabrir(conteudo_frame, user))
+
+    # Cards criados uma vez; trocar de página, rolar ou filtrar só preenche os mesmos widgets
+    lista = lista_virtual.ListaVirtual(
+        lista_container, lambda parent: lista_virtual.CartaoChamado(parent, abrir_detalhe), ITENS_POR_PAGINA,
+        vazio=vazio, ao_mover=atualizar_paginacao, fonte_vazio=("Arial", 16),
+    )
+
+    filtro = filtro_assincrono.FiltroAssincrono(lista_container, filtrar, exibir_filtrados)
+
+    entry_busca.bind("<KeyRelease>", lambda e: aplicar_filtro())
+    status_var.trace_add("write", lambda *a: aplicar_filtro(imediato=True))
+    cat_var.trace_add("write", lambda *a: aplicar_filtro(imediato=True))
+    prio_var.trace_add("write", lambda *a: aplicar_filtro(imediato=True))
+
+    pool_tarefas.enviar(carregar_dados_thread, dono=lista_container)
\ No newline at end of file
@@ -0,0 +1,293 @@
+import customtkinter as ctk
+import tkinter
+import math
+import sys
+import os
+from typing import Callable, List, Optional
+
+# --- CONFIGURAÇÃO DE PATH ---
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path: sys.path.append(parent_dir)
+
+# ----------------------------------------------------------------------
+# LISTA DE CHAMADOS COM CARTÕES REAPROVEITADOS
+# ----------------------------------------------------------------------
+# Antes cada página (e cada atualização dos painéis) destruía todos os cards e criava
+# outros: ~10 widgets CTk por chamado, refeitos a cada clique. Aqui os cartões são
+# criados uma vez (quantos cabem na janela visível) e preencher() só troca textos e
+# cores. A lista pode ter milhares de itens: a roda do mouse e a barra de rolagem
+# movem a janela linha a linha, e vários eventos seguidos viram uma única pintura.
+
+# Mapeamento de Cores: (Cor do Fundo, Cor do Texto)
+CORES_STATUS = {
+    "aberto":           ("#0284C7", "#FFFFFF"), # Azul
+    "em andamento":     ("#FACC15", "#1E293B"), # Amarelo
+    "resolvido":        ("#16A34A", "#FFFFFF"), # Verde
+    "fechado":          ("#475569", "#FFFFFF"), # Cinza
+    "aguardando info":  ("#FB923C", "#1E293B"), # Laranja
+    "default":          ("#94A3B8", "#FFFFFF")
+}
+
+# Faixa dos cards compactos dos painéis
+CORES_FAIXA = {
+    "aberto": "#0284C7",
+    "em andamento": "#EAB308",
+    "resolvido": "#16A34A",
+    "fechado": "#16A34A",
+}
+COR_FAIXA_PADRAO = "#4A5568"
+
+
+def _configurar(widget, **opcoes):
+    """configure() só com o que mudou (reconfigurar um widget CTk redesenha o canvas dele)."""
+    mudou = {k: v for k, v in opcoes.items() if widget.cget(k) != v}
+    if mudou: widget.configure(**mudou)
+
+
+class CartaoChamado:
+    """Card completo das telas de listagem (ID, título, descrição, metadados, status, Detalhes)."""
+
+    def __init__(self, parent, ao_abrir: Callable):
+        self.chamado = None
+        self.ao_abrir = ao_abrir
+
+        self.frame = ctk.CTkFrame(parent, fg_color="white", corner_radius=12, border_width=1, border_color="#E2E8F0")
+
+        # Coluna Principal
+        main_col = ctk.CTkFrame(self.frame, fg_color="transparent")
+        main_col.pack(side="left", fill="both", expand=True, padx=15, pady=12)
+
+        # Cabeçalho (ID + Título)
+        self.header = ctk.CTkFrame(main_col, fg_color="transparent")
+        self.header.pack(fill="x")
+        self.lbl_id = ctk.CTkLabel(self.header, text="", font=("Helvetica", 14, "bold"), text_color="#64748B")
+        self.lbl_id.pack(side="left")
+        self.lbl_titulo = ctk.CTkLabel(self.header, text="", font=("Helvetica", 16, "bold"), text_color="#1E293B")
+        self.lbl_titulo.pack(side="left", padx=10)
+
+        # Descrição (some quando o chamado não tem)
+        self.lbl_descricao = ctk.CTkLabel(main_col, text="", font=("Helvetica", 13), text_color="#475569", anchor="w")
+        self._descricao_visivel = False
+
+        # Data | Categoria | Prioridade
+        self.lbl_meta = ctk.CTkLabel(main_col, text="", font=("Helvetica", 12, "bold"), text_color="#64748B", anchor="w")
+        self.lbl_meta.pack(fill="x", pady=(8, 0))
+
+        # Coluna Lateral (Botões)
+        side_col = ctk.CTkFrame(self.frame, fg_color="transparent")
+        side_col.pack(side="right", padx=15, pady=12)
+
+        self.btn_status = ctk.CTkButton(side_col, text="",
+                                        fg_color=CORES_STATUS["default"][0], text_color=CORES_STATUS["default"][1],
+                                        font=("Helvetica", 12, "bold"), height=28, width=120, corner_radius=14,
+                                        hover=False, state="disabled")
+        self.btn_status.pack(pady=(0, 10))
+
+        ctk.CTkButton(side_col, text="Detalhes", width=120, height=32,
+                      fg_color="transparent", border_width=1, border_color="#5BA39C", text_color="#5BA39C",
+                      hover_color="#F0FDFA", font=("Helvetica", 13, "bold"),
+                      command=self._abrir
+                      ).pack()
+
+    def _abrir(self):
+        if self.chamado is not None: self.ao_abrir(self.chamado)
+
+    def preencher(self, c):
+        if c is self.chamado: return
+        self.chamado = c
+
+        descricao = c.descricao
+        if len(descricao) > 100: descricao = descricao[:100] + "..."
+        status_raw = c.status.value
+        cor_bg, cor_texto = CORES_STATUS.get(status_raw, CORES_STATUS["default"])
+
+        _configurar(self.lbl_id, text=f"#{c.id}")
+        _configurar(self.lbl_titulo, text=c.titulo)
+        if descricao:
+            _configurar(self.lbl_descricao, text=descricao)
+            if not self._descricao_visivel:
+                self.lbl_descricao.pack(fill="x", pady=(4, 0), after=self.header)
+                self._descricao_visivel = True
+        elif self._descricao_visivel:
+            self.lbl_descricao.pack_forget()
+            self._descricao_visivel = False
+        _configurar(self.lbl_meta, text=f"📅 {c.data_formatada}   •   📁 {c.nome_categoria}   •   ⚡ Prioridade: {c.prioridade.rotulo}")
+        _configurar(self.btn_status, text=c.status_texto.upper(), fg_color=cor_bg, text_color=cor_texto)
+
+    def mostrar(self):
+        self.frame.pack(fill="x", padx=10, pady=6)
+
+    def esconder(self):
+        self.frame.pack_forget()
+
+
+class CartaoCompacto:
+    """Card de linha única dos painéis (ID, título, status, Detalhes)."""
+
+    def __init__(self, parent, ao_abrir: Callable, texto_status: Optional[Callable] = None):
+        self.chamado = None
+        self.ao_abrir = ao_abrir
+        self.texto_status = texto_status or (lambda c: c.status_texto)
+
+        self.frame = ctk.CTkFrame(parent, fg_color="white", corner_radius=8, border_width=1, border_color=COR_FAIXA_PADRAO)
+
+        content_frame = ctk.CTkFrame(self.frame, fg_color="transparent")
+        content_frame.pack(side="left", fill="both", expand=True, padx=10, pady=5)
+
+        self.lbl_id = ctk.CTkLabel(content_frame, text="", font=("Helvetica", 13, "bold"), text_color="#64748B", width=35)
+        self.lbl_id.pack(side="left", padx=(0, 10))
+        self.lbl_titulo = ctk.CTkLabel(content_frame, text="", font=("Helvetica", 14, "bold"), text_color="#1E293B", anchor="w")
+        self.lbl_titulo.pack(side="left", fill="x", expand=True)
+
+        right_frame = ctk.CTkFrame(self.frame, fg_color="transparent")
+        right_frame.pack(side="right", padx=10)
+
+        self.lbl_status = ctk.CTkLabel(right_frame, text="", font=("Helvetica", 11, "bold"), text_color=COR_FAIXA_PADRAO)
+        self.lbl_status.pack(side="left", padx=10)
+
+        ctk.CTkButton(
+            right_frame, text="Detalhes", width=70, height=28, fg_color="#5BA39C", hover_color="#4C8E87",
+            font=("Helvetica", 11, "bold"), command=self._abrir
+        ).pack(side="right")
+
+    def _abrir(self):
+        if self.chamado is not None: self.ao_abrir(self.chamado)
+
+    def preencher(self, c):
+        if c is self.chamado: return
+        self.chamado = c
+
+        cor_faixa = CORES_FAIXA.get(c.status.value, COR_FAIXA_PADRAO)
+        _configurar(self.frame, border_color=cor_faixa)
+        _configurar(self.lbl_id, text=f"#{c.id or '?'}")
+        _configurar(self.lbl_titulo, text=c.titulo)
+        _configurar(self.lbl_status, text=self.texto_status(c), text_color=cor_faixa)
+
+    def mostrar(self):
+        self.frame.pack(fill="x", padx=5, pady=4)
+
+    def esconder(self):
+        self.frame.pack_forget()
+
+
+class ListaVirtual:
+    """
+    Janela de `linhas` cartões sobre uma lista de qualquer tamanho.
+    criar_cartao(parent) -> objeto com preencher(c), mostrar() e esconder().
+    ao_mover(inicio, total) é chamado depois de cada pintura (para paginação/contadores).
+    """
+
+    def __init__(self, master, criar_cartao: Callable, linhas: int, vazio: str = "Nenhum registro encontrado.",
+                 rolagem: bool = True, ao_mover: Optional[Callable] = None, fonte_vazio=None):
+        self.linhas = linhas
+        self.ao_mover = ao_mover
+        self.itens: List = []
+        self.inicio = 0
+        self._alvo: Optional[int] = None  # posição pedida e ainda não pintada
+        self._visiveis = 0
+
+        self.frame = ctk.CTkFrame(master, fg_color="transparent")
+        self.frame.pack(fill="both", expand=True)
+
+        self.barra = None
+        if rolagem:
+            self.barra = ctk.CTkScrollbar(self.frame, command=self._pela_barra)
+            self.barra.pack(side="right", fill="y")
+
+        self.area = ctk.CTkFrame(self.frame, fg_color="transparent")
+        self.area.pack(side="left", fill="both", expand=True)
+
+        self.lbl_vazio = ctk.CTkLabel(self.area, text=vazio, text_color="gray", font=fonte_vazio)
+        self._vazio_visivel = False
+
+        # O pool: criado uma vez, nunca destruído enquanto a tela existir
+        self.cartoes = [criar_cartao(self.area) for _ in range(linhas)]
+
+        if rolagem: self._ligar_roda(self.frame)
+
+    # --- ROLAGEM ---
+    def _ligar_roda(self, widget):
+        # Direto no widget Tk (bind do CTk repassaria aos filhos internos e o evento contaria duas vezes)
+        for sequencia in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            tkinter.Misc.bind(widget, sequencia, self._pela_roda, "+")
+        for filho in widget.winfo_children():
+            self._ligar_roda(filho)
+
+    def _pela_roda(self, evento):
+        if getattr(evento, "num", None) == 4: passo = -1
+        elif getattr(evento, "num", None) == 5: passo = 1
+        else: passo = -1 if evento.delta > 0 else 1
+        self.rolar(passo)
+        return "break"
+
+    def _pela_barra(self, acao, valor, unidade=None):
+        if acao == "moveto":
+            self.ir_para(round(float(valor) * len(self.itens)))
+        elif acao == "scroll":
+            passo = 1 if float(valor) > 0 else -1
+            self.rolar(passo * (self.linhas if unidade == "pages" else 1))
+
+    def rolar(self, passo: int):
+        base = self._alvo if self._alvo is not None else self.inicio
+        self.ir_para(base + passo)
+
+    def ir_para(self, inicio: int):
+        """Move a janela (roda/barra), sem passar de len - linhas; pedidos em sequência viram uma pintura só."""
+        maximo = max(0, len(self.itens) - self.linhas)
+        self._agendar(min(max(0, inicio), maximo))
+
+    def ir_para_pagina(self, pagina: int):
+        """
+        Botões de página (pagina começa em 0): a janela começa sempre num múltiplo de linhas,
+        e a última página pode vir incompleta. Assim o rótulo (pagina_atual) não escorrega.
+        """
+        ultima = max(0, math.ceil(len(self.itens) / self.linhas) - 1)
+        self._agendar(min(max(0, pagina), ultima) * self.linhas)
+
+    def pagina_atual(self) -> int:
+        """Página (a partir de 0) do primeiro item visível (ou já pedido)."""
+        base = self._alvo if self._alvo is not None else self.inicio
+        return base // self.linhas
+
+    def _agendar(self, inicio: int):
+        agendado = self._alvo is not None
+        self._alvo = inicio
+        if not agendado: self.frame.after_idle(self._pintar)
+
+    # --- DADOS ---
+    def definir(self, itens: List, inicio: int = 0):
+        """Troca a lista inteira (ex.: filtro novo) e pinta a partir de inicio."""
+        self.itens = itens
+        maximo = max(0, len(itens) - self.linhas)
+        self.inicio = min(max(0, inicio), maximo)
+        self._alvo = None
+        self._pintar()
+
+    def _pintar(self):
+        if self._alvo is not None:
+            self.inicio, self._alvo = self._alvo, None
+        if not self.frame.winfo_exists(): return
+
+        total = len(self.itens)
+        janela = self.itens[self.inicio:self.inicio + self.linhas]
+
+        for cartao, item in zip(self.cartoes, janela):
+            cartao.preencher(item)
+        # Os escondidos são sempre os últimos do pool: mostrar() reempacota na ordem certa
+        for i in range(self._visiveis, len(janela)): self.cartoes[i].mostrar()
+        for i in range(len(janela), self._visiveis): self.cartoes[i].esconder()
+        self._visiveis = len(janela)
+
+        if total == 0 and not self._vazio_visivel:
+            self.lbl_vazio.pack(pady=40)
+            self._vazio_visivel = True
+        elif total and self._vazio_visivel:
+            self.lbl_vazio.pack_forget()
+            self._vazio_visivel = False
+
+        if self.barra is not None:
+            if total > self.linhas: self.barra.set(self.inicio / total, (self.inicio + len(janela)) / total)
+            else: self.barra.set(0.0, 1.0)
+
+        if self.ao_mover: self.ao_mover(self.inicio, total)
@@ -1,7 +1,6 @@
 import customtkinter as ctk
 from tkinter import messagebox
 from PIL import Image
-import threading
 import sys
 import os
 
@@ -14,15 +13,28 @@ if parent_dir not in sys.path:
 # --- IMPORT API ---
 try:
     from desktop_interface import api_client
+    from desktop_interface import fila_envio
+    from desktop_interface import pool_tarefas
+    from desktop_interface import carregamento_tardio
 except ImportError:
     import api_client
+    import fila_envio
+    import pool_tarefas
+    import carregamento_tardio
 
-# Importa dashboards
-from desktop_interface.admin.dashboard_admin import abrir_dashboard_admin
-from desktop_interface.tecnico.dashboard_tecnico import abrir_dashboard_tecnico
-from desktop_interface.colaborador.dashboard_colaborador import (
-    abrir_dashboard_colaborador,
-)
+# Dashboards: só o do papel do usuário é importado, depois da autenticação
+# (cada um puxa todas as suas telas; nada disso precisa existir para a janela de login)
+DASHBOARDS = {
+    "admin": ("desktop_interface.admin.dashboard_admin", "abrir_dashboard_admin"),
+    "tecnico": ("desktop_interface.tecnico.dashboard_tecnico", "abrir_dashboard_tecnico"),
+    "colaborador": ("desktop_interface.colaborador.dashboard_colaborador", "abrir_dashboard_colaborador"),
+}
+
+
+def dashboard_do_papel(role):
+    role = (role or "colaborador").lower()
+    if role == "administrador": role = "admin"
+    return DASHBOARDS.get(role, DASHBOARDS["colaborador"])
 
 # ====================== CONFIGURAÇÃO DA JANELA ======================
 
@@ -162,14 +174,15 @@ def acao_botao_login():
         messagebox.showerror("Atenção", "Preencha todos os campos.")
         return
     btn_login.configure(state="disabled", text="ENTRANDO...", fg_color="#4C8E87")
-    threading.Thread(
-        target=thread_login_worker, args=(email, senha), daemon=True
-    ).start()
+    pool_tarefas.enviar(thread_login_worker, email, senha, obrigatoria=True)
 
 
 def thread_login_worker(email, senha):
     try:
         sucesso, mensagem, user_data = api_client.realizar_login(email, senha)
+        if sucesso:
+            # Importa o dashboard ainda aqui, fora da thread da interface
+            carregamento_tardio.importar(dashboard_do_papel(user_data.get("role"))[0])
         app.after(0, lambda: processar_resultado(sucesso, mensagem, user_data))
     except Exception as e:
         app.after(0, lambda: processar_resultado(False, f"Erro interno: {e}", None))
@@ -184,13 +197,10 @@ def processar_resultado(sucesso, mensagem, user_data):
 
     if sucesso:
         app.withdraw()
-        role = user_data.get("role", "colaborador").lower()
-        if role in ["admin", "administrador"]:
-            abrir_dashboard_admin(app, user_data)
-        elif role == "tecnico":
-            abrir_dashboard_tecnico(app, user_data)
-        else:
-            abrir_dashboard_colaborador(app, user_data)
+        fila_envio.iniciar()
+        modulo, funcao = dashboard_do_papel(user_data.get("role", "colaborador"))
+        abrir_dashboard = getattr(carregamento_tardio.importar(modulo), funcao)
+        abrir_dashboard(app, user_data)
     else:
         messagebox.showerror("Erro", mensagem)
 
@@ -9,6 +9,11 @@ parent_dir = os.path.dirname(current_dir)
 if parent_dir not in sys.path:
     sys.path.append(parent_dir)
 
+try:
+    from desktop_interface import fila_envio
+except ImportError:
+    import fila_envio
+
 def criar_menu_lateral(
     janela_dashboard, 
     usuario, 
@@ -119,6 +124,11 @@ def criar_menu_lateral(
     # Espaçador para empurrar o Logout para o fundo
     ctk.CTkFrame(menu_frame, fg_color="transparent").pack(fill="both", expand=True)
 
+    # Envios aguardando conexão (chamados, comentários, status)
+    lbl_fila = ctk.CTkLabel(menu_frame, text="", font=("Helvetica", 12, "bold"), text_color="#B45309")
+    lbl_fila.pack(fill="x", padx=20)
+    fila_envio.monitorar_profundidade(lbl_fila)
+
     # Botão Logout
     ctk.CTkButton(
         menu_frame, 
@@ -0,0 +1,190 @@
+import tracemalloc
+import logging
+from datetime import datetime
+from enum import Enum
+from typing import Optional, Dict, Any, List, Iterable
+
+# ----------------------------------------------------------------------
+# REGISTRO COMPACTO DE CHAMADO
+# ----------------------------------------------------------------------
+# As listas e dashboards só precisam de id, título, status, prioridade, categoria,
+# data e quais anexos existem. O dict normalizado carrega ainda o base64 dos anexos
+# e strings que as telas reconvertiam com str(...).lower() a cada tecla do filtro.
+# Aqui tudo é resolvido uma vez, na conversão.
+
+# Mapeia ID -> Nome (Caso a API mande só o ID)
+MAPA_CATEGORIAS = {
+    1: "Hardware", 2: "Software", 3: "Rede", 4: "Impressora", 5: "Outros"
+}
+
+
+class StatusChamado(Enum):
+    ABERTO = "aberto"
+    EM_ANDAMENTO = "em andamento"
+    AGUARDANDO_INFO = "aguardando info"
+    RESOLVIDO = "resolvido"
+    FECHADO = "fechado"
+    OUTRO = "outro"
+
+    @classmethod
+    def de_texto(cls, valor: Any) -> "StatusChamado":
+        texto = str(valor or "aberto").strip().lower()
+        if texto == "em análise": return cls.EM_ANDAMENTO
+        return _STATUS_POR_TEXTO.get(texto, cls.OUTRO)
+
+    @property
+    def finalizado(self) -> bool:
+        return self in (StatusChamado.RESOLVIDO, StatusChamado.FECHADO)
+
+    @property
+    def rotulo(self) -> str:
+        return self.value.capitalize()
+
+
+class Prioridade(Enum):
+    BAIXA = "baixa"
+    MEDIA = "média"
+    ALTA = "alta"
+
+    @classmethod
+    def de_texto(cls, valor: Any) -> "Prioridade":
+        texto = str(valor or "").strip().lower()
+        return _PRIORIDADE_POR_TEXTO.get(texto, cls.MEDIA)
+
+    @property
+    def rotulo(self) -> str:
+        return self.value.capitalize()
+
+
+_STATUS_POR_TEXTO = {s.value: s for s in StatusChamado}
+_STATUS_POR_TEXTO.update({"aguardando informação": StatusChamado.AGUARDANDO_INFO, "aguardando informacao": StatusChamado.AGUARDANDO_INFO})
+_PRIORIDADE_POR_TEXTO = {p.value: p for p in Prioridade}
+_PRIORIDADE_POR_TEXTO.update({"media": Prioridade.MEDIA, "crítica": Prioridade.ALTA, "critica": Prioridade.ALTA})
+
+
+class AnexoRef:
+    """Referência a um anexo, sem o conteúdo base64 (o detalhe do chamado busca o arquivo)."""
+    __slots__ = ("nome", "url", "tem_dados")
+
+    def __init__(self, nome: str, url: Optional[str], tem_dados: bool):
+        self.nome = nome
+        self.url = url
+        self.tem_dados = tem_dados
+
+
+def _parse_data(valor: Any) -> Optional[datetime]:
+    if not valor: return None
+    if isinstance(valor, datetime): return valor
+    try: return datetime.fromisoformat(str(valor)[:19])
+    except ValueError: return None
+
+
+class Chamado:
+    """Chamado de listagem, criado a partir do dict normalizado (ver normalizacao.ESQUEMAS)."""
+    __slots__ = (
+        "id", "titulo", "descricao", "status", "prioridade", "id_categoria",
+        "nome_categoria", "data_abertura", "anexos", "texto_busca", "categoria_busca", "data_fechamento",
+        "status_texto",
+    )
+
+    def __init__(self, id: int, titulo: str, descricao: str, status: StatusChamado, prioridade: Prioridade,
+                 id_categoria: Optional[int], nome_categoria: str, data_abertura: Optional[datetime], anexos: tuple,
+                 data_fechamento: Optional[datetime] = None, status_texto: Optional[str] = None):
+        self.id = id
+        self.titulo = titulo
+        self.descricao = descricao
+        self.status = status
+        self.prioridade = prioridade
+        self.id_categoria = id_categoria
+        self.nome_categoria = nome_categoria
+        self.data_abertura = data_abertura
+        self.anexos = anexos
+        self.data_fechamento = data_fechamento
+        # Texto exibido: o que o servidor mandou (o enum só agrupa; status novos viram OUTRO)
+        self.status_texto = status_texto or status.rotulo
+        # Pré-calculados para o filtro das listagens
+        self.texto_busca = f"{titulo.lower()}\x00{id}"
+        self.categoria_busca = nome_categoria.lower()
+
+    @classmethod
+    def de_dict(cls, dados: Dict[str, Any]) -> "Chamado":
+        """Levanta ValueError se o registro não tiver id numérico (contagens, réplica e índice são por id)."""
+        bruto_id = dados.get("id_chamado")
+        if bruto_id is None: bruto_id = dados.get("id")
+        try: cid = int(bruto_id)
+        except (TypeError, ValueError): raise ValueError(f"chamado sem id válido: {bruto_id!r}")
+
+        id_categoria = dados.get("id_categoria")
+        # O nome mandado pelo servidor vem primeiro; o mapa só cobre quando ele manda só o ID
+        nome_categoria = dados.get("categoria") or MAPA_CATEGORIAS.get(id_categoria) or "Outros"
+
+        texto_status = str(dados.get("status") or "").strip()
+
+        anexos = tuple(
+            AnexoRef(a.get("nome") or "anexo.dat", a.get("url"), bool(a.get("dados") or a.get("dados_adiados")))
+            for a in (dados.get("anexos") or []) if isinstance(a, dict)
+        )
+        return cls(
+            cid, str(dados.get("titulo") or "Sem Título"), str(dados.get("descricao") or ""),
+            StatusChamado.de_texto(dados.get("status")), Prioridade.de_texto(dados.get("prioridade")),
+            id_categoria, str(nome_categoria), _parse_data(dados.get("data_abertura")), anexos,
+            _parse_data(dados.get("data_fechamento")), texto_status[:1].upper() + texto_status[1:],
+        )
+
+    @property
+    def data_formatada(self) -> str:
+        return self.data_abertura.strftime("%d/%m/%Y") if self.data_abertura else "--/--/----"
+
+    def __repr__(self) -> str:
+        return f"Chamado(#{self.id}, {self.status.value!r}, {self.titulo!r})"
+
+
+def converter_lista(dados: Iterable[Any]) -> List[Chamado]:
+    """Converte a lista da API/réplica; itens que já são Chamado passam direto, os sem id válido ficam de fora."""
+    convertidos = []
+    for c in dados:
+        if isinstance(c, Chamado): convertidos.append(c)
+        elif isinstance(c, dict):
+            try: convertidos.append(Chamado.de_dict(c))
+            except ValueError as e: logging.warning(f"Chamado ignorado: {e}")
+    return convertidos
+
+
+def contar_por_status(chamados: Iterable[Chamado]) -> tuple:
+    """(abertos, em andamento, resolvidos/fechados) em uma única passada."""
+    abertos = andamento = finalizados = 0
+    for c in chamados:
+        if c.status is StatusChamado.ABERTO: abertos += 1
+        elif c.status is StatusChamado.EM_ANDAMENTO: andamento += 1
+        elif c.status.finalizado: finalizados += 1
+    return abertos, andamento, finalizados
+
+
+def benchmark(qtd: int = 5000) -> Dict[str, float]:
+    """Memória (KiB) de qtd chamados como dict normalizado x Chamado, medida com tracemalloc."""
+    try:
+        from desktop_interface import normalizacao
+    except ImportError:
+        import normalizacao
+
+    brutos = normalizacao._gerar_chamados_exemplo(qtd)
+    for i, b in enumerate(brutos):
+        if i % 4 == 0: b["ChamadoAnexos"] = [{"NomeArquivo": "print.png", "DadosBase64": "A" * 4096}]
+
+    resultado = {}
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    dicts = normalizacao.normalizar("chamado", brutos)
+    resultado["dict_kib"] = (tracemalloc.get_traced_memory()[0] - base) / 1024
+    base = tracemalloc.get_traced_memory()[0]
+    modelos = converter_lista(dicts)
+    resultado["chamado_kib"] = (tracemalloc.get_traced_memory()[0] - base) / 1024
+    tracemalloc.stop()
+    del dicts, modelos
+    return resultado
+
+
+if __name__ == "__main__":
+    for qtd in (1000, 10000):
+        r = benchmark(qtd)
+        print(f"{qtd:>6} chamados | dict: {r['dict_kib']:>9,.0f} KiB | Chamado: {r['chamado_kib']:>9,.0f} KiB | {r['dict_kib'] / r['chamado_kib']:.1f}x")
@@ -0,0 +1,241 @@
+import copy
+import time
+from typing import Dict, Any, List, Tuple
+
+# ----------------------------------------------------------------------
+# NORMALIZAÇÃO POR ESQUEMA
+# ----------------------------------------------------------------------
+# Cada endpoint tem uma tabela campo_canônico -> apelidos aceitos (sem diferenciar
+# maiúsculas). O primeiro registro com um dado conjunto de chaves "compila" o plano
+# (qual chave real atende cada campo); os seguintes só fazem dict lookups diretos.
+
+ESQUEMAS: Dict[str, Dict[str, Tuple[str, ...]]] = {
+    "chamado": {
+        "id_chamado": ("id_chamado", "idchamado", "id"),
+        "id_usuario": ("id_usuario", "idusuario", "usuarioid"),
+        "titulo": ("titulo",),
+        "descricao": ("descricao",),
+        "status": ("status",),
+        "prioridade": ("prioridade", "urgencia"),
+        "id_categoria": ("id_categoria", "idcategoria", "categoriaid"),
+        "categoria": ("categoria", "nomecategoria"),
+        "data_abertura": ("data_abertura", "dataabertura", "createdat"),
+        "data_fechamento": ("data_fechamento", "datafechamento", "closedat"),
+        "data_atualizacao": ("data_atualizacao", "dataatualizacao", "updatedat"),
+        "resolucaoia_sugerida": ("resolucaoia_sugerida", "sugestaoiaenviada"),
+        "anexos": ("chamadoanexos", "anexos"),
+    },
+    "anexo": {
+        "id_anexo": ("id_anexo", "idanexo", "id"),
+        "nome": ("nome", "nomearquivo"),
+        "url": ("url", "urlarquivo"),
+        "dados": ("dados", "dadosbase64"),
+        "tamanho": ("tamanho", "tamanhobytes"),
+    },
+    "comentario": {
+        "id_interacao": ("id_interacao", "idinteracao", "id"),
+        "id_chamado": ("id_chamado", "idchamado"),
+        "id_usuario": ("id_usuario", "idusuario"),
+        "comentario": ("comentario", "texto"),
+        "data_hora": ("data_hora", "datahora"),
+        "nomecompleto": ("nomecompleto", "nome_completo"),
+        "nome": ("nome",),
+        "email": ("email",),
+        "id_perfil": ("id_perfil", "idperfil"),
+    },
+    "usuario": {
+        "id": ("id", "idusuario", "id_usuario"),
+        "id_usuario": ("id_usuario", "idusuario", "id"),
+        "nomecompleto": ("nomecompleto", "nome_completo"),
+        "nome": ("nome",),
+        "email": ("email",),
+        "id_perfil": ("id_perfil", "idperfil"),
+        "ativo": ("ativo",),
+    },
+    "artigo": {
+        "id_artigo": ("id_artigo", "idartigo", "id"),
+        "titulo": ("titulo",),
+        "conteudo": ("conteudo",),
+        "palavraschave": ("palavraschave", "palavras_chave"),
+        "datacriacao": ("datacriacao", "data_criacao"),
+        "id_categoria": ("id_categoria", "idcategoria", "categoriaid"),
+    },
+    "relatorio": {
+        "metricas": ("metricas",),
+        "periodo": ("periodo",),
+        "porCategoria": ("porcategoria",),
+    },
+}
+
+# Valores usados quando nenhum apelido está presente (o resto vira None)
+PADROES: Dict[str, Dict[str, Any]] = {
+    "chamado": {"resolucaoia_sugerida": ""},
+    "artigo": {"palavraschave": ""},
+}
+
+# Campos que recebem outra normalização (lista de sub-registros)
+ANINHADOS: Dict[str, Dict[str, str]] = {
+    "chamado": {"anexos": "anexo"},
+}
+
+_PLANOS: Dict[Tuple[str, tuple], tuple] = {}
+
+
+def _compilar(tipo: str, chaves: tuple) -> tuple:
+    """
+    Resolve, para um conjunto de chaves, qual chave real atende cada campo do esquema.
+    O plano separa campos de chave única (cópia direta), campos ausentes (valor padrão)
+    e campos com vários apelidos presentes (primeiro valor não nulo).
+    """
+    por_minuscula: Dict[str, str] = {}
+    for k in chaves:
+        por_minuscula.setdefault(k.lower(), k)
+
+    padroes = PADROES.get(tipo, {})
+    diretos, ausentes, compostos = [], {}, []
+    for campo, apelidos in ESQUEMAS[tipo].items():
+        reais = tuple(dict.fromkeys(por_minuscula[a] for a in apelidos if a in por_minuscula))
+        padrao = padroes.get(campo)
+        if not reais: ausentes[campo] = padrao
+        elif len(reais) == 1 and padrao is None: diretos.append((campo, reais[0]))
+        else: compostos.append((campo, reais, padrao))
+    return tuple(diretos), ausentes, tuple(compostos)
+
+
+def _plano(tipo: str, registro: Dict[str, Any]) -> tuple:
+    chave = (tipo, tuple(registro))
+    plano = _PLANOS.get(chave)
+    if plano is None:
+        plano = _PLANOS[chave] = _compilar(tipo, chave[1])
+    return plano
+
+
+def _normalizar_anexos(lista: Any) -> List[Dict[str, Any]]:
+    if not lista or not isinstance(lista, list): return []
+    anexos = []
+    for bruto in lista:
+        if not isinstance(bruto, dict): continue
+        anexo = normalizar_registro("anexo", bruto)
+        if anexo["url"] or anexo["dados"]:
+            if not anexo["nome"]: anexo["nome"] = "anexo.dat"
+            anexos.append(anexo)
+    return anexos
+
+
+def normalizar_registro(tipo: str, registro: Dict[str, Any]) -> Dict[str, Any]:
+    """Gera um registro compacto só com os campos canônicos do tipo."""
+    diretos, ausentes, compostos = _plano(tipo, registro)
+    saida = {campo: registro[k] for campo, k in diretos}
+    if ausentes: saida.update(ausentes)
+    for campo, reais, padrao in compostos:
+        valor = None
+        for k in reais:
+            valor = registro[k]
+            if valor is not None: break
+        saida[campo] = padrao if valor is None else valor
+
+    if tipo in ANINHADOS:
+        saida["anexos"] = _normalizar_anexos(saida["anexos"])
+    return saida
+
+
+def normalizar(tipo: str, dados: Any) -> Any:
+    """Normaliza a resposta de um endpoint: lista de registros, registro único ou valor cru."""
+    if isinstance(dados, list):
+        return [normalizar_registro(tipo, item) if isinstance(item, dict) else item for item in dados]
+    if isinstance(dados, dict):
+        return normalizar_registro(tipo, dados)
+    return dados
+
+
+# ----------------------------------------------------------------------
+# VERSÃO GENÉRICA ANTERIOR (referência para o benchmark)
+# ----------------------------------------------------------------------
+def normalizar_generico(dados: Any) -> Any:
+    if isinstance(dados, list):
+        return [normalizar_generico(item) for item in dados]
+
+    if isinstance(dados, dict):
+        dados_lower = {k.lower(): v for k, v in dados.items()}
+
+        # Chamados
+        if "id_chamado" not in dados: dados["id_chamado"] = dados_lower.get("idchamado") or dados.get("id")
+        if "id_usuario" not in dados: dados["id_usuario"] = dados_lower.get("idusuario")
+        if "titulo" not in dados: dados["titulo"] = dados_lower.get("titulo")
+        if "descricao" not in dados: dados["descricao"] = dados_lower.get("descricao")
+        if "status" not in dados: dados["status"] = dados_lower.get("status")
+        if "prioridade" not in dados: dados["prioridade"] = dados_lower.get("prioridade")
+        if "data_abertura" not in dados: dados["data_abertura"] = dados_lower.get("dataabertura")
+        if "data_fechamento" not in dados: dados["data_fechamento"] = dados_lower.get("datafechamento")
+        if "id_categoria" not in dados: dados["id_categoria"] = dados_lower.get("idcategoria")
+
+        # --- NORMALIZAÇÃO DE ANEXOS ---
+        lista_anexos_raw = (
+            dados.get("ChamadoAnexos") or dados.get("chamadoAnexos")
+            or dados.get("Anexos") or dados.get("anexos")
+            or dados_lower.get("anexos") or []
+        )
+
+        anexos_normalizados = []
+        if isinstance(lista_anexos_raw, list):
+            for anexo in lista_anexos_raw:
+                nome = (anexo.get("Nome") or anexo.get("nome") or anexo.get("NomeArquivo") or "anexo.dat")
+                url = (anexo.get("Url") or anexo.get("url") or anexo.get("UrlArquivo"))
+                dados_b64 = (anexo.get("Dados") or anexo.get("dados") or anexo.get("DadosBase64"))
+
+                if url or dados_b64:
+                    anexos_normalizados.append({"nome": nome, "url": url, "dados": dados_b64})
+
+        dados["anexos"] = anexos_normalizados
+
+        # Outros Campos
+        if "id_artigo" not in dados: dados["id_artigo"] = dados_lower.get("idartigo") or dados.get("IdArtigo") or dados.get("id")
+        if "conteudo" not in dados: dados["conteudo"] = dados_lower.get("conteudo")
+        if "palavraschave" not in dados: dados["palavraschave"] = dados_lower.get("palavraschave") or ""
+        if "datacriacao" not in dados: dados["datacriacao"] = dados_lower.get("datacriacao")
+        if "resolucaoia_sugerida" not in dados: dados["resolucaoia_sugerida"] = (dados.get("ResolucaoIA_Sugerida") or dados.get("resolucaoIA_Sugerida") or dados.get("resolucaoia_sugerida") or dados_lower.get("resolucaoia_sugerida") or "")
+        if "comentario" not in dados: dados["comentario"] = dados.get("Comentario") or dados_lower.get("comentario")
+        if "data_hora" not in dados: dados["data_hora"] = dados.get("DataHora") or dados_lower.get("datahora")
+        if "id_interacao" not in dados: dados["id_interacao"] = dados.get("IdInteracao") or dados_lower.get("idinteracao")
+        if "nomecompleto" not in dados: dados["nomecompleto"] = dados.get("NomeCompleto") or dados_lower.get("nomecompleto")
+        if "id_perfil" not in dados: dados["id_perfil"] = dados.get("IdPerfil") or dados_lower.get("idperfil")
+        if "ativo" not in dados: dados["ativo"] = dados.get("Ativo") if "Ativo" in dados else dados.get("ativo")
+        if "metricas" not in dados and "Metricas" in dados: dados["metricas"] = dados["Metricas"]
+        if "periodo" not in dados and "Periodo" in dados: dados["periodo"] = dados["Periodo"]
+        if "porCategoria" not in dados and "PorCategoria" in dados: dados["porCategoria"] = dados["PorCategoria"]
+
+        return dados
+    return dados
+
+
+def _gerar_chamados_exemplo(qtd: int) -> List[Dict[str, Any]]:
+    return [
+        {
+            "IdChamado": i, "IdUsuario": 10 + i % 7, "Titulo": f"Impressora {i} sem toner", "Descricao": "Não imprime desde ontem.",
+            "Status": ("Aberto", "Em Andamento", "Resolvido")[i % 3], "Prioridade": ("Baixa", "Média", "Alta")[i % 3],
+            "DataAbertura": "2025-03-10T08:30:00", "DataFechamento": None, "IdCategoria": 1 + i % 5,
+            "ResolucaoIA_Sugerida": "Verifique o cartucho.", "ChamadoAnexos": [],
+        }
+        for i in range(1, qtd + 1)
+    ]
+
+
+def benchmark(qtd: int = 5000, repeticoes: int = 5) -> Dict[str, float]:
+    """Registros/segundo da normalização genérica x por esquema (cópias novas a cada rodada)."""
+    base = _gerar_chamados_exemplo(qtd)
+    resultado = {}
+    for nome, func in (("generico", normalizar_generico), ("esquema", lambda d: normalizar("chamado", d))):
+        melhor = float("inf")
+        for _ in range(repeticoes):
+            dados = copy.deepcopy(base)
+            inicio = time.perf_counter()
+            func(dados)
+            melhor = min(melhor, time.perf_counter() - inicio)
+        resultado[nome] = qtd / melhor
+    return resultado
+
+
+if __name__ == "__main__":
+    for qtd in (1000, 5000, 20000):
+        r = benchmark(qtd)
+        print(f"{qtd:>6} chamados | genérico: {r['generico']:>10,.0f} reg/s | esquema: {r['esquema']:>10,.0f} reg/s | {r['esquema'] / r['generico']:.1f}x")
@@ -0,0 +1,93 @@
+import threading
+import logging
+import sys
+import os
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+# --- CONFIGURAÇÃO DE PATH ---
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path: sys.path.append(parent_dir)
+
+try:
+    from desktop_interface import api_client
+    from desktop_interface import pool_tarefas
+    from desktop_interface import voo_unico
+except ImportError:
+    import api_client
+    import pool_tarefas
+    import voo_unico
+
+# ----------------------------------------------------------------------
+# PÁGINAS DE CHAMADOS COM PRÉ-CARREGAMENTO
+# ----------------------------------------------------------------------
+# Um paginador por consulta (escopo + filtros + ordem). obter(n) devolve a página n
+# (da memória ou de api_client.listar_chamados_pagina) e, se a página veio do servidor,
+# já agenda a n+1 como tarefa de fundo: quando o usuário clica em "Próximo", ela
+# normalmente já chegou. Pedidos da
+# mesma página ao mesmo tempo (clique durante o pré-carregamento) dividem uma única
+# requisição via voo_unico.
+
+MAX_PAGINAS_CACHE = 20
+
+
+class PaginadorChamados:
+    def __init__(self, escopo: str, tamanho: int, ordenar: str = "id_chamado", decrescente: bool = True,
+                 filtros: Optional[Dict[str, Any]] = None, dono: Any = None):
+        self.escopo = escopo
+        self.tamanho = tamanho
+        self.ordenar = ordenar
+        self.decrescente = decrescente
+        self.filtros = {k: v for k, v in (filtros or {}).items() if v not in (None, "")}
+        self.dono = dono
+        self._paginas: "OrderedDict[int, api_client.Pagina]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._chave = f"paginador:{escopo}:{tamanho}:{ordenar}:{decrescente}:{sorted(self.filtros.items())}"
+        self._stats = {"memoria": 0, "rede": 0, "pre_carregadas": 0}
+
+    def _buscar(self, numero: int) -> tuple[bool, Any]:
+        return voo_unico.executar(
+            f"{self._chave}:{numero}",
+            lambda: api_client.listar_chamados_pagina(self.escopo, numero, self.tamanho, self.ordenar, self.decrescente, self.filtros),
+            ttl=0,
+        )
+
+    def obter(self, numero: int, pre_carregar: bool = True) -> tuple[bool, Any]:
+        """(True, api_client.Pagina) ou (False, msg). Chamar fora da thread da interface."""
+        with self._lock:
+            pagina = self._paginas.get(numero)
+            if pagina is not None:
+                self._paginas.move_to_end(numero)
+                self._stats["memoria"] += 1
+        if pagina is None:
+            sucesso, pagina = self._buscar(numero)
+            if not sucesso: return False, pagina
+            with self._lock:
+                self._stats["rede"] += 1
+                self._paginas[numero] = pagina
+                while len(self._paginas) > MAX_PAGINAS_CACHE: self._paginas.popitem(last=False)
+
+        # Página local é fatia de uma lista que já está em memória: não há o que pré-carregar
+        if pre_carregar and pagina.tem_proxima and pagina.origem == "servidor":
+            pool_tarefas.enviar(self._pre_carregar, numero + 1, prioridade=pool_tarefas.PRIORIDADE_FUNDO,
+                                dono=self.dono, chave=f"{self._chave}:proxima")
+        return True, pagina
+
+    def _pre_carregar(self, numero: int):
+        with self._lock:
+            if numero in self._paginas: return
+        sucesso, resultado = self.obter(numero, pre_carregar=False)
+        if sucesso:
+            with self._lock: self._stats["pre_carregadas"] += 1
+        else:
+            logging.info(f"Pré-carregamento da página {numero} falhou: {resultado}")
+
+    def pronta(self, numero: int) -> bool:
+        """A página já está em memória (mostrar sem indicador de carregamento)."""
+        with self._lock:
+            return numero in self._paginas
+
+    def estatisticas(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._stats)
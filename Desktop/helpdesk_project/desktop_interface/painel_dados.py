@@ -0,0 +1,124 @@
+import json
+import logging
+import sys
+import os
+from typing import Callable, Dict, List, Optional
+
+# --- CONFIGURAÇÃO DE PATH ---
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path: sys.path.append(parent_dir)
+
+try:
+    from desktop_interface import armazenamento_local
+    from desktop_interface import replica_chamados
+    from desktop_interface import pool_tarefas
+    from desktop_interface.modelo_chamado import Chamado
+    from desktop_interface.estatisticas_chamados import EstatisticasChamados
+except ImportError:
+    import armazenamento_local
+    import replica_chamados
+    import pool_tarefas
+    from modelo_chamado import Chamado
+    from estatisticas_chamados import EstatisticasChamados
+
+# ----------------------------------------------------------------------
+# DADOS DOS DASHBOARDS (STALE-WHILE-REVALIDATE)
+# ----------------------------------------------------------------------
+# O dashboard pinta na hora com o último resumo conhecido (memória ou, após reiniciar,
+# a tabela meta do cache local) e revalida em segundo plano. Só quando o resumo novo
+# difere do pintado a tela recebe outra chamada de atualização.
+#
+# Resumo = (abertos, em andamento, resolvidos, lista de Chamado recentes).
+
+_MEMORIA: Dict[str, tuple] = {}
+
+
+def _serializar(resumo: tuple) -> str:
+    abertos, andamento, resolvidos, recentes = resumo
+    return json.dumps({
+        "contagens": [abertos, andamento, resolvidos],
+        "recentes": [
+            {"id_chamado": c.id, "titulo": c.titulo, "status": c.status_texto,
+             "data_abertura": c.data_abertura.isoformat() if c.data_abertura else None}
+            for c in recentes
+        ],
+    }, ensure_ascii=False)
+
+
+def _desserializar(texto: str) -> Optional[tuple]:
+    try:
+        dados = json.loads(texto)
+        abertos, andamento, resolvidos = dados["contagens"]
+        return abertos, andamento, resolvidos, [Chamado.de_dict(c) for c in dados["recentes"]]
+    except (ValueError, KeyError, TypeError) as e:
+        logging.error(f"Resumo de painel inválido no cache: {e}")
+        return None
+
+
+def ultimo_conhecido(nome: str) -> Optional[tuple]:
+    """Último resumo do painel: memória, senão disco. None no primeiro acesso."""
+    if nome in _MEMORIA: return _MEMORIA[nome]
+    texto = armazenamento_local.ler_meta(f"painel:{nome}")
+    resumo = _desserializar(texto) if texto else None
+    if resumo is not None: _MEMORIA[nome] = resumo
+    return resumo
+
+
+def _guardar(nome: str, resumo: tuple):
+    _MEMORIA[nome] = resumo
+    armazenamento_local.gravar_meta(f"painel:{nome}", _serializar(resumo))
+
+
+def carregar(nome: str, escopo: str, calcular: Callable[[EstatisticasChamados], tuple], dono,
+             ao_atualizar: Callable[..., None], ao_falhar: Optional[Callable[[str], None]] = None):
+    """
+    Chama ao_atualizar(*resumo) já (se houver resumo anterior) e de novo, via after(),
+    quando a revalidação trouxer algo diferente. Deve ser chamada na thread da interface.
+    calcular(EstatisticasChamados da réplica) -> (abertos, andamento, resolvidos, recentes).
+    """
+    anterior = ultimo_conhecido(nome)
+    if anterior is not None: ao_atualizar(*anterior)
+
+    def entregar(func, *args):
+        try:
+            if dono.winfo_exists(): dono.after(0, lambda: func(*args))
+        except RuntimeError: pass
+
+    def revalidar():
+        pintado = _serializar(anterior) if anterior is not None else None
+
+        # Sem resumo salvo (primeira execução): a réplica em disco ainda pode servir
+        if pintado is None:
+            _, locais = replica_chamados.estatisticas(escopo, sincronizar=False)
+            if len(locais):
+                resumo_local = calcular(locais)
+                pintado = _serializar(resumo_local)
+                entregar(ao_atualizar, *resumo_local)
+
+        sucesso, dados = replica_chamados.estatisticas(escopo)
+        if not sucesso:
+            if pintado is None and ao_falhar: entregar(ao_falhar, str(dados))
+            return
+
+        resumo = calcular(dados)
+        if _serializar(resumo) != pintado: entregar(ao_atualizar, *resumo)
+        _guardar(nome, resumo)
+
+    pool_tarefas.enviar(revalidar, dono=dono)
+
+
+def limpar():
+    """Esquece os resumos em memória (troca de usuário). O disco já é separado por usuário."""
+    _MEMORIA.clear()
+
+
+def definir_texto(label, texto: str) -> bool:
+    """Só reconfigura o label se o texto mudou (evita redesenho à toa)."""
+    if label.cget("text") == texto: return False
+    label.configure(text=texto)
+    return True
+
+
+def assinatura_recentes(recentes: List[Chamado]) -> tuple:
+    return tuple((c.id, c.status, c.titulo) for c in recentes)
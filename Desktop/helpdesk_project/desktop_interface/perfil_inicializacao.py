@@ -0,0 +1,123 @@
+import importlib.abc
+import importlib.machinery
+import threading
+import time
+import sys
+from typing import Dict, List, Optional, Tuple
+
+# ----------------------------------------------------------------------
+# PERFIL DE INICIALIZAÇÃO (main.py --profile-startup)
+# ----------------------------------------------------------------------
+# Um finder no início de sys.meta_path cronometra a execução de cada módulo Python
+# importado (tempo total e tempo próprio, sem os imports aninhados), e o evento <Map>
+# da janela de login marca o tempo até a primeira janela. Depois o relatório é
+# impresso e o app fecha. O que mede é a partida até o login: os imports adiados
+# para os dashboards (carregamento_tardio) ficam de fora, salvo os que algo já
+# tenha feito até ali. Este módulo só usa a biblioteca padrão: tem de poder ser
+# importado antes de tudo.
+
+TOP_MODULOS = 25
+
+
+class _Cronometro(importlib.abc.MetaPathFinder):
+    def __init__(self):
+        self.tempos: Dict[str, Tuple[float, float]] = {}  # nome -> (total, próprio) em segundos
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def _pilha(self) -> List[float]:
+        if not hasattr(self._local, "pilha"): self._local.pilha = []
+        return self._local.pilha
+
+    def find_spec(self, nome, caminho, alvo=None):
+        if getattr(self._local, "buscando", False): return None
+        self._local.buscando = True
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, "find_spec"): continue
+                spec = finder.find_spec(nome, caminho, alvo)
+                if spec is not None: break
+            else:
+                return None
+        finally:
+            self._local.buscando = False
+
+        # Só loaders com uma instância por módulo (os built-in são compartilhados)
+        loader = spec.loader
+        if isinstance(loader, (importlib.machinery.SourceFileLoader, importlib.machinery.SourcelessFileLoader,
+                               importlib.machinery.ExtensionFileLoader)):
+            loader.exec_module = self._cronometrar(nome, loader.exec_module)
+        return spec
+
+    def _cronometrar(self, nome, exec_original):
+        def exec_module(modulo):
+            pilha = self._pilha()
+            pilha.append(0.0)
+            inicio = time.perf_counter()
+            try:
+                exec_original(modulo)
+            finally:
+                total = time.perf_counter() - inicio
+                filhos = pilha.pop()
+                if pilha: pilha[-1] += total
+                with self._lock: self.tempos[nome] = (total, total - filhos)
+        return exec_module
+
+
+_CRONOMETRO: Optional[_Cronometro] = None
+_INICIO = 0.0
+
+
+def iniciar(inicio: Optional[float] = None):
+    """Passa a cronometrar imports. inicio: perf_counter() do começo do processo (main.py)."""
+    global _CRONOMETRO, _INICIO
+    _INICIO = inicio if inicio is not None else time.perf_counter()
+    if _CRONOMETRO is None:
+        _CRONOMETRO = _Cronometro()
+        sys.meta_path.insert(0, _CRONOMETRO)
+
+
+def parar():
+    if _CRONOMETRO in sys.meta_path: sys.meta_path.remove(_CRONOMETRO)
+
+
+def relatorio(primeira_janela_ms: float) -> str:
+    tempos = dict(_CRONOMETRO.tempos) if _CRONOMETRO else {}
+    # Total dos imports = soma dos tempos próprios (não conta aninhados duas vezes)
+    total_imports = sum(proprio for _, proprio in tempos.values()) * 1000
+    linhas = [
+        f"Tempo até a primeira janela (login): {primeira_janela_ms:.0f} ms",
+        f"Imports cronometrados: {len(tempos)} módulos, {total_imports:.0f} ms",
+        "",
+        f"{'módulo':<55} {'total ms':>9} {'próprio ms':>11}",
+    ]
+    for nome, (total, proprio) in sorted(tempos.items(), key=lambda item: item[1][0], reverse=True)[:TOP_MODULOS]:
+        linhas.append(f"{nome:<55} {total * 1000:9.1f} {proprio * 1000:11.1f}")
+
+    try:
+        from desktop_interface import carregamento_tardio
+        tardios = carregamento_tardio.relatorio()
+    except ImportError:
+        tardios = []
+    if tardios:
+        linhas += ["", "Importações tardias já feitas até o login (as demais ficam para o dashboard):"]
+        linhas += [f"{nome:<55} {ms:9.1f}  ({thread})" for nome, ms, thread in tardios]
+    return "\n".join(linhas)
+
+
+def ao_primeira_janela(janela, sair: bool = True):
+    """
+    Imprime o relatório quando a janela de login for mapeada pela primeira vez (e fecha o app).
+    Não cobre o dashboard: o login exige credenciais, e os imports dele continuam adiados.
+    """
+    marcado = []
+
+    def mapeada(_evento=None):
+        if marcado: return
+        marcado.append(True)
+        primeira_janela_ms = (time.perf_counter() - _INICIO) * 1000
+        parar()
+        print(relatorio(primeira_janela_ms), flush=True)
+        if sair: janela.after(100, janela.destroy)
+
+    janela.bind("<Map>", mapeada, add="+")
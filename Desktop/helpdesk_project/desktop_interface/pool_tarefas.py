@@ -0,0 +1,140 @@
+import itertools
+import threading
+import logging
+import queue
+import time
+from typing import Any, Callable, Dict, Optional
+
+# ----------------------------------------------------------------------
+# POOL CENTRAL DE TAREFAS EM SEGUNDO PLANO
+# ----------------------------------------------------------------------
+# Substitui o threading.Thread(...).start() de cada tela: um número fixo de threads
+# daemon consome uma fila limitada, por prioridade (o que o usuário está vendo
+# primeiro). Tarefas cujo widget dono já foi destruído, ou substituídas por outra
+# com a mesma chave (ex.: nova tecla na busca), são descartadas sem rodar.
+#
+# O limite da fila vale só para o que pode ser perdido (carregamentos, pré-carregamentos).
+# Login, escritas e downloads pedidos pelo usuário vão com obrigatoria=True e nunca são
+# recusados: a tela deles fica esperando o resultado (botão desabilitado, spinner).
+
+PRIORIDADE_UI = 0        # carregamento da tela aberta, resposta a clique
+PRIORIDADE_NORMAL = 5    # escritas, downloads pedidos pelo usuário
+PRIORIDADE_FUNDO = 9     # pré-carregamentos, atualizações silenciosas
+
+MAX_TRABALHADORES = 4
+MAX_FILA = 64
+
+
+class Tarefa:
+    __slots__ = ("func", "args", "kwargs", "prioridade", "dono", "chave", "enfileirada_em", "cancelada")
+
+    def __init__(self, func: Callable, args: tuple, kwargs: dict, prioridade: int, dono: Any, chave: Optional[str]):
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.prioridade = prioridade
+        self.dono = dono
+        self.chave = chave
+        self.enfileirada_em = time.perf_counter()
+        self.cancelada = False
+
+    def cancelar(self):
+        self.cancelada = True
+
+    def dono_destruido(self) -> bool:
+        if self.dono is None: return False
+        try: return not self.dono.winfo_exists()
+        except Exception: return True
+
+
+_FILA: "queue.PriorityQueue" = queue.PriorityQueue()  # limite aplicado em enviar()
+_SEQ = itertools.count()
+_TRABALHADORES: list = []
+_POR_CHAVE: Dict[str, Tarefa] = {}
+_LOCK = threading.Lock()
+_STATS = {
+    "enviadas": 0, "executadas": 0, "canceladas": 0, "rejeitadas": 0, "erros": 0,
+    "ativas": 0, "espera_total_ms": 0.0, "espera_max_ms": 0.0,
+}
+
+
+def _trabalhar():
+    while True:
+        _, _, tarefa = _FILA.get()
+        try:
+            with _LOCK:
+                if tarefa.chave and _POR_CHAVE.get(tarefa.chave) is tarefa: del _POR_CHAVE[tarefa.chave]
+            if tarefa.cancelada or tarefa.dono_destruido():
+                with _LOCK: _STATS["canceladas"] += 1
+                continue
+
+            espera_ms = (time.perf_counter() - tarefa.enfileirada_em) * 1000
+            with _LOCK:
+                _STATS["espera_total_ms"] += espera_ms
+                _STATS["espera_max_ms"] = max(_STATS["espera_max_ms"], espera_ms)
+                _STATS["ativas"] += 1
+            try:
+                tarefa.func(*tarefa.args, **tarefa.kwargs)
+                with _LOCK: _STATS["executadas"] += 1
+            except Exception as e:
+                with _LOCK: _STATS["erros"] += 1
+                logging.error(f"Erro em tarefa de segundo plano ({getattr(tarefa.func, '__name__', tarefa.func)}): {e}")
+            finally:
+                with _LOCK: _STATS["ativas"] -= 1
+        finally:
+            _FILA.task_done()
+
+
+def _garantir_trabalhadores():
+    with _LOCK:
+        vivos = [t for t in _TRABALHADORES if t.is_alive()]
+        for i in range(len(vivos), MAX_TRABALHADORES):
+            t = threading.Thread(target=_trabalhar, name=f"pool-tarefas-{i}", daemon=True)
+            t.start()
+            vivos.append(t)
+        _TRABALHADORES[:] = vivos
+
+
+def enviar(func: Callable, *args, prioridade: int = PRIORIDADE_UI, dono: Any = None, chave: Optional[str] = None,
+           obrigatoria: bool = False, **kwargs) -> Tarefa:
+    """
+    Agenda func(*args, **kwargs). dono: widget Tk cuja destruição cancela a tarefa ainda na fila.
+    chave: uma nova tarefa com a mesma chave cancela a anterior que ainda não começou.
+    Com a fila cheia a tarefa volta já cancelada (e é contada em 'rejeitadas'), a não ser que
+    seja obrigatoria (login, escritas, downloads): essas entram sempre.
+    """
+    _garantir_trabalhadores()
+    tarefa = Tarefa(func, args, kwargs, prioridade, dono, chave)
+    with _LOCK:
+        _STATS["enviadas"] += 1
+        if chave:
+            anterior = _POR_CHAVE.get(chave)
+            if anterior is not None: anterior.cancelar()
+            _POR_CHAVE[chave] = tarefa
+    try:
+        if not obrigatoria and _FILA.qsize() >= MAX_FILA: raise queue.Full
+        _FILA.put_nowait((prioridade, next(_SEQ), tarefa))
+    except queue.Full:
+        tarefa.cancelar()
+        with _LOCK:
+            _STATS["rejeitadas"] += 1
+            if chave and _POR_CHAVE.get(chave) is tarefa: del _POR_CHAVE[chave]
+        logging.warning(f"Fila de tarefas cheia ({MAX_FILA}); tarefa descartada.")
+    return tarefa
+
+
+def cancelar_do_dono(dono: Any) -> int:
+    """Cancela as tarefas ainda na fila que pertencem ao widget (ex.: ao trocar de tela)."""
+    with _FILA.mutex:
+        pendentes = [item[2] for item in _FILA.queue if item[2].dono is dono and not item[2].cancelada]
+    for tarefa in pendentes: tarefa.cancelar()
+    return len(pendentes)
+
+
+def estatisticas() -> Dict[str, Any]:
+    with _LOCK:
+        dados = dict(_STATS)
+    iniciadas = dados["executadas"] + dados["erros"] + dados["ativas"]
+    dados["espera_media_ms"] = dados.pop("espera_total_ms") / iniciadas if iniciadas else 0.0
+    dados["na_fila"] = _FILA.qsize()
+    return dados
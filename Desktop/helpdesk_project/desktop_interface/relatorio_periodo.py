@@ -0,0 +1,162 @@
+import json
+import threading
+import time
+import logging
+import sys
+import os
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+# --- CONFIGURAÇÃO DE PATH ---
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path: sys.path.append(parent_dir)
+
+try:
+    from desktop_interface import armazenamento_local
+    from desktop_interface import api_async
+except ImportError:
+    import armazenamento_local
+    import api_async
+
+# ----------------------------------------------------------------------
+# RELATÓRIO DO SERVIDOR POR PERÍODO, EM BALDES DIÁRIOS
+# ----------------------------------------------------------------------
+# Usado quando não há réplica local para a análise (ver analise_chamados). Cada dia
+# é pedido uma vez a /api/relatorios/chamados (início = fim = dia) e guardado como
+# balde: totais e quantidade por categoria. Um período qualquer é a soma dos baldes;
+# trocar o período só busca os dias que faltam (ou venceram).
+#
+# Os números de um dia mudam enquanto os chamados dele são resolvidos, por isso a
+# validade é curta para os dias recentes e longa para os antigos.
+
+VALIDADE_RECENTE = 10 * 60       # segundos, dias dentro de DIAS_RECENTES
+VALIDADE_ANTIGA = 24 * 3600
+DIAS_RECENTES = 7
+MAX_DIAS = 366
+
+_MEMORIA: Dict[str, dict] = {}
+_LOCK = threading.Lock()
+_STATS = {"dias_cache": 0, "dias_buscados": 0, "falhas": 0}
+
+
+def _valido(dia: date, balde: dict) -> bool:
+    idade = time.time() - balde.get("obtido_em", 0)
+    recente = (date.today() - dia).days < DIAS_RECENTES
+    return idade < (VALIDADE_RECENTE if recente else VALIDADE_ANTIGA)
+
+
+def _metrica(metricas: dict, nome: str) -> int:
+    return metricas.get(nome) or metricas.get(nome[0].upper() + nome[1:]) or 0
+
+
+def _balde(relatorio: dict) -> dict:
+    """Reduz o relatório de um dia ao que é somável entre dias."""
+    metricas = relatorio.get("metricas") or relatorio.get("Metricas") or {}
+    categorias: Dict[str, int] = {}
+    for item in relatorio.get("porCategoria") or relatorio.get("PorCategoria") or []:
+        cat_id = item.get("categoriaId") or item.get("CategoriaId") or item.get("id")
+        qtd = item.get("quantidade") or item.get("Quantidade") or 0
+        categorias[str(cat_id)] = categorias.get(str(cat_id), 0) + qtd
+    return {
+        "total": _metrica(metricas, "totalChamados"),
+        "abertos": _metrica(metricas, "totalAbertos"),
+        "resolvidos": _metrica(metricas, "totalResolvidos"),
+        "categorias": categorias,
+        "obtido_em": time.time(),
+    }
+
+
+def _ler(dia: date) -> Optional[dict]:
+    chave = dia.isoformat()
+    with _LOCK:
+        balde = _MEMORIA.get(chave)
+    if balde is None:
+        texto = armazenamento_local.ler_meta(f"relatorio_dia:{chave}")
+        if not texto: return None
+        try: balde = json.loads(texto)
+        except ValueError: return None
+        with _LOCK: _MEMORIA[chave] = balde
+    return balde if _valido(dia, balde) else None
+
+
+def _gravar(dia: date, balde: dict):
+    chave = dia.isoformat()
+    with _LOCK: _MEMORIA[chave] = balde
+    armazenamento_local.gravar_meta(f"relatorio_dia:{chave}", json.dumps(balde))
+
+
+def _combinar(baldes: List[dict], inicio: date, fim: date) -> Dict[str, Any]:
+    """Soma os baldes no formato do agregado do servidor (periodo / metricas / porCategoria)."""
+    total = abertos = resolvidos = 0
+    categorias: Dict[str, int] = {}
+    for b in baldes:
+        total += b["total"]
+        abertos += b["abertos"]
+        resolvidos += b["resolvidos"]
+        for cat_id, qtd in b["categorias"].items():
+            categorias[cat_id] = categorias.get(cat_id, 0) + qtd
+    return {
+        "periodo": {"inicio": inicio.isoformat(), "fim": fim.isoformat()},
+        "metricas": {"totalChamados": total, "totalAbertos": abertos, "totalResolvidos": resolvidos},
+        "porCategoria": [
+            {"categoriaId": int(cat_id) if cat_id.isdigit() else cat_id, "quantidade": qtd}
+            for cat_id, qtd in categorias.items()
+        ],
+        "origem": "servidor",
+    }
+
+
+def _dia(valor) -> date:
+    return valor.date() if isinstance(valor, datetime) else valor
+
+
+def obter(data_inicio: datetime, data_fim: datetime) -> tuple[bool, Any]:
+    """
+    (True, relatório do período) somando baldes diários; só os dias ausentes ou vencidos
+    vão ao servidor (em paralelo). Se algum dia falhar, (False, msg): nada de total parcial.
+    """
+    inicio, fim = _dia(data_inicio), _dia(data_fim)
+    if fim < inicio: return False, "Data final anterior à inicial."
+    n_dias = (fim - inicio).days + 1
+    if n_dias > MAX_DIAS: return False, f"Período máximo: {MAX_DIAS} dias."
+
+    dias = [inicio + timedelta(days=d) for d in range(n_dias)]
+    baldes: Dict[date, dict] = {}
+    faltando = []
+    for dia in dias:
+        balde = _ler(dia)
+        if balde is None: faltando.append(dia)
+        else: baldes[dia] = balde
+
+    if faltando:
+        try:
+            resultados = api_async.rodar(api_async.carregar_relatorios_dias([d.isoformat() for d in faltando]))
+        except Exception as e:
+            return False, f"Erro: {e}"
+        falhas = 0
+        for dia, (sucesso, dados) in zip(faltando, resultados):
+            if not sucesso or not isinstance(dados, dict):
+                falhas += 1
+                continue
+            baldes[dia] = _balde(dados)
+            _gravar(dia, baldes[dia])
+        with _LOCK:
+            _STATS["dias_buscados"] += len(faltando) - falhas
+            _STATS["falhas"] += falhas
+        if falhas:
+            logging.warning(f"Relatório: {falhas} de {len(faltando)} dias não puderam ser carregados")
+            return False, "Erro ao conectar com servidor."
+
+    with _LOCK: _STATS["dias_cache"] += n_dias - len(faltando)
+    return True, _combinar([baldes[d] for d in dias], inicio, fim)
+
+
+def limpar():
+    """Esquece os baldes em memória (troca de usuário). O disco já é separado por usuário."""
+    with _LOCK: _MEMORIA.clear()
+
+
+def estatisticas() -> Dict[str, int]:
+    with _LOCK:
+        return dict(_STATS)
@@ -0,0 +1,265 @@
+import threading
+import logging
+import sys
+import os
+from typing import Optional, Dict, Any, List
+
+# --- CONFIGURAÇÃO DE PATH ---
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path: sys.path.append(parent_dir)
+
+try:
+    from desktop_interface import api_client
+    from desktop_interface import armazenamento_local
+    from desktop_interface.modelo_chamado import Chamado
+    from desktop_interface.estatisticas_chamados import EstatisticasChamados
+    from desktop_interface.indice_busca import IndiceChamados
+except ImportError:
+    import api_client
+    import armazenamento_local
+    from modelo_chamado import Chamado
+    from estatisticas_chamados import EstatisticasChamados
+    from indice_busca import IndiceChamados
+
+# ----------------------------------------------------------------------
+# RÉPLICA LOCAL DE CHAMADOS
+# ----------------------------------------------------------------------
+# A API não oferece rota incremental: cada sincronização é um GET condicional
+# (304 = nada mudou, custo de um round trip) e, quando a lista muda, um diff
+# local por id_chamado decide o que entrou, mudou ou saiu.
+# Se a API passar a aceitar filtro por data, basta preencher PARAMETRO_DELTA
+# (ex.: "atualizadoDesde") para pedir só os registros após a marca d'água.
+PARAMETRO_DELTA: Optional[str] = None
+
+CAMPOS_DATA = ("data_atualizacao", "data_fechamento", "data_abertura")
+
+
+def _id(chamado: Dict[str, Any]) -> str:
+    cid = chamado.get("id_chamado")
+    if cid is None: cid = chamado.get("id")
+    return "" if cid is None else str(cid)
+
+
+def _assinatura(chamado: Dict[str, Any]) -> tuple:
+    """Campos que, se mudarem, tornam o chamado 'alterado'."""
+    return (
+        chamado.get("status"), chamado.get("prioridade"), chamado.get("titulo"),
+        chamado.get("descricao"), chamado.get("id_categoria"), chamado.get("data_fechamento"),
+        chamado.get("data_atualizacao"), chamado.get("resolucaoia_sugerida"), len(chamado.get("anexos") or []),
+    )
+
+
+def _data_mais_recente(chamado: Dict[str, Any]) -> str:
+    return max((str(chamado.get(c) or "") for c in CAMPOS_DATA), default="")
+
+
+class ReplicaChamados:
+    """Cópia local dos chamados de um escopo ('todos' ou 'meus'), indexada por id_chamado."""
+
+    def __init__(self, escopo: str):
+        self.escopo = escopo
+        self.registros: Dict[str, Dict[str, Any]] = {}
+        self._assinaturas: Dict[str, tuple] = {}
+        # Versão compacta dos mesmos registros, refeita só para os que mudam
+        self.modelos: Dict[str, Chamado] = {}
+        # Contagens e recentes mantidos junto com o diff (ver estatisticas_chamados)
+        self.estatisticas = EstatisticasChamados()
+        # Índice de busca das telas de listagem, mantido do mesmo jeito (ver indice_busca)
+        self.indice = IndiceChamados()
+        self.marca_dagua = ""
+        self.versao = 0
+        self.sincronizada = False
+        self.hidratada = False
+        self._lock = threading.Lock()
+
+    def hidratar(self) -> int:
+        """Carrega do disco o último estado conhecido (cold start). Retorna quantos registros vieram."""
+        if self.hidratada or self.sincronizada: return len(self.registros)
+        locais = armazenamento_local.carregar_chamados(self.escopo)
+        with self._lock:
+            self.hidratada = True
+            if self.sincronizada: return len(self.registros)
+            for chamado in locais:
+                cid = _id(chamado)
+                if not cid: continue
+                try: modelo = Chamado.de_dict(chamado)
+                except ValueError as e:
+                    logging.warning(f"Chamado ignorado na réplica: {e}")
+                    continue
+                self.registros[cid] = chamado
+                self._assinaturas[cid] = _assinatura(chamado)
+                self.modelos[cid] = modelo
+            self.estatisticas = EstatisticasChamados(self.modelos.values())
+            self.indice = IndiceChamados(self.modelos.values())
+            self.marca_dagua = armazenamento_local.ler_meta(f"marca_dagua:{self.escopo}", "") or ""
+            if locais: self.versao += 1
+        return len(locais)
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return list(self.registros.values())
+
+    def snapshot_modelos(self) -> List[Chamado]:
+        with self._lock:
+            return list(self.modelos.values())
+
+    def obter(self, chamado_id) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self.registros.get(str(chamado_id))
+
+    def mesclar(self, lista: List[Dict[str, Any]], completa: bool = True) -> Dict[str, List[str]]:
+        """
+        Aplica uma lista recebida da API. Com completa=True a lista é o estado inteiro do escopo
+        (ids ausentes são removidos); com completa=False é só o delta desde a marca d'água.
+        """
+        novos, alterados = [], []
+        with self._lock:
+            vistos = set()
+            for chamado in lista:
+                cid = _id(chamado)
+                if not cid: continue
+                assinatura = _assinatura(chamado)
+                anterior = self._assinaturas.get(cid)
+                if anterior == assinatura:
+                    vistos.add(cid)
+                    continue
+                try: modelo = Chamado.de_dict(chamado)
+                except ValueError as e:
+                    # Sem id numérico não entra: contagens, modelos e índice são por id
+                    logging.warning(f"Chamado ignorado na réplica: {e}")
+                    continue
+                vistos.add(cid)
+                if anterior is None: novos.append(cid)
+                else: alterados.append(cid)
+                self.registros[cid] = chamado
+                self._assinaturas[cid] = assinatura
+                self.modelos[cid] = modelo
+                self.estatisticas.adicionar(modelo)
+                self.indice.adicionar(modelo)
+                data = _data_mais_recente(chamado)
+                if data > self.marca_dagua: self.marca_dagua = data
+
+            removidos = []
+            if completa:
+                removidos = [cid for cid in self.registros if cid not in vistos]
+                for cid in removidos:
+                    del self.registros[cid]
+                    del self._assinaturas[cid]
+                    modelo = self.modelos.pop(cid, None)
+                    if modelo is not None:
+                        self.estatisticas.remover(modelo.id)
+                        self.indice.remover(modelo.id)
+
+            if novos or alterados or removidos:
+                self.versao += 1
+                self.indice.organizar()
+            self.sincronizada = True
+        return {"novos": novos, "alterados": alterados, "removidos": removidos}
+
+    def sincronizar(self) -> tuple[bool, Any]:
+        """Atualiza a réplica com a API. Retorna (True, mudanças) ou (False, mensagem)."""
+        if not api_client.AUTH_TOKEN: return False, "Não autenticado."
+
+        params = None
+        delta = bool(PARAMETRO_DELTA and self.sincronizada and self.marca_dagua)
+        if delta: params = {PARAMETRO_DELTA: self.marca_dagua}
+
+        try:
+            status, dados = api_client.buscar_chamados_condicional(self.escopo, params=params)
+        except Exception as e:
+            return False, str(e)
+
+        if status == 304 and self.sincronizada:
+            return True, {"novos": [], "alterados": [], "removidos": []}
+        if status not in (200, 304) or not isinstance(dados, list):
+            return False, f"Erro {status}"
+
+        mudancas = self.aplicar(dados, completa=not delta)
+        logging.info(f"Réplica '{self.escopo}': +{len(mudancas['novos'])} ~{len(mudancas['alterados'])} -{len(mudancas['removidos'])}")
+        return True, mudancas
+
+    def aplicar(self, dados: List[Dict[str, Any]], completa: bool = True) -> Dict[str, List[str]]:
+        """Mescla uma lista já baixada (ex.: listar_chamados_em_lotes) e grava o que mudou."""
+        self.hidratar()
+        mudancas = self.mesclar(dados, completa=completa)
+        self._persistir(mudancas)
+        return mudancas
+
+    def _persistir(self, mudancas: Dict[str, List[str]]):
+        alterados = mudancas["novos"] + mudancas["alterados"]
+        if not alterados and not mudancas["removidos"]: return
+        with self._lock:
+            registros = [self.registros[cid] for cid in alterados if cid in self.registros]
+            marca = self.marca_dagua
+        armazenamento_local.salvar_chamados(self.escopo, registros, removidos=mudancas["removidos"])
+        armazenamento_local.gravar_meta(f"marca_dagua:{self.escopo}", marca)
+
+    def limpar(self):
+        with self._lock:
+            self.registros.clear()
+            self._assinaturas.clear()
+            self.modelos.clear()
+            self.estatisticas.limpar()
+            self.indice.limpar()
+            self.marca_dagua = ""
+            self.sincronizada = False
+            self.hidratada = False
+            self.versao += 1
+
+
+_REPLICAS: Dict[str, ReplicaChamados] = {}
+_LOCK_REPLICAS = threading.Lock()
+
+
+def obter_replica(escopo: str = "todos") -> ReplicaChamados:
+    with _LOCK_REPLICAS:
+        if escopo not in _REPLICAS:
+            _REPLICAS[escopo] = ReplicaChamados(escopo)
+        return _REPLICAS[escopo]
+
+
+def _lista(replica: ReplicaChamados, como_modelo: bool) -> list:
+    return replica.snapshot_modelos() if como_modelo else replica.snapshot()
+
+
+def sincronizar(escopo: str = "todos", como_modelo: bool = False) -> tuple[bool, Any]:
+    """
+    Sincroniza e devolve (True, lista de chamados) como os antigos listar_*; em erro, (False, msg).
+    Com como_modelo=True a lista é de modelo_chamado.Chamado em vez dos dicts normalizados.
+    """
+    replica = obter_replica(escopo)
+    sucesso, resultado = replica.sincronizar()
+    if not sucesso:
+        # Sem rede: devolve o último estado gravado em disco, se houver
+        if replica.hidratar(): return True, _lista(replica, como_modelo)
+        return False, resultado
+    return True, _lista(replica, como_modelo)
+
+
+def estatisticas(escopo: str = "todos", sincronizar: bool = True) -> tuple[bool, Any]:
+    """
+    (True, EstatisticasChamados) do escopo, já atualizadas, sem copiar a lista de chamados.
+    Com sincronizar=False usa só o estado local; sem rede e sem disco, (False, msg).
+    """
+    replica = obter_replica(escopo)
+    if not sincronizar:
+        replica.hidratar()
+        return True, replica.estatisticas
+    sucesso, resultado = replica.sincronizar()
+    if not sucesso and not replica.hidratar(): return False, resultado
+    return True, replica.estatisticas
+
+
+def snapshot_local(escopo: str = "todos", como_modelo: bool = False) -> list:
+    """Estado conhecido sem ir à rede: memória, ou o disco no primeiro acesso após o login."""
+    replica = obter_replica(escopo)
+    replica.hidratar()
+    return _lista(replica, como_modelo)
+
+
+def limpar_replicas():
+    """Descarta todas as réplicas (chamado no login, quando o usuário muda)."""
+    with _LOCK_REPLICAS:
+        for replica in _REPLICAS.values():
+            replica.limpar()
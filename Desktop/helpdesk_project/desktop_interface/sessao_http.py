@@ -0,0 +1,104 @@
+import threading
+from typing import Optional, Dict, Any
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# ----------------------------------------------------------------------
+# CONFIGURAÇÕES DO POOL
+# ----------------------------------------------------------------------
+# Tamanho do pool de conexões keep-alive por host. Hosts não listados usam o padrão.
+POOL_PADRAO = 4
+POOL_POR_HOST: Dict[str, int] = {
+    "apichamadosunip2025-b5fdcgfuccg2gtdt.brazilsouth-01.azurewebsites.net": 10,
+}
+
+_SESSAO: Optional[requests.Session] = None
+_ADAPTADORES: Dict[str, HTTPAdapter] = {}
+_LOCK = threading.Lock()
+
+
+def _criar_adaptador(tamanho: int, hosts: int = 1) -> HTTPAdapter:
+    # Repete apenas falhas de conexão (ex.: keep-alive derrubado pelo balanceador do Azure)
+    retry = Retry(total=2, connect=2, read=0, status=0, backoff_factor=0.2, allowed_methods=frozenset(["GET", "HEAD"]))
+    return HTTPAdapter(pool_connections=hosts, pool_maxsize=tamanho, pool_block=False, max_retries=retry)
+
+
+def _montar_adaptador(sessao: requests.Session, host: str, tamanho: int):
+    for esquema in ("https://", "http://"):
+        adaptador = _criar_adaptador(tamanho)
+        sessao.mount(f"{esquema}{host}", adaptador)
+        _ADAPTADORES[f"{esquema}{host}"] = adaptador
+
+
+def obter_sessao() -> requests.Session:
+    """
+    Retorna a sessão HTTP compartilhada (conexões persistentes reaproveitadas entre chamadas).
+    O requests/urllib3 não faz pipelining HTTP/1.1; o ganho vem do keep-alive e do pool por host.
+    """
+    global _SESSAO
+    if _SESSAO is not None: return _SESSAO
+
+    with _LOCK:
+        if _SESSAO is None:
+            sessao = requests.Session()
+            sessao.headers.update({"Connection": "keep-alive", "Accept-Encoding": "gzip, deflate"})
+
+            padrao = _criar_adaptador(POOL_PADRAO, hosts=10)
+            sessao.mount("https://", padrao)
+            sessao.mount("http://", padrao)
+            _ADAPTADORES["*"] = padrao
+
+            for host, tamanho in POOL_POR_HOST.items():
+                _montar_adaptador(sessao, host, tamanho)
+            _SESSAO = sessao
+    return _SESSAO
+
+
+def configurar_pool(url_base: str, tamanho: int):
+    """Define (ou redefine) o tamanho do pool para o host de uma URL."""
+    host = urlsplit(url_base).netloc or url_base
+    POOL_POR_HOST[host] = tamanho
+    if _SESSAO is not None:
+        with _LOCK:
+            _montar_adaptador(_SESSAO, host, tamanho)
+
+
+def estatisticas() -> Dict[str, Any]:
+    """
+    Conexões novas x reaproveitadas, por host.
+    Cada pool do urllib3 conta quantas conexões abriu e quantas requisições fez;
+    a diferença são as requisições que reaproveitaram uma conexão keep-alive.
+    """
+    por_host: Dict[str, Dict[str, int]] = {}
+    for adaptador in list(_ADAPTADORES.values()):
+        pools = adaptador.poolmanager.pools
+        for chave in list(pools.keys()):
+            pool = pools.get(chave)
+            if pool is None: continue
+            host = f"{pool.scheme}://{pool.host}"
+            item = por_host.setdefault(host, {"requisicoes": 0, "novas": 0, "reutilizadas": 0})
+            item["requisicoes"] += pool.num_requests
+            item["novas"] += pool.num_connections
+
+    for item in por_host.values():
+        item["reutilizadas"] = max(item["requisicoes"] - item["novas"], 0)
+
+    return {
+        "requisicoes": sum(i["requisicoes"] for i in por_host.values()),
+        "novas": sum(i["novas"] for i in por_host.values()),
+        "reutilizadas": sum(i["reutilizadas"] for i in por_host.values()),
+        "por_host": por_host,
+    }
+
+
+def fechar_sessao():
+    """Fecha todas as conexões do pool (ex.: no logout ou ao encerrar o app)."""
+    global _SESSAO
+    with _LOCK:
+        if _SESSAO is not None:
+            _SESSAO.close()
+        _SESSAO = None
+        _ADAPTADORES.clear()
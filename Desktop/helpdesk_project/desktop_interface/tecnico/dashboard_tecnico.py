@@ -1,7 +1,6 @@
 import customtkinter as ctk
 from tkinter import messagebox
 from datetime import datetime, timedelta
-import threading
 import sys
 import os
 
@@ -13,8 +12,12 @@ if parent_dir not in sys.path: sys.path.append(parent_dir)
 # --- IMPORT API CLIENT ---
 try:
     from desktop_interface import api_client
+    from desktop_interface import painel_dados
+    from desktop_interface import lista_virtual
 except ImportError:
     import api_client
+    import painel_dados
+    import lista_virtual
 
 # ======= Telas do sistema =======
 from desktop_interface.criar_chamado import abrir_formulario_chamado
@@ -31,38 +34,13 @@ except ImportError:
         ctk.CTkLabel(frame, text="Base de Conhecimento (Em breve)", font=("Segoe UI", 16)).pack(pady=50)
 
 # 🟢 FUNÇÃO DE CONTAGEM SIMPLIFICADA
-def processar_chamados_para_tecnico(todos_chamados):
-    """Calcula estatísticas gerais do sistema."""
+def processar_chamados_para_tecnico(stats):
+    """Calcula estatísticas gerais do sistema (recebe estatisticas_chamados.EstatisticasChamados)."""
     
-    status_resolvidos = ["resolvido", "fechado"]
-    
-    total_abertos = 0
-    total_em_andamento = 0
-    total_resolvidos = 0
-    
-    chamados_ativos_para_listagem = []
-
-    for c in todos_chamados: 
-        status = str(c.get("status", "aberto")).lower()
-        if status == "em análise": status = "em andamento"
-
-        # Contagem por Status
-        if status == "aberto":
-            total_abertos += 1
-        elif status == "em andamento":
-            total_em_andamento += 1
-        elif status in status_resolvidos:
-             total_resolvidos += 1
-
-        # Lista para exibir (Tudo que não está fechado)
-        if status not in status_resolvidos:
-            chamados_ativos_para_listagem.append(c)
+    total_abertos, total_em_andamento, total_resolvidos = stats.contagens()
 
-    # Ordena do mais recente (#Maior) para o mais antigo
-    chamados_ativos_para_listagem.sort(key=lambda x: int(x.get("id_chamado") or x.get("id") or 0), reverse=True)
-
-    # Limita a 10 chamados recentes
-    chamados_ativos_para_listagem = chamados_ativos_para_listagem[:10]
+    # Lista para exibir (Tudo que não está fechado), do mais recente (#Maior) para o mais antigo, até 10
+    chamados_ativos_para_listagem = stats.recentes(10, lambda c: not c.status.finalizado)
 
     return total_abertos, total_em_andamento, total_resolvidos, chamados_ativos_para_listagem
 
@@ -164,73 +142,52 @@ def abrir_dashboard_tecnico(janela_principal, user):
         ).pack(side="left", padx=5)
 
         # --- LÓGICA DE CARREGAMENTO ---
-        def carregar_dados_tecnico():
-            if not api_client.AUTH_TOKEN: 
-                frame.after(0, lambda: exibir_erro("Não autenticado."))
-                return
-
-            sucesso, dados = api_client.listar_todos_chamados()
-            
-            if sucesso and isinstance(dados, list):
-                abertos, andamento, resolvidos, lista_ativos = processar_chamados_para_tecnico(dados)
-                frame.after(0, lambda: atualizar_ui(abertos, andamento, resolvidos, lista_ativos))
-            else:
-                frame.after(0, lambda: exibir_erro(f"Erro ao carregar: {dados}"))
-
         def exibir_erro(mensagem):
+            if not lbl_abertos_val.winfo_exists(): return
             if lbl_placeholder.winfo_exists(): lbl_placeholder.destroy()
-            ctk.CTkLabel(recentes_container, text=mensagem, text_color="red").pack(pady=20)
             lbl_abertos_val.configure(text="-")
             lbl_andamento_val.configure(text="-")
             lbl_resolvidos_val.configure(text="-")
-
-        def criar_card_chamado_simples(parent, chamado):
-            ch_id = chamado.get("id_chamado") or chamado.get("id")
-            titulo = chamado.get("titulo", "Sem título")
-            status_raw = str(chamado.get("status", "aberto")).lower()
-            
-            cor_faixa = "#4A5568"
-            if status_raw == "aberto": cor_faixa = "#0284C7"
-            elif status_raw in ["resolvido", "fechado"]: cor_faixa = "#16A34A"
-            elif status_raw == "em andamento": cor_faixa = "#EAB308"
-            
-            # Card Compacto (Linha Única)
-            card = ctk.CTkFrame(parent, fg_color="white", corner_radius=8, border_width=1, border_color=cor_faixa)
-            card.pack(fill="x", pady=4, padx=5)
-            
-            content_frame = ctk.CTkFrame(card, fg_color="transparent")
-            content_frame.pack(side="left", fill="both", expand=True, padx=10, pady=5)
-
-            ctk.CTkLabel(content_frame, text=f"#{ch_id}", font=("Helvetica", 13, "bold"), text_color="#64748B", width=35).pack(side="left", padx=(5, 10))
-            ctk.CTkLabel(content_frame, text=titulo, font=("Helvetica", 14, "bold"), text_color="#1E293B", anchor="w").pack(side="left", fill="x", expand=True)
-
-            right_frame = ctk.CTkFrame(card, fg_color="transparent")
-            right_frame.pack(side="right", padx=15)
-            
-            # Status
-            ctk.CTkLabel(right_frame, text=status_raw.capitalize(), font=("Helvetica", 11, "bold"), text_color=cor_faixa).pack(side="left", padx=15)
-            
-            # Botão Detalhes (passando 'frame' corrigido)
-            ctk.CTkButton(right_frame, text="Detalhes", width=70, height=28, fg_color="#5BA39C", hover_color="#4C8E87", font=("Helvetica", 11, "bold"),
-                          command=lambda: abrir_ticket_detalhe(ch_id, user, frame, lambda: mostrar_dashboard(frame, user))).pack(side="right")
+            # O erro ocupa o aviso de lista vazia; a próxima atualização bem-sucedida o troca de volta
+            lista_recentes.definir([])
+            lista_recentes.lbl_vazio.configure(text=mensagem, text_color="red")
+            estado_lista["assinatura"] = None
+
+        # Pool fixo de cards compactos: cada atualização só preenche os mesmos widgets
+        lista_recentes = lista_virtual.ListaVirtual(
+            recentes_container,
+            lambda parent: lista_virtual.CartaoCompacto(
+                parent, lambda c: abrir_ticket_detalhe(c.id, user, frame, lambda: mostrar_dashboard(frame, user))
+            ),
+            10, vazio="Nenhum chamado ativo no sistema.", rolagem=False,
+        )
+
+        estado_lista = {"assinatura": None}
 
         def atualizar_ui(abertos, andamento, resolvidos, lista_ativos):
             if not lbl_abertos_val.winfo_exists(): return
 
-            lbl_abertos_val.configure(text=str(abertos))
-            lbl_andamento_val.configure(text=str(andamento))
-            lbl_resolvidos_val.configure(text=str(resolvidos))
+            # Só mexe no que mudou desde a última pintura
+            painel_dados.definir_texto(lbl_abertos_val, str(abertos))
+            painel_dados.definir_texto(lbl_andamento_val, str(andamento))
+            painel_dados.definir_texto(lbl_resolvidos_val, str(resolvidos))
 
-            if lbl_placeholder.winfo_exists(): lbl_placeholder.destroy()
-            for w in recentes_container.winfo_children(): w.destroy()
+            assinatura = painel_dados.assinatura_recentes(lista_ativos)
+            if assinatura == estado_lista["assinatura"]: return
+            estado_lista["assinatura"] = assinatura
 
-            if not lista_ativos:
-                ctk.CTkLabel(recentes_container, text="Nenhum chamado ativo no sistema.", text_color="gray").pack(pady=20)
-            else:
-                for c in lista_ativos:
-                    criar_card_chamado_simples(recentes_container, c)
+            if lbl_placeholder.winfo_exists(): lbl_placeholder.destroy()
+            lista_recentes.lbl_vazio.configure(text="Nenhum chamado ativo no sistema.", text_color="gray")
+            lista_recentes.definir(lista_ativos)
             
-        threading.Thread(target=carregar_dados_tecnico, daemon=True).start()
+        # --- CARREGAMENTO: último resumo conhecido na hora, revalidação em segundo plano ---
+        if not api_client.AUTH_TOKEN:
+            exibir_erro("Não autenticado.")
+        else:
+            painel_dados.carregar(
+                "tecnico", "todos", processar_chamados_para_tecnico, recentes_container,
+                ao_atualizar=atualizar_ui, ao_falhar=lambda msg: exibir_erro(f"Erro ao carregar: {msg}"),
+            )
 
     criar_menu_lateral(
         janela, user, conteudo_frame, abrir_dashboard=mostrar_dashboard,
@@ -1,11 +1,8 @@
 import customtkinter as ctk
 from tkinter import messagebox
 from tkinter import filedialog
-import threading
 import sys
 import os
-import requests 
-import base64 
 import webbrowser
 import re # IMPORTANTE PARA O NOME
 from datetime import datetime
@@ -17,8 +14,14 @@ if parent_dir not in sys.path: sys.path.append(parent_dir)
 
 try:
     from desktop_interface import api_client
+    from desktop_interface import sessao_http
+    from desktop_interface import api_async
+    from desktop_interface import pool_tarefas
 except ImportError:
     import api_client
+    import sessao_http
+    import api_async
+    import pool_tarefas
 
 FLUXO_STATUS_LOGICO = ["Aberto", "Em Andamento", "Resolvido", "Fechado"]
 
@@ -41,16 +44,31 @@ def obter_primeiro_nome(user_dict, default="Usuário"):
     return default
 
 def abrir_ticket_detalhe(chamado_id, user, conteudo_frame, callback_refresh=None):
-    
-    # Busca chamado completo
-    chamado = api_client.obter_chamado_por_id(chamado_id)
+    # A tela do chamado já existe (em "Carregando...") antes da resposta: se o usuário for para
+    # outra tela ou abrir outro chamado, ela é destruída e o resultado atrasado é descartado
+    for widget in conteudo_frame.winfo_children(): widget.destroy()
+    tela = ctk.CTkFrame(conteudo_frame, fg_color="transparent")
+    tela.pack(fill="both", expand=True)
+    lbl_carregando = ctk.CTkLabel(tela, text=f"Carregando chamado #{chamado_id}...", font=("Helvetica", 16), text_color="gray")
+    lbl_carregando.pack(pady=50)
+
+    # Chamado, comentários e usuários saem juntos (um round trip); a tela é montada na main loop
+    api_async.no_tk(
+        tela, api_async.carregar_detalhe(chamado_id),
+        lambda pre: _montar_ticket_detalhe(chamado_id, pre, user, conteudo_frame, tela, callback_refresh),
+        lambda erro: lbl_carregando.configure(text=f"Erro ao carregar o chamado #{chamado_id}.", text_color="red"),
+    )
+
+def _montar_ticket_detalhe(chamado_id, pre_carregado, user, conteudo_frame, tela, callback_refresh=None):
+    if not tela.winfo_exists(): return
+    chamado = pre_carregado["chamado"]
 
     if not chamado:
         messagebox.showerror("Erro", f"Detalhes do chamado #{chamado_id} não encontrados.")
         if callback_refresh: callback_refresh()
         return
 
-    for widget in conteudo_frame.winfo_children(): widget.destroy()
+    for widget in tela.winfo_children(): widget.destroy()
 
     status_raw = str(chamado.get("status", "Aberto"))
     MAPA_STATUS_VISUAL = {
@@ -63,7 +81,8 @@ def abrir_ticket_detalhe(chamado_id, user, conteudo_frame, callback_refresh=None
     def baixar_anexo(anexo_obj):
         nome = anexo_obj.get("nome", "arquivo_download")
         url = anexo_obj.get("url")
-        dados_b64 = anexo_obj.get("dados")
+        # Listas trazem só a referência (dados_adiados); o conteúdo vem sob demanda
+        tem_conteudo = anexo_obj.get("dados") or anexo_obj.get("dados_adiados")
 
         if url:
             if messagebox.askyesno("Baixar Anexo", f"O anexo é um link externo.\nDeseja abrir '{nome}' no navegador?"):
@@ -82,12 +101,15 @@ def abrir_ticket_detalhe(chamado_id, user, conteudo_frame, callback_refresh=None
         def worker():
             try:
                 if url:
-                    resp = requests.get(url, stream=True, timeout=30)
+                    resp = sessao_http.obter_sessao().get(url, stream=True, timeout=30)
                     resp.raise_for_status()
                     with open(filepath, 'wb') as f:
                         for chunk in resp.iter_content(chunk_size=8192): f.write(chunk)
-                elif dados_b64:
-                    bytes_dados = base64.b64decode(dados_b64)
+                elif tem_conteudo:
+                    sucesso, bytes_dados = api_client.carregar_anexo(id_real, anexo_obj)
+                    if not sucesso:
+                        messagebox.showerror("Erro ao Baixar", bytes_dados)
+                        return
                     with open(filepath, 'wb') as f: f.write(bytes_dados)
                 else:
                     messagebox.showerror("Erro", "Anexo sem conteúdo.")
@@ -97,10 +119,10 @@ def abrir_ticket_detalhe(chamado_id, user, conteudo_frame, callback_refresh=None
             except Exception as e:
                 messagebox.showerror("Erro ao Baixar", f"Falha: {e}")
         
-        threading.Thread(target=worker).start()
+        pool_tarefas.enviar(worker, prioridade=pool_tarefas.PRIORIDADE_NORMAL, obrigatoria=True)
 
     # === CABEÇALHO ===
-    header = ctk.CTkFrame(conteudo_frame, fg_color="transparent")
+    header = ctk.CTkFrame(tela, fg_color="transparent")
     header.pack(fill="x", padx=20, pady=(20, 10))
     ctk.CTkButton(header, text="← Voltar", width=80, fg_color="#5BA39C", command=lambda: callback_refresh() if callback_refresh else None).pack(side="left")
     id_real = chamado.get('id_chamado') or chamado_id
@@ -109,7 +131,7 @@ def abrir_ticket_detalhe(chamado_id, user, conteudo_frame, callback_refresh=None
     lbl_status_topo.pack(side="right")
 
     # === SCROLL PRINCIPAL ===
-    scroll = ctk.CTkScrollableFrame(conteudo_frame, fg_color="transparent")
+    scroll = ctk.CTkScrollableFrame(tela, fg_color="transparent")
     scroll.pack(fill="both", expand=True, padx=20, pady=(0, 20))
 
     grid = ctk.CTkFrame(scroll, fg_color="transparent")
@@ -154,7 +176,7 @@ def abrir_ticket_detalhe(chamado_id, user, conteudo_frame, callback_refresh=None
             
             nome_anexo = anexo.get("nome") or f"Arquivo_{idx+1}"
             url_anexo = anexo.get("url")
-            dados_b64 = anexo.get("dados")
+            dados_b64 = anexo.get("dados") or anexo.get("dados_adiados")
             
             ctk.CTkLabel(anexo_frame, text="📎", font=("Arial", 18)).pack(side="left", padx=10, pady=5)
             ctk.CTkLabel(anexo_frame, text=nome_anexo, font=("Helvetica", 13), text_color="#334155").pack(side="left", padx=5)
@@ -186,19 +208,18 @@ def abrir_ticket_detalhe(chamado_id, user, conteudo_frame, callback_refresh=None
     # Cache local para evitar múltiplas chamadas de lista de usuários
     users_cache = {} 
 
-    def obter_mapa_usuarios():
-        if not users_cache:
-            sucesso, lista = api_client.listar_usuarios()
-            if sucesso and lista:
-                for u in lista:
-                    uid = str(u.get("id") or u.get("id_usuario"))
-                    users_cache[uid] = u # Guarda o objeto usuario inteiro
+    def preencher_mapa_usuarios(resultado):
+        sucesso, lista = resultado
+        if sucesso and lista:
+            for u in lista:
+                uid = str(u.get("id") or u.get("id_usuario"))
+                users_cache[uid] = u # Guarda o objeto usuario inteiro
 
     def carregar_comentarios():
-        try: obter_mapa_usuarios()
-        except: pass
-        
-        sucesso, dados = api_client.listar_comentarios(id_real)
+        api_async.no_tk(chat_scroll, api_async.listar_comentarios(id_real), pintar_comentarios)
+
+    def pintar_comentarios(resultado):
+        sucesso, dados = resultado
         
         # Se a janela fechou durante o carregamento
         if not chat_scroll.winfo_exists(): return
@@ -206,10 +227,12 @@ def abrir_ticket_detalhe(chamado_id, user, conteudo_frame, callback_refresh=None
         # Limpa chat antigo
         for w in chat_scroll.winfo_children(): w.destroy()
         
-        if sucesso and dados:
-            dados.sort(key=lambda x: x.get("data_hora", ""), reverse=False)
+        # Comentários ainda na fila de envio aparecem no fim, marcados como pendentes
+        pendentes = api_client.comentarios_pendentes(id_real)
+        if sucesso and dados or pendentes:
+            dados = sorted(dados or [], key=lambda x: x.get("data_hora", "")) if sucesso else []
             ctk.CTkLabel(chat_scroll, text="", height=10).pack() # Espaçador topo
-            for c in dados: 
+            for c in dados + pendentes: 
                 criar_balao_comentario(c)
             
             # Rola para baixo
@@ -224,6 +247,7 @@ def abrir_ticket_detalhe(chamado_id, user, conteudo_frame, callback_refresh=None
         
         try: dt = datetime.fromisoformat(data_raw.replace("Z", "")); data_fmt = dt.strftime("%d/%m %H:%M")
         except: data_fmt = "Recentemente"
+        if comentario.get("pendente"): data_fmt = "⏳ Aguardando envio"
         
         meu_id = str(api_client.CURRENT_USER.get("id"))
         sou_eu = uid == meu_id
@@ -262,27 +286,24 @@ def abrir_ticket_detalhe(chamado_id, user, conteudo_frame, callback_refresh=None
         if not texto: return
         btn_enviar.configure(state="disabled", text="...")
         
-        def th():
-            sucesso, _ = api_client.enviar_comentario(id_real, texto)
-            if conteudo_frame.winfo_exists(): 
-                conteudo_frame.after(0, lambda: fim(sucesso))
-        
-        def fim(ok):
+        def fim(resultado):
+            ok = resultado[0]
             btn_enviar.configure(state="normal", text="➤")
             if ok: 
                 entry_chat.delete("1.0", "end")
                 # 🟢 RECARREGA OS COMENTÁRIOS IMEDIATAMENTE
-                threading.Thread(target=carregar_comentarios).start()
+                carregar_comentarios()
             else: 
                 messagebox.showerror("Erro", "Falha ao enviar.")
         
-        threading.Thread(target=th).start()
+        api_async.no_tk(btn_enviar, api_async.enviar_comentario(id_real, texto), fim)
 
     btn_enviar = ctk.CTkButton(input_container, text="➤", width=50, height=50, corner_radius=25, fg_color="#5BA39C", font=("Arial", 20), command=acao_enviar_comentario)
     btn_enviar.pack(side="right")
     
-    # Carrega comentários ao abrir
-    threading.Thread(target=carregar_comentarios).start()
+    # Comentários e usuários já vieram junto com o chamado
+    preencher_mapa_usuarios(pre_carregado["usuarios"])
+    pintar_comentarios(pre_carregado["comentarios"])
 
     # --- DIREITA ---
     right = ctk.CTkFrame(grid, fg_color="white", corner_radius=15)
@@ -314,7 +335,7 @@ def abrir_ticket_detalhe(chamado_id, user, conteudo_frame, callback_refresh=None
                 s_api = MAPA_STATUS_VISUAL.get(novo.lower(), novo)
                 suc, msg = api_client.atualizar_status_chamado(id_real, s_api)
                 right.after(0, lambda: fim_up(suc, msg, s_api))
-            threading.Thread(target=th).start()
+            pool_tarefas.enviar(th, prioridade=pool_tarefas.PRIORIDADE_NORMAL, obrigatoria=True)
         
         def fim_up(suc, msg, n):
             if suc: messagebox.showinfo("Sucesso", msg); lbl_status_topo.configure(text=f"Status: {n}"); abrir_ticket_detalhe(id_real, user, conteudo_frame, callback_refresh)
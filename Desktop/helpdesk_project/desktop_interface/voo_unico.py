@@ -0,0 +1,106 @@
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+# ----------------------------------------------------------------------
+# COALESCÊNCIA DE GETs IDÊNTICOS (SINGLE-FLIGHT) + MICRO-CACHE
+# ----------------------------------------------------------------------
+# Se duas telas pedem a mesma URL ao mesmo tempo, só a primeira vai à rede; as outras
+# esperam e recebem o mesmo resultado. O resultado ainda vale por TTL_SEGUNDOS, o
+# suficiente para absorver dashboard + lista + detalhe abertos no mesmo segundo.
+# Qualquer escrita chama invalidar(): depois dela ninguém recebe dado velho daqui. Para
+# isso invalidar() avança uma geração: um GET que já estava no ar durante a escrita entrega
+# o resultado a quem o esperava, mas não o guarda, e quem chega depois faz um GET novo.
+# Resultados vencidos saem a cada gravação.
+TTL_SEGUNDOS = 2.0
+
+
+class _Voo:
+    __slots__ = ("evento", "resultado", "erro")
+
+    def __init__(self):
+        self.evento = threading.Event()
+        self.resultado = None
+        self.erro: Optional[BaseException] = None
+
+
+_EM_VOO: Dict[str, _Voo] = {}
+_RECENTES: Dict[str, tuple] = {}
+_GERACAO = 0
+_LOCK = threading.Lock()
+_STATS = {"rede": 0, "compartilhadas": 0, "micro_cache": 0}
+
+
+def _guardar(chave: str, resultado: Any, ttl: float):
+    """Chamar com _LOCK. Grava no micro-cache e descarta o que já venceu."""
+    agora = time.monotonic()
+    for vencida in [c for c, (validade, _) in _RECENTES.items() if validade <= agora]: del _RECENTES[vencida]
+    _RECENTES[chave] = (agora + ttl, resultado)
+
+
+def geracao() -> int:
+    """Geração atual (muda a cada invalidar()); ver registrar()."""
+    return _GERACAO
+
+
+def executar(chave: str, func: Callable[[], Any], ttl: float = TTL_SEGUNDOS) -> Any:
+    """Executa func() uma única vez por chave entre chamadas simultâneas (e dentro do TTL)."""
+    with _LOCK:
+        geracao_inicio = _GERACAO
+        recente = _RECENTES.get(chave)
+        if recente is not None and recente[0] > time.monotonic():
+            _STATS["micro_cache"] += 1
+            return recente[1]
+        voo = _EM_VOO.get(chave)
+        lider = voo is None
+        if lider:
+            voo = _EM_VOO[chave] = _Voo()
+            _STATS["rede"] += 1
+        else:
+            _STATS["compartilhadas"] += 1
+
+    if not lider:
+        voo.evento.wait()
+        if voo.erro is not None: raise voo.erro
+        return voo.resultado
+
+    try:
+        voo.resultado = func()
+        return voo.resultado
+    except BaseException as e:
+        voo.erro = e
+        raise
+    finally:
+        with _LOCK:
+            if _EM_VOO.get(chave) is voo: del _EM_VOO[chave]
+            # Houve escrita durante o voo: o resultado pode ser anterior a ela
+            if voo.erro is None and ttl > 0 and _GERACAO == geracao_inicio:
+                _guardar(chave, voo.resultado, ttl)
+        voo.evento.set()
+
+
+def registrar(chave: str, resultado: Any, ttl: float = TTL_SEGUNDOS, geracao_inicio: Optional[int] = None):
+    """
+    Guarda um resultado obtido por fora de executar() (ex.: lista montada a partir de páginas).
+    geracao_inicio: geracao() de antes da requisição; se mudou, o resultado não é guardado.
+    """
+    with _LOCK:
+        if geracao_inicio is not None and geracao_inicio != _GERACAO: return
+        _guardar(chave, resultado, ttl)
+
+
+def invalidar():
+    """
+    Descarta o micro-cache (escritas, troca de usuário). Voos em andamento terminam para
+    quem já os esperava, mas não gravam nada nem recebem novos passageiros.
+    """
+    global _GERACAO
+    with _LOCK:
+        _GERACAO += 1
+        _RECENTES.clear()
+        _EM_VOO.clear()
+
+
+def estatisticas() -> Dict[str, int]:
+    with _LOCK:
+        return dict(_STATS, economizadas=_STATS["compartilhadas"] + _STATS["micro_cache"])
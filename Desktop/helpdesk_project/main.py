@@ -1,5 +1,9 @@
 import sys
 import os
+import time
+
+# Marco zero do perfil de inicialização (--profile-startup)
+INICIO = time.perf_counter()
 
 # Função para obter o caminho base correto (seja dev ou exe)
 def get_base_path():
@@ -12,6 +16,12 @@ base_path = get_base_path()
 if base_path not in sys.path:
     sys.path.append(base_path)
 
+# --profile-startup: cronometra cada import e o tempo até a janela de login aparecer
+PERFIL_INICIALIZACAO = "--profile-startup" in sys.argv
+if PERFIL_INICIALIZACAO:
+    from desktop_interface import perfil_inicializacao
+    perfil_inicializacao.iniciar(INICIO)
+
 # Tenta importar o app
 try:
     from desktop_interface.login import app
@@ -26,4 +36,6 @@ except ImportError as e:
     sys.exit(1)
 
 if __name__ == "__main__":
+    if PERFIL_INICIALIZACAO:
+        perfil_inicializacao.ao_primeira_janela(app)
     app.mainloop()
\ No newline at end of file